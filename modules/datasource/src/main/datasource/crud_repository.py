@@ -15,6 +15,7 @@
 from abc import abstractmethod
 from datasource.crud_entity import CrudEntity
 from datasource.identity import Identity
+from hspylib.core.filter_expression import FilterExpression
 from hspylib.core.metaclass.singleton import AbstractSingleton
 from hspylib.core.namespace import Namespace
 from typing import Generic, List, Optional, Set, TypeVar
@@ -69,14 +70,14 @@ class CrudRepository(Generic[E], metaclass=AbstractSingleton):
     def find_all(
         self,
         columns: Set[str] | None = None,
-        filters: Namespace | None = None,
+        filters: Namespace | FilterExpression | None = None,
         order_bys: Set[str] | None = None,
         limit: int = 500,
         offset: int = 0,
     ) -> List[E]:
         """Returns all entities of the type.
         :param columns: the column names to select.
-        :param filters: entry filters.
+        :param filters: entry filters: clauses to be ANDed, or a filter expression to be pushed down to the store.
         :param order_bys: result set order bys.
         :param limit: the maximum number of entries to be fetch.
         :param offset: skip offset entries before fetch.
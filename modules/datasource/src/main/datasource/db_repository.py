@@ -16,9 +16,11 @@ from abc import abstractmethod
 from datasource.crud_entity import CrudEntity
 from datasource.crud_repository import CrudRepository
 from datasource.db_configuration import DBConfiguration
+from hspylib.core.filter_expression import FilterExpression, SqlDialect
 from hspylib.core.metaclass.singleton import AbstractSingleton
+from hspylib.core.namespace import Namespace
 from retry import retry
-from typing import Any, Generic, Iterable, Optional, Tuple, TypeAlias, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeAlias, TypeVar
 
 import contextlib
 
@@ -96,3 +98,16 @@ class DBRepository(Generic[E, C], CrudRepository[E], metaclass=AbstractSingleton
     @abstractmethod
     def table_name(self) -> str:
         """Return the table name (repository name)."""
+
+    @staticmethod
+    def where_clauses(
+        filters: Optional[Namespace | FilterExpression], dialect: SqlDialect
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Return the WHERE clauses of the filters, to be ANDed, and the arguments filling their placeholders.
+        :param filters: SQL clauses, or a filter expression, translated into one parameterized clause.
+        :param dialect: the SQL dialect of the database.
+        """
+        if isinstance(filters, FilterExpression):
+            clause, params = filters.to_sql(dialect)
+            return [clause], {f"p{index}": param for index, param in enumerate(params)}
+        return (list(filter(None, filters.values)) if filters else []), {}
@@ -17,10 +17,11 @@ from abc import abstractmethod
 from datasource.crud_entity import CrudEntity
 from datasource.firebase.firebase_configuration import FirebaseConfiguration
 from datasource.identity import Identity
+from hspylib.core.enums.http_method import HttpMethod
 from hspylib.core.metaclass.singleton import AbstractSingleton
 from hspylib.core.namespace import Namespace
 from hspylib.core.preconditions import check_not_none
-from hspylib.modules.fetch.fetch import delete, get, put
+from hspylib.modules.fetch.fetch import delete, fetch_many, FetchSpec, get, put
 from hspylib.modules.fetch.http_response import HttpResponse
 from requests.exceptions import HTTPError
 from typing import Any, Generic, List, Optional, TypeVar
@@ -109,34 +110,38 @@ class FirebaseRepository(Generic[E], metaclass=AbstractSingleton):
         """Deletes the entity with the given id.
         :param entity_id: the ID of the entity to be deleted.
         """
-        ids = ".".join(entity_id.values)
-        url = f"{self._config.url(self.table_name())}/{ids}.json"
+        url = self._entity_url(entity_id)
         log.debug("Deleting firebase entry: \n\t|-Id=%s\n\t|-From %s", entity_id, url)
         self._assert_response(delete(url), f"Unable to delete from={url}")
 
     def delete_all(self, entities: List[E]) -> None:
-        """Deletes all given entities.
-        TODO Check if there is a better way of doing it.
+        """Deletes all given entities. The requests are done concurrently.
         :param entities: the entities to be deleted.
         """
-        list(map(self.delete, entities))
+        specs = [FetchSpec(HttpMethod.DELETE, self._entity_url(e.identity)) for e in entities]
+        log.debug("Deleting %d firebase entries", len(specs))
+        for result in fetch_many(specs):
+            self._assert_response(result.get(), f"Unable to delete from={result.spec.url}")
 
     def save(self, entity: E) -> None:
         """Saves a given entity.
         :param entity: the entity to save.
         """
-        ids = ".".join(entity.identity.values)
-        url = f"{self._config.url(self.table_name())}/{ids}.json"
+        url = self._entity_url(entity.identity)
         payload = entity.as_json()
         log.debug("Saving firebase entry: \n\t|-%s \n\t|-Into %s", entity, url)
         self._assert_response(put(url, payload), f"Unable to put into={url} with json_string={payload}")
 
     def save_all(self, entities: List[E]) -> None:
-        """Saves all given entities.
-        TODO Check if there is a better way of doing it.
+        """Saves all given entities. The requests are done concurrently.
         :param entities: the entities to be saved.
         """
-        list(map(self.save, entities))
+        specs = [FetchSpec(HttpMethod.PUT, self._entity_url(e.identity), body=e.as_json()) for e in entities]
+        log.debug("Saving %d firebase entries", len(specs))
+        for result in fetch_many(specs):
+            self._assert_response(
+                result.get(), f"Unable to put into={result.spec.url} with json_string={result.spec.body}"
+            )
 
     def find_all(
         self,
@@ -175,8 +180,7 @@ class FirebaseRepository(Generic[E], metaclass=AbstractSingleton):
 
     def find_by_id(self, entity_id: Identity) -> Optional[E]:
         """Return the entity specified by ID from the Firebase store, None if no such entry is found."""
-        ids = ".".join(entity_id.values)
-        url = f"{self._config.url(self.table_name())}/{ids}.json"
+        url = self._entity_url(entity_id)
         log.debug("Fetching firebase entry: \n\t|-Id=%s\n\t|-From %s", entity_id, url)
         response = self._assert_response(get(url), f"Unable to get from={url}")
         if response.body and response.body != "null":
@@ -191,6 +195,13 @@ class FirebaseRepository(Generic[E], metaclass=AbstractSingleton):
         """
         return self.find_by_id(entity_id) is not None
 
+    def _entity_url(self, entity_id: Identity) -> str:
+        """Return the firebase url of the entity specified by ID.
+        :param entity_id: the entity ID.
+        """
+        ids = ".".join(entity_id.values)
+        return f"{self._config.url(self.table_name())}/{ids}.json"
+
     @abstractmethod
     def to_entity_type(self, entity_dict: dict | tuple) -> E:
         """Convert a dict or tuple, generally from a result set, into the CRUD entity.
@@ -18,6 +18,7 @@ from datasource.db_configuration import DBConfiguration
 from datasource.db_repository import Connection, Cursor, DBRepository, ResultSet, Session
 from datasource.exception.exceptions import DatabaseConnectionError, DatabaseError
 from datasource.identity import Identity
+from hspylib.core.filter_expression import FilterExpression, SqlDialect
 from hspylib.core.metaclass.singleton import AbstractSingleton
 from hspylib.core.namespace import Namespace
 from hspylib.core.tools.text_tools import quote
@@ -121,13 +122,13 @@ class SQLiteRepository(Generic[E, C], DBRepository[E, C], metaclass=AbstractSing
     def find_all(
         self,
         columns: Optional[Set[str]] = None,
-        filters: Optional[Namespace] = None,
+        filters: Optional[Namespace | FilterExpression] = None,
         order_bys: Optional[List[str]] = None,
         limit: int = 500,
         offset: int = 0,
     ) -> List[E]:
         columns = "*" if not columns else ", ".join(columns)
-        clauses = list(filter(None, filters.values)) if filters else None
+        clauses, args = self.where_clauses(filters, SqlDialect.SQLITE)
         orders = list(filter(None, order_bys)) if order_bys else None
         sql = (
             f"SELECT {columns} FROM {self.table_name()} "
@@ -136,7 +137,7 @@ class SQLiteRepository(Generic[E, C], DBRepository[E, C], metaclass=AbstractSing
             f"LIMIT {limit} OFFSET {offset}"
         )
 
-        return list(map(self.to_entity_type, self.execute(sql)[1]))
+        return list(map(self.to_entity_type, self.execute(sql, **args)[1]))
 
     def find_by_id(self, entity_id: Identity, columns: Optional[Set[str]] = None) -> Optional[E]:
         columns = "*" if not columns else ", ".join(columns)
@@ -15,6 +15,8 @@
 
 from datasource.db_configuration import DBConfiguration
 from datasource.identity import Identity
+from hspylib.core.collection_filter import FilterCondition
+from hspylib.core.filter_expression import Term
 from hspylib.core.namespace import Namespace
 from hspylib.core.tools.commons import log_init
 from hspylib.core.tools.text_tools import quote
@@ -132,6 +134,25 @@ class TestClass(unittest.TestCase):
         self.assertEqual(expected_list[2], result_set[2])
         self.assertEqual(expected_list[3], result_set[3])
 
+    # Test selecting from sqlite using a filter expression
+    def test_should_select_using_filter_expressions_from_sqlite(self) -> None:
+        test_entity_1 = EntityTest(Identity.auto(), comment="My-Test Data-1", lucky_number=50, is_working=True)
+        test_entity_2 = EntityTest(Identity.auto(), comment="My-Work Data-2", lucky_number=40, is_working=False)
+        test_entity_3 = EntityTest(Identity.auto(), comment="My-Sets Data-3", lucky_number=30, is_working=True)
+        test_entity_4 = EntityTest(Identity.auto(), comment="My-Fest Data-4", lucky_number=20, is_working=False)
+        self.repository.save_all([test_entity_1, test_entity_2, test_entity_3, test_entity_4])
+        expression = Term("comment", FilterCondition.CONTAINS, "est") | (
+            Term("lucky_number", FilterCondition.GREATER_THAN, 25)
+            & ~Term("comment", FilterCondition.CONTAINS, "'; DROP TABLE ENTITY_TEST; --")
+        )
+        result_set = self.repository.find_all(filters=expression, order_bys=["lucky_number"])
+        expected_list = [test_entity_4, test_entity_3, test_entity_2, test_entity_1]
+        self.assertEqual(expected_list, result_set)
+        expression = Term("lucky_number", FilterCondition.LESS_THAN, 45)
+        expression &= ~Term("comment", FilterCondition.CONTAINS, "Set")
+        result_set = self.repository.find_all(filters=expression, order_bys=["lucky_number"])
+        self.assertEqual([test_entity_4, test_entity_2], result_set)
+
 
 # Program entry point.
 if __name__ == "__main__":
@@ -32,11 +32,13 @@ class FileProcessor(ABC):
     """Utility class to upload / download B64-encoded files."""
 
     @staticmethod
-    def upload_files(url: str, file_paths: List[AnyPath], glob_exp: str) -> int:
+    def upload_files(url: str, file_paths: List[AnyPath], glob_exp: str, compress: bool = False) -> int:
         """Upload files to URL.
         :param url: the URL to upload the files.
         :param file_paths: the file paths to be uploaded. File paths will be filtered by glob expressions.
         :param glob_exp: the GLOB expressions to filter the input files/folders.
+        :param compress: whether to send the payload gzip compressed. Off by default, as the Firebase REST API is not
+        known to accept compressed request bodies.
         """
         data = []
         file_paths = list(map(os.path.expanduser, map(os.path.expandvars, file_paths)))
@@ -62,7 +64,7 @@ class FileProcessor(ABC):
                 syserr(f'Input file "{f_path}" does not exist!')
         if data:
             payload = FileProcessor._create_request(data)
-            response = put(url, payload)
+            response = put(url, payload, compress=compress)
             check_not_none(response)
             if response.status_code != HttpCode.OK:
                 raise HTTPError(f"{response.status_code} - Unable to upload into={url} with json_string={payload}")
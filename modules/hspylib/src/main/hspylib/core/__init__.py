@@ -12,10 +12,12 @@ __all__ = [
     'decorator', 
     'enums', 
     'exception', 
+    'filter_expression', 
     'metaclass', 
     'namespace', 
     'object_mapper', 
     'preconditions', 
+    'record_batch', 
     'tools', 
     'zoned_datetime'
 ]
@@ -12,15 +12,51 @@
 
    Copyright·(c)·2024,·HSPyLib
 """
+from collections import deque
 from hspylib.core.enums.enumeration import Enumeration
 from hspylib.core.preconditions import check_argument
+from hspylib.core.record_batch import attributes_of, is_array, np, RecordBatch, take
 from hspylib.core.tools.text_tools import quote
-from typing import get_args, Iterable, Iterator, Set, Tuple, TypeAlias, TypeVar, Union
+from itertools import compress, count, repeat
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    get_args,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeAlias,
+    TypeVar,
+    Union,
+)
+
+import operator
 
 T = TypeVar("T")
 
 FilterValue: TypeAlias = Union[int, str, bool, float]
 
+# A compiled filter: whether the element passes it.
+Predicate: TypeAlias = Callable[[Any], bool]
+
+# Columns to be filtered: a RecordBatch, or a mapping of attribute names to their values (lists or NumPy arrays).
+Columns: TypeAlias = Union[RecordBatch, Mapping[str, Sequence[Any]]]
+
+# Exceptions meaning that the element can't be compared against the filter, so it does not pass it.
+_MISMATCH_ERRORS = (NameError, TypeError, AttributeError)
+
+
+def _not_contains(param_value: Any, value: Any) -> bool:
+    return value not in param_value
+
 
 class FilterCondition(Enumeration):
     """Collection filter conditions."""
@@ -44,31 +80,90 @@ class FilterCondition(Enumeration):
     def __repr__(self) -> str:
         return str(self)
 
+    @property
+    def operator(self) -> Callable[[Any, Any], bool]:
+        """The function comparing a param against a filter value. Containment checks whether the filter value is in
+        the param."""
+        return _OPERATORS[self.name]
+
     def matches(self, param_value: FilterValue, value: FilterValue) -> bool:
         """Whether this filter value matches the specified param."""
-        operator = self.value[0]
-        if self.name in ["CONTAINS", "DOES_NOT_CONTAIN"]:
-            expression = f"{quote(value)} {operator} {quote(param_value)}"
-        else:
-            expression = f"{quote(param_value)} {operator} {quote(value)}"
-        return self._allow_type(value) and eval(expression)  # pylint: disable=eval-used
+        return self.allows(value) and self.operator(param_value, value)
 
-    def _allow_type(self, value: FilterValue) -> bool:
+    def allows(self, value: FilterValue) -> bool:
         """Whether this filter condition allows the specified value type."""
         try:
             return isinstance(value, self.value[1])
         except TypeError:
             return isinstance(value, get_args(self.value[1]))
 
+    @property
+    def cost(self) -> float:
+        """The relative cost of matching a param against this condition."""
+        return _ESTIMATES[self.name][0]
+
+    @property
+    def selectivity(self) -> float:
+        """The estimated fraction of the params matching this condition."""
+        return _ESTIMATES[self.name][1]
+
+
+# fmt: off
+_OPERATORS = {
+    FilterCondition.LESS_THAN.name                  : operator.lt,
+    FilterCondition.LESS_THAN_OR_EQUALS_TO.name     : operator.le,
+    FilterCondition.GREATER_THAN.name               : operator.gt,
+    FilterCondition.GREATER_THAN_OR_EQUALS_TO.name  : operator.ge,
+    FilterCondition.EQUALS_TO.name                  : operator.eq,
+    FilterCondition.DIFFERENT_FROM.name             : operator.ne,
+    FilterCondition.CONTAINS.name                   : operator.contains,
+    FilterCondition.DOES_NOT_CONTAIN.name           : _not_contains,
+    FilterCondition.IS.name                         : operator.eq,
+    FilterCondition.IS_NOT.name                     : operator.ne,
+}
+
+# Relative cost and estimated selectivity of each condition: equality is cheap and selective, substrings are not.
+_ESTIMATES = {
+    FilterCondition.LESS_THAN.name                  : (1.2, 0.33),
+    FilterCondition.LESS_THAN_OR_EQUALS_TO.name     : (1.2, 0.33),
+    FilterCondition.GREATER_THAN.name               : (1.2, 0.33),
+    FilterCondition.GREATER_THAN_OR_EQUALS_TO.name  : (1.2, 0.33),
+    FilterCondition.EQUALS_TO.name                  : (1.0, 0.10),
+    FilterCondition.DIFFERENT_FROM.name             : (1.0, 0.90),
+    FilterCondition.CONTAINS.name                   : (3.0, 0.25),
+    FilterCondition.DOES_NOT_CONTAIN.name           : (3.0, 0.75),
+    FilterCondition.IS.name                         : (1.0, 0.50),
+    FilterCondition.IS_NOT.name                     : (1.0, 0.50),
+}
+# fmt: on
+
+
+def predicate_rank(cost: float, selectivity: float) -> float:
+    """The order in which to evaluate a conjunction of predicates: ascending rank minimizes the expected cost, for
+    independent predicates, since each one only runs for the elements passing the previous ones."""
+    return cost / (1.0 - selectivity) if selectivity < 1.0 else float("inf")
+
+
+def collect(data: Iterable[T], predicate: Predicate, passing: bool = True) -> Iterable[T]:
+    """Collect the elements of data for which the predicate is passing, into a collection of the same type."""
+    filtered = data.__class__()
+    if add := getattr(filtered, "append", None) or getattr(filtered, "add", None):
+        for element in data:
+            if bool(predicate(element)) is passing:
+                add(element)
+    return filtered
+
 
 class ElementFilter:
-    """Represent a single filter condition."""
+    """Represent a single filter condition. The condition is compiled into a predicate on the element attributes the
+    first time it is matched, and again only if the filter changes."""
 
     def __init__(self, name: str, el_name: str, condition: FilterCondition, el_value: FilterValue):
         self.name = name
         self.el_name = el_name
         self.condition = condition
         self.el_value = el_value
+        self._compiled: Optional[Tuple[tuple, Predicate]] = None
 
     def __str__(self):
         return f"{quote(self.el_name)} {self.condition} {quote(self.el_value)}"
@@ -87,20 +182,78 @@ class ElementFilter:
             return self.key() == other.key()
         return NotImplemented
 
+    @property
+    def rank(self) -> float:
+        """The evaluation order of this filter among the others (see predicate_rank)."""
+        if not self.condition.allows(self.el_value):
+            return 0.0
+        return predicate_rank(self.condition.cost, self.condition.selectivity)
+
     def matches(self, element: T) -> bool:
         """Whether this filter is True for the given element."""
 
         try:
-            entry = None
-            if isinstance(element, dict):
-                entry = element
-            elif hasattr(element, "__dict__"):
-                entry = element.__dict__
-            elif isinstance(element, tuple):
-                entry = dict(element)
-            return self.el_name in entry and self.condition.matches(entry[self.el_name], self.el_value)
-        except (NameError, TypeError, AttributeError):
+            entry = attributes_of(element)
+        except _MISMATCH_ERRORS:
             return False
+        return entry is not None and self.compile()(entry)
+
+    def compile(self) -> Predicate:
+        """Return the predicate telling whether the element attributes (a mapping) pass this filter."""
+        # The value type is part of the key, since True == 1, but only True is allowed by IS.
+        key = *self.key(), type(self.el_value)
+        if self._compiled is None or self._compiled[0] != key:
+            self._compiled = key, self._compile()
+        return self._compiled[1]
+
+    def _compile(self) -> Predicate:
+        name, value, compare = self.el_name, self.el_value, self.condition.operator
+        if not self.condition.allows(value):
+            return lambda entry: False
+
+        def _predicate(entry: Mapping[str, Any]) -> bool:
+            try:
+                return name in entry and compare(entry[name], value)
+            except _MISMATCH_ERRORS:
+                return False
+
+        return _predicate
+
+    def evaluate(self, values: Sequence[Any]) -> Sequence[bool]:
+        """Evaluate this filter over all values of its attribute (a column), at once.
+        :return: Whether each value passes the filter; as a NumPy array, if values is one and its type allows.
+        """
+        value, compare = self.el_value, self.condition.operator
+        if not self.condition.allows(value):
+            return [False] * len(values)
+        if is_array(values):
+            if (hits := self._evaluate_array(values)) is not None:
+                return hits
+            values = values.tolist()
+        try:
+            return list(map(bool, map(compare, values, repeat(value))))
+        except _MISMATCH_ERRORS:
+            # Some values can't be compared: only those ones fail the filter.
+            return [self._passes(v) for v in values]
+
+    def _passes(self, param_value: Any) -> bool:
+        try:
+            return bool(self.condition.operator(param_value, self.el_value))
+        except _MISMATCH_ERRORS:
+            return False
+
+    def _evaluate_array(self, values: Any) -> Optional[Any]:
+        """Evaluate this filter with NumPy, when the array type matches the filter value type; None otherwise."""
+        value, kind = self.el_value, values.dtype.kind
+        numeric, text = kind in "biuf" and not isinstance(value, str), kind == "U" and isinstance(value, str)
+        if self.condition in (FilterCondition.CONTAINS, FilterCondition.DOES_NOT_CONTAIN):
+            if not text:
+                return None
+            found = np.char.find(values, value) >= 0
+            return found if self.condition == FilterCondition.CONTAINS else ~found
+        if numeric or text:
+            return np.asarray(self.condition.operator(values, value), dtype=bool)
+        return None
 
 
 class CollectionFilter:
@@ -108,6 +261,7 @@ class CollectionFilter:
 
     def __init__(self) -> None:
         self._filters: Set[ElementFilter] = set()
+        self._predicate: Optional[Predicate] = None
 
     def __str__(self) -> str:
         if len(self._filters) > 0:
@@ -131,38 +285,245 @@ class CollectionFilter:
         check_argument(not any(f.name == name for f in self._filters), f"Filter {name} already exists!")
         f = ElementFilter(name, el_name, condition, el_value)
         self._filters.add(f)
+        self._predicate = None
 
     def clear(self) -> None:
         """Clear all filters."""
         self._filters.clear()
+        self._predicate = None
 
     def discard(self, name: str):
         """Discard the specified filter."""
-        element = next((e for e in self._filters if e.name == name), None)
+        element = self.get(name)
         self._filters.discard(element)
+        self._predicate = None
+
+    def get(self, name: str) -> Optional[ElementFilter]:
+        """Return the filter of the specified name, if applied."""
+        return next((e for e in self._filters if e.name == name), None)
+
+    def compile(self) -> Predicate:
+        """Return the predicate telling whether an element passes all filters. The filters are compiled once, until
+        they change, and the predicate extracts the element attributes once, then stops at the first filter the
+        element does not pass. Filters are matched by rank: cheap and selective ones first."""
+        if self._predicate is None:
+            self._predicate = self._compile()
+        return self._predicate
 
     def filter(self, data: Iterable[T]) -> Iterable[T]:
         """Filter the collection."""
-        filtered: Iterable[T] = data.__class__()
-        for element in data:
-            if not self.should_filter(element):
-                if hasattr(filtered, "append"):
-                    filtered.append(element)
-                elif hasattr(filtered, "add"):
-                    filtered.add(element)
-        return filtered
+        return collect(data, self.compile())
 
     def filter_inverse(self, data: Iterable[T]) -> Iterable[T]:
         """Inverse filter the collection."""
-        filtered: Iterable[T] = data.__class__()
-        for element in data:
-            if self.should_filter(element):
-                if hasattr(filtered, "append"):
-                    filtered.append(element)
-                elif hasattr(filtered, "add"):
-                    filtered.add(element)
-        return filtered
+        return collect(data, self.compile(), False)
 
     def should_filter(self, data: T) -> bool:
         """Whether the specified data should be filtered, according to this filter collection."""
-        return not all(f.matches(data) for f in self._filters)
+        return not self.compile()(data)
+
+    def indexes(self, data: Columns, inverse: bool = False) -> List[int]:
+        """Return the indexes of the records passing all filters (or not passing them, if inverse), evaluating each
+        filter over its whole column at once. Each filter only evaluates the records that passed the previous ones.
+        :param data: The records, as columns.
+        :param inverse: Whether to return the indexes of the filtered out records instead.
+        """
+        batch = data if isinstance(data, RecordBatch) else RecordBatch(data)
+        selected = self._select(batch)
+        if inverse:
+            passing = set(selected)
+            return [index for index in range(len(batch)) if index not in passing]
+        return selected
+
+    def mask(self, data: Columns) -> List[bool]:
+        """Return whether each one of the records passes all filters (see indexes)."""
+        batch = data if isinstance(data, RecordBatch) else RecordBatch(data)
+        mask = [False] * len(batch)
+        for index in self._select(batch):
+            mask[index] = True
+        return mask
+
+    def select(self, data: Columns, inverse: bool = False) -> RecordBatch:
+        """Return the records passing all filters (or not passing them, if inverse), as columns (see indexes)."""
+        batch = data if isinstance(data, RecordBatch) else RecordBatch(data)
+        return batch.take(self.indexes(batch, inverse))
+
+    def _compile(self) -> Predicate:
+        predicates = tuple(f.compile() for f in self._ranked())
+        if not predicates:
+            return lambda element: True
+
+        def _predicate(element: Any) -> bool:
+            try:
+                if (entry := attributes_of(element)) is None:
+                    return False
+            except _MISMATCH_ERRORS:
+                return False
+            for predicate in predicates:
+                if not predicate(entry):
+                    return False
+            return True
+
+        return _predicate
+
+    def _select(self, batch: RecordBatch) -> List[int]:
+        """Return the indexes of the records of the batch passing all filters."""
+        selected: Sequence[int] = range(len(batch))
+        for f in self._ranked():
+            if not selected:
+                break
+            if f.el_name not in batch:
+                return []
+            column = batch.column(f.el_name)
+            hits = f.evaluate(column if len(selected) == len(batch) else take(column, selected))
+            if is_array(hits):
+                selected = [selected[position] for position in np.flatnonzero(hits).tolist()]
+            else:
+                selected = list(compress(selected, hits))
+        return list(selected)
+
+    def _ranked(self) -> List[ElementFilter]:
+        """Return the filters in evaluation order."""
+        return sorted(self._filters, key=lambda f: f.rank)
+
+
+class FilteredView(Generic[T]):
+    """The elements of a growing source passing a collection of filters, kept up to date incrementally:
+      - appended elements are matched on their own, against all filters;
+      - applying a filter only matches the elements passing the previous filters, against the new one;
+      - discarding a filter only matches the elements it rejected, against the remaining filters.
+    So each element records the filter that rejected it. The source is retained, up to max_size elements (the
+    oldest ones are dropped), to widen the view. Filters must be changed through the view, not its CollectionFilter.
+    """
+
+    def __init__(
+        self, filters: Optional[CollectionFilter] = None, source: Iterable[T] = (), max_size: Optional[int] = None
+    ) -> None:
+        check_argument(max_size is None or max_size > 0, "Max size must be positive: {}", max_size)
+        self._filters = CollectionFilter() if filters is None else filters
+        self._max_size = max_size
+        self._sequence = count()
+        self._source: Deque[Tuple[int, T]] = deque()
+        self._passing: Dict[int, T] = {}
+        self._rejected: Dict[int, ElementFilter] = {}
+        self._rows: Optional[List[T]] = None
+        self._evaluated = 0
+        self.extend(source)
+
+    def __str__(self) -> str:
+        return f"FilteredView(passing={len(self._passing)}, source={len(self._source)}, filters={self._filters})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._passing.values())
+
+    def __len__(self) -> int:
+        return len(self._passing)
+
+    def __getitem__(self, index: int) -> T:
+        if self._rows is None:
+            self._rows = list(self._passing.values())
+        return self._rows[index]
+
+    @property
+    def filters(self) -> CollectionFilter:
+        return self._filters
+
+    @property
+    def source_size(self) -> int:
+        return len(self._source)
+
+    @property
+    def evaluated(self) -> int:
+        """The number of times an element was matched against a filter."""
+        return self._evaluated
+
+    def append(self, element: T) -> bool:
+        """Append the element to the source.
+        :return: Whether it passes the filters.
+        """
+        seq = next(self._sequence)
+        self._source.append((seq, element))
+        if (rejecting := self._reject(element, self._filters)) is None:
+            self._passing[seq] = element
+            if self._rows is not None:
+                self._rows.append(element)
+        else:
+            self._rejected[seq] = rejecting
+        if self._max_size is not None and len(self._source) > self._max_size:
+            self._evict()
+        return rejecting is None
+
+    def extend(self, elements: Iterable[T]) -> int:
+        """Append the elements to the source.
+        :return: How many of them pass the filters.
+        """
+        return sum(self.append(element) for element in elements)
+
+    def apply_filter(self, name: str, el_name: str, condition: FilterCondition, el_value: FilterValue) -> None:
+        """Apply the filter, narrowing the view: only the passing elements are matched against it."""
+        self._filters.apply_filter(name, el_name, condition, el_value)
+        if (added := self._filters.get(name)) is None:
+            return  # The same condition is already applied, under another name.
+        rejected = [seq for seq, element in self._passing.items() if self._reject(element, (added,))]
+        for seq in rejected:
+            del self._passing[seq]
+            self._rejected[seq] = added
+        if rejected:
+            self._rows = None
+
+    def discard(self, name: str) -> None:
+        """Discard the filter, widening the view: only the elements it rejected are matched against the others."""
+        if (discarded := self._filters.get(name)) is None:
+            return
+        self._filters.discard(name)
+        widened = False
+        for seq, element in self._source:
+            if self._rejected.get(seq) is not discarded:
+                continue
+            if (rejecting := self._reject(element, self._filters)) is None:
+                del self._rejected[seq]
+                widened = True
+            else:
+                self._rejected[seq] = rejecting
+        if widened:
+            self._passing = {seq: element for seq, element in self._source if seq not in self._rejected}
+            self._rows = None
+
+    def clear_filters(self) -> None:
+        """Discard all filters: every element of the source passes."""
+        self._filters.clear()
+        self._rejected.clear()
+        self._passing = dict(self._source)
+        self._rows = None
+
+    def clear(self) -> None:
+        """Remove all elements, keeping the filters."""
+        self._source.clear()
+        self._passing.clear()
+        self._rejected.clear()
+        self._rows = None
+
+    def _reject(self, element: T, filters: Iterable[ElementFilter]) -> Optional[ElementFilter]:
+        """Return the first filter the element does not pass, if any."""
+        try:
+            entry = attributes_of(element)
+        except _MISMATCH_ERRORS:
+            entry = None
+        for f in filters:
+            self._evaluated += 1
+            if entry is None or not f.compile()(entry):
+                return f
+        return None
+
+    def _evict(self) -> None:
+        """Drop the oldest element of the source."""
+        seq, _ = self._source.popleft()
+        if seq in self._passing:
+            del self._passing[seq]
+            if self._rows is not None:
+                del self._rows[0]
+        else:
+            del self._rejected[seq]
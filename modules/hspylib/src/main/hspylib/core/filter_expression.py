@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: hspylib
+   @package: hspylib.core
+      @file: filter_expression.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from abc import ABC, abstractmethod
+from hspylib.core.collection_filter import (
+    collect,
+    Columns,
+    ElementFilter,
+    FilterCondition,
+    FilterValue,
+    Predicate,
+    predicate_rank,
+)
+from hspylib.core.enums.enumeration import Enumeration
+from hspylib.core.preconditions import check_argument
+from hspylib.core.record_batch import attributes_of, is_array, np, RecordBatch, take
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+import re
+
+T = TypeVar("T")
+
+# Column names accepted by the SQL translation: an identifier, optionally qualified by a table name.
+_COLUMN_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?")
+
+# fmt: off
+_SQL_OPERATORS = {
+    FilterCondition.LESS_THAN.name                  : "<",
+    FilterCondition.LESS_THAN_OR_EQUALS_TO.name     : "<=",
+    FilterCondition.GREATER_THAN.name               : ">",
+    FilterCondition.GREATER_THAN_OR_EQUALS_TO.name  : ">=",
+    FilterCondition.EQUALS_TO.name                  : "=",
+    FilterCondition.DIFFERENT_FROM.name             : "<>",
+    FilterCondition.IS.name                         : "=",
+    FilterCondition.IS_NOT.name                     : "<>",
+}
+# fmt: on
+
+# SQL conditions that are always true or always false.
+_SQL_TRUE, _SQL_FALSE = "1 = 1", "1 = 0"
+
+
+class SqlDialect(Enumeration):
+    """SQL dialects the filter expressions can be translated to: the parameter placeholder, and the condition telling
+    whether a column contains a substring (case sensitive or not, according to the column collation)."""
+
+    # fmt: off
+    SQLITE      = '?',  'instr({column}, {param}) > 0'
+    MYSQL       = '%s', 'LOCATE({param}, {column}) > 0'
+    POSTGRES    = '%s', 'strpos({column}, {param}) > 0'
+    # fmt: on
+
+    @property
+    def placeholder(self) -> str:
+        return self.value[0]
+
+    def contains(self, column: str) -> str:
+        """Return the condition telling whether the column contains the parameter."""
+        return self.value[1].format(column=column, param=self.placeholder)
+
+
+class FilterExpression(ABC):
+    """A boolean expression of filter conditions: Terms combined with AND (&), OR (|) and NOT (~), grouped as the
+    operators are (& binds tighter than |), or explicitly through AllOf, AnyOf and Not. Expressions are immutable;
+    they are compiled once into a predicate that extracts the element attributes once, and evaluates each operand
+    only until the result is known. A missing attribute fails every Term mentioning it (so its negation passes);
+    elements without attributes pass no expression.
+
+    Operands are evaluated in the given order; FilterPlanner.plan returns the same expression in the order expected
+    to be the cheapest. to_sql translates the expression into a parameterized SQL WHERE clause."""
+
+    def __init__(self) -> None:
+        self._predicate: Optional[Predicate] = None
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __eq__(self, other: "FilterExpression") -> bool:
+        if isinstance(other, FilterExpression):
+            return self.key() == other.key()
+        return NotImplemented
+
+    def __and__(self, other: "FilterExpression") -> "AllOf":
+        return AllOf(self, other)
+
+    def __or__(self, other: "FilterExpression") -> "AnyOf":
+        return AnyOf(self, other)
+
+    def __invert__(self) -> "Not":
+        return Not(self)
+
+    @abstractmethod
+    def key(self) -> tuple:
+        """Return the key identifying this expression: equal keys, equal expressions."""
+
+    @property
+    def operands(self) -> Tuple["FilterExpression", ...]:
+        return ()
+
+    def terms(self) -> Iterator["Term"]:
+        """Yield the Terms of this expression, in evaluation order."""
+        for operand in self.operands:
+            yield from operand.terms()
+
+    def compile(self) -> Predicate:
+        """Return the predicate telling whether an element passes this expression."""
+        if self._predicate is None:
+            test = self._compile()
+
+            def _predicate(element: Any) -> bool:
+                try:
+                    entry = attributes_of(element)
+                except (NameError, TypeError, AttributeError):
+                    return False
+                return entry is not None and bool(test(entry))
+
+            self._predicate = _predicate
+        return self._predicate
+
+    def matches(self, element: Any) -> bool:
+        """Whether the element passes this expression."""
+        return self.compile()(element)
+
+    def filter(self, data: Iterable[T]) -> Iterable[T]:
+        """Filter the collection."""
+        return collect(data, self.compile())
+
+    def filter_inverse(self, data: Iterable[T]) -> Iterable[T]:
+        """Inverse filter the collection."""
+        return collect(data, self.compile(), False)
+
+    def should_filter(self, data: T) -> bool:
+        """Whether the specified data should be filtered, according to this expression."""
+        return not self.compile()(data)
+
+    def indexes(self, data: Columns, inverse: bool = False) -> List[int]:
+        """Return the indexes of the records passing this expression (or not passing it, if inverse), evaluating each
+        Term over its whole column at once: AND narrows the records each operand evaluates, OR only evaluates the
+        records not passing the previous operands (see CollectionFilter.indexes).
+        :param data: The records, as columns.
+        :param inverse: Whether to return the indexes of the filtered out records instead.
+        """
+        batch = data if isinstance(data, RecordBatch) else RecordBatch(data)
+        selected = self._select(batch, range(len(batch)))
+        if inverse:
+            passing = set(selected)
+            return [index for index in range(len(batch)) if index not in passing]
+        return list(selected)
+
+    def select(self, data: Columns, inverse: bool = False) -> RecordBatch:
+        """Return the records passing this expression (or not passing it, if inverse), as columns (see indexes)."""
+        batch = data if isinstance(data, RecordBatch) else RecordBatch(data)
+        return batch.take(self.indexes(batch, inverse))
+
+    def to_sql(self, dialect: SqlDialect = SqlDialect.SQLITE) -> Tuple[str, List[FilterValue]]:
+        """Translate this expression into a SQL WHERE clause (without the WHERE keyword), with one placeholder per
+        Term value; attribute names become column names, and must be plain identifiers. NULL columns are taken as
+        missing attributes: they fail the Terms mentioning them, whose negations pass, so the clause selects the
+        same records as the expression. Values are compared the database way, though: following its type
+        conversions and the column collation.
+        :param dialect: The SQL dialect to translate to.
+        :return: The clause, and its parameters in placeholder order.
+        """
+        params: List[FilterValue] = []
+        return self._sql(dialect, params, False), params
+
+    @abstractmethod
+    def _compile(self) -> Predicate:
+        """Return the predicate telling whether the element attributes (a mapping) pass this expression."""
+
+    @abstractmethod
+    def _select(self, batch: RecordBatch, selected: Sequence[int]) -> Sequence[int]:
+        """Return the indexes, among the selected ones (ascending), of the records of the batch passing this
+        expression."""
+
+    @abstractmethod
+    def _sql(self, dialect: SqlDialect, params: List[FilterValue], negated: bool) -> str:
+        """Return the SQL condition of this expression, appending its parameters. Negated tells whether the
+        condition is under a NOT."""
+
+
+class Term(FilterExpression):
+    """A single filter condition on one attribute of the elements."""
+
+    @classmethod
+    def of(cls, element_filter: ElementFilter) -> "Term":
+        """Return the Term of the condition of an ElementFilter."""
+        return cls(element_filter.el_name, element_filter.condition, element_filter.el_value)
+
+    def __init__(self, el_name: str, condition: FilterCondition, el_value: FilterValue) -> None:
+        super().__init__()
+        self._filter = ElementFilter(el_name, el_name, condition, el_value)
+
+    def __str__(self) -> str:
+        return str(self._filter)
+
+    def key(self) -> tuple:
+        # The value type is part of the key, since True == 1, but only True is allowed by IS.
+        return *self._filter.key(), type(self.el_value)
+
+    @property
+    def el_name(self) -> str:
+        return self._filter.el_name
+
+    @property
+    def condition(self) -> FilterCondition:
+        return self._filter.condition
+
+    @property
+    def el_value(self) -> FilterValue:
+        return self._filter.el_value
+
+    def terms(self) -> Iterator["Term"]:
+        yield self
+
+    def _compile(self) -> Predicate:
+        return self._filter.compile()
+
+    def _select(self, batch: RecordBatch, selected: Sequence[int]) -> Sequence[int]:
+        if not selected or self.el_name not in batch:
+            return []
+        column = batch.column(self.el_name)
+        hits = self._filter.evaluate(column if len(selected) == len(batch) else take(column, selected))
+        if is_array(hits):
+            return [selected[position] for position in np.flatnonzero(hits).tolist()]
+        return list(compress(selected, hits))
+
+    def _sql(self, dialect: SqlDialect, params: List[FilterValue], negated: bool) -> str:
+        column, condition = self.el_name, self.condition
+        check_argument(_COLUMN_NAME.fullmatch(column) is not None, "Not a valid SQL column name: {}", column)
+        if not condition.allows(self.el_value):
+            return _SQL_FALSE
+        params.append(self.el_value)
+        if condition == FilterCondition.CONTAINS:
+            sql = dialect.contains(column)
+        elif condition == FilterCondition.DOES_NOT_CONTAIN:
+            sql = f"NOT ({dialect.contains(column)})"
+        else:
+            sql = f"{column} {_SQL_OPERATORS[condition.name]} {dialect.placeholder}"
+        # Under a NOT, a comparison with NULL (unknown) must be false, as a missing attribute fails the Term.
+        return f"({column} IS NOT NULL AND {sql})" if negated else sql
+
+
+class AllOf(FilterExpression):
+    """The expression passing when all of its operands pass (AND). Passes when there are none."""
+
+    def __init__(self, *operands: FilterExpression) -> None:
+        super().__init__()
+        self._operands = operands
+
+    def __str__(self) -> str:
+        return f"({' AND '.join(map(str, self._operands))})"
+
+    def key(self) -> tuple:
+        return "AND", *(operand.key() for operand in self._operands)
+
+    @property
+    def operands(self) -> Tuple[FilterExpression, ...]:
+        return self._operands
+
+    def _compile(self) -> Predicate:
+        predicates = tuple(operand._compile() for operand in self._operands)
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def _predicate(entry: Mapping[str, Any]) -> bool:
+            for predicate in predicates:
+                if not predicate(entry):
+                    return False
+            return True
+
+        return _predicate
+
+    def _select(self, batch: RecordBatch, selected: Sequence[int]) -> Sequence[int]:
+        for operand in self._operands:
+            if not selected:
+                break
+            selected = operand._select(batch, selected)
+        return selected
+
+    def _sql(self, dialect: SqlDialect, params: List[FilterValue], negated: bool) -> str:
+        if not self._operands:
+            return _SQL_TRUE
+        return _group([operand._sql(dialect, params, negated) for operand in self._operands], "AND")
+
+
+class AnyOf(FilterExpression):
+    """The expression passing when any of its operands pass (OR). Fails when there are none."""
+
+    def __init__(self, *operands: FilterExpression) -> None:
+        super().__init__()
+        self._operands = operands
+
+    def __str__(self) -> str:
+        return f"({' OR '.join(map(str, self._operands))})"
+
+    def key(self) -> tuple:
+        return "OR", *(operand.key() for operand in self._operands)
+
+    @property
+    def operands(self) -> Tuple[FilterExpression, ...]:
+        return self._operands
+
+    def _compile(self) -> Predicate:
+        predicates = tuple(operand._compile() for operand in self._operands)
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def _predicate(entry: Mapping[str, Any]) -> bool:
+            for predicate in predicates:
+                if predicate(entry):
+                    return True
+            return False
+
+        return _predicate
+
+    def _select(self, batch: RecordBatch, selected: Sequence[int]) -> Sequence[int]:
+        passing, remaining = set(), selected
+        for operand in self._operands:
+            if not remaining:
+                break
+            hits = set(operand._select(batch, remaining))
+            passing |= hits
+            remaining = [index for index in remaining if index not in hits]
+        return [index for index in selected if index in passing]
+
+    def _sql(self, dialect: SqlDialect, params: List[FilterValue], negated: bool) -> str:
+        if not self._operands:
+            return _SQL_FALSE
+        return _group([operand._sql(dialect, params, negated) for operand in self._operands], "OR")
+
+
+class Not(FilterExpression):
+    """The expression passing when its operand does not pass (NOT)."""
+
+    def __init__(self, operand: FilterExpression) -> None:
+        super().__init__()
+        self._operand = operand
+
+    def __str__(self) -> str:
+        return f"NOT {self._operand}"
+
+    def key(self) -> tuple:
+        return "NOT", self._operand.key()
+
+    @property
+    def operands(self) -> Tuple[FilterExpression, ...]:
+        return (self._operand,)
+
+    def _compile(self) -> Predicate:
+        predicate = self._operand._compile()
+        return lambda entry: not predicate(entry)
+
+    def _select(self, batch: RecordBatch, selected: Sequence[int]) -> Sequence[int]:
+        hits = set(self._operand._select(batch, selected))
+        return [index for index in selected if index not in hits]
+
+    def _sql(self, dialect: SqlDialect, params: List[FilterValue], negated: bool) -> str:
+        sql = self._operand._sql(dialect, params, not negated)
+        return f"NOT {sql}" if sql.startswith("(") else f"NOT ({sql})"
+
+
+def _group(conditions: List[str], keyword: str) -> str:
+    """Join the SQL conditions with the keyword, in parentheses."""
+    return conditions[0] if len(conditions) == 1 else f"({f' {keyword} '.join(conditions)})"
+
+
+def expression_of(filters: Iterable[ElementFilter]) -> FilterExpression:
+    """Return the expression passing the elements that pass all filters, like a CollectionFilter of them."""
+    return AllOf(*map(Term.of, filters))
+
+
+class FilterPlanner:
+    """Rewrite filter expressions so that evaluating them is expected to be the cheapest, keeping their results:
+    nested ANDs (ORs) are flattened, duplicate operands and double negations are dropped, and the operands are
+    ordered by rank (see predicate_rank). AND runs the cheap and selective operands first, so the elements they
+    reject skip the others; OR runs the cheap and broad ones first, so the elements they pass skip the others.
+
+    The cost of each Term comes from its condition (FilterCondition.cost). Its selectivity is estimated from the
+    condition as well (FilterCondition.selectivity), or, given a sample of the elements to filter, measured on it.
+    Terms are taken as independent."""
+
+    def __init__(self, sample: Optional[Iterable[Any]] = None) -> None:
+        """
+        :param sample: Elements like the ones to filter, to measure the selectivity of the Terms on.
+        """
+        self._sample: Optional[List[Any]] = None if sample is None else list(sample)
+        self._selectivities: Dict[tuple, float] = {}
+
+    def __str__(self) -> str:
+        return f"FilterPlanner(sample={'none' if self._sample is None else len(self._sample)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def plan(self, expression: FilterExpression) -> FilterExpression:
+        """Return the expression rewritten in evaluation order."""
+        if isinstance(expression, Not):
+            operand = expression.operands[0]
+            if isinstance(operand, Not):
+                return self.plan(operand.operands[0])
+            return Not(self.plan(operand))
+        if isinstance(expression, (AllOf, AnyOf)):
+            node = type(expression)
+            operands = list(dict.fromkeys(self._flatten(node, expression)))
+            if len(operands) == 1:
+                return operands[0]
+            if node is AllOf:
+                operands.sort(key=lambda operand: predicate_rank(*self.estimate(operand)))
+            else:
+                operands.sort(key=lambda operand: predicate_rank(*self._complement(self.estimate(operand))))
+            return node(*operands)
+        return expression
+
+    def estimate(self, expression: FilterExpression) -> Tuple[float, float]:
+        """Return the expected cost of evaluating the expression, as written, and its selectivity."""
+        if isinstance(expression, Term):
+            return self._estimate(expression)
+        if isinstance(expression, Not):
+            return self._complement(self.estimate(expression.operands[0]))
+        cost, reached = 0.0, 1.0
+        conjunction = isinstance(expression, AllOf)
+        for operand in expression.operands:
+            operand_cost, selectivity = self.estimate(operand)
+            cost += reached * operand_cost
+            reached *= selectivity if conjunction else 1.0 - selectivity
+        return cost, reached if conjunction else 1.0 - reached
+
+    def explain(self, expression: FilterExpression) -> str:
+        """Return the expression tree, one node per line, with the estimated cost and selectivity of each node."""
+        return "\n".join(self._explain(expression, 0))
+
+    def _explain(self, expression: FilterExpression, depth: int) -> Iterator[str]:
+        cost, selectivity = self.estimate(expression)
+        label = {AllOf: "AND", AnyOf: "OR", Not: "NOT"}.get(type(expression), str(expression))
+        yield f"{'  ' * depth}{label} (cost={cost:.2f}, selectivity={selectivity:.2f})"
+        for operand in expression.operands:
+            yield from self._explain(operand, depth + 1)
+
+    def _estimate(self, term: Term) -> Tuple[float, float]:
+        """Return the cost and selectivity of the Term."""
+        if not term.condition.allows(term.el_value):
+            return 0.0, 0.0
+        if self._sample is None:
+            return term.condition.cost, term.condition.selectivity
+        if (selectivity := self._selectivities.get(term.key())) is None:
+            # Laplace smoothing: a small sample can't tell that no (or every) element passes.
+            hits = sum(1 for element in self._sample if term.matches(element))
+            selectivity = self._selectivities[term.key()] = (hits + 1) / (len(self._sample) + 2)
+        return term.condition.cost, selectivity
+
+    def _flatten(self, node: type, expression: FilterExpression) -> Iterator[FilterExpression]:
+        """Yield the planned operands of the expression, lifting the operands of the nested nodes of the same type."""
+        for operand in expression.operands:
+            planned = self.plan(operand)
+            if isinstance(planned, node):
+                yield from planned.operands
+            else:
+                yield planned
+
+    @staticmethod
+    def _complement(estimate: Tuple[float, float]) -> Tuple[float, float]:
+        return estimate[0], 1.0 - estimate[1]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: hspylib
+   @package: hspylib.core
+      @file: record_batch.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.preconditions import check_argument
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _Missing:
+    """The value of the columns an element has no attribute for. Like a missing attribute, it matches no filter: it
+    is neither equal nor different from anything, and can't be ordered nor searched."""
+
+    __slots__ = ()
+
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __eq__(self, other: Any) -> bool:
+        return False
+
+    def __ne__(self, other: Any) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def attributes_of(element: Any) -> Optional[Mapping[str, Any]]:
+    """Return the attributes of the element: itself if it is a dict, its __dict__, or the dict of its (name, value)
+    pairs if it is a tuple. Other elements have none."""
+    if isinstance(element, dict):
+        return element
+    if hasattr(element, "__dict__"):
+        return element.__dict__
+    if isinstance(element, tuple):
+        return dict(element)
+    return None
+
+
+def is_array(column: Sequence[Any]) -> bool:
+    """Whether the column is a NumPy array."""
+    return np is not None and isinstance(column, np.ndarray)
+
+
+def take(values: Sequence[Any], indexes: Sequence[int]) -> Sequence[Any]:
+    """Return the values at the indexes, in that order; as an array, if values is one."""
+    if is_array(values):
+        return values[np.asarray(indexes, dtype=np.intp)]
+    if len(indexes) == 1:
+        return [values[indexes[0]]]
+    return list(itemgetter(*indexes)(values)) if indexes else []
+
+
+class RecordBatch:
+    """A table of uniform records held as columns: one sequence of values (a list, or a NumPy array) per attribute,
+    all of the same length. Build it once from the records (from_records), or wrap existing columns, then filter it
+    column by column (see CollectionFilter.indexes). Records lacking an attribute have MISSING in its column."""
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any], columns: Optional[Iterable[str]] = None) -> "RecordBatch":
+        """Build the columns of the records: dicts, objects, or tuples of (name, value) pairs.
+        :param records: The records.
+        :param columns: The attributes to keep; by default, all attributes of all records.
+        """
+        entries = []
+        for record in records:
+            try:
+                entries.append(attributes_of(record) or {})
+            except TypeError:
+                entries.append({})
+        if columns is None:
+            columns = dict.fromkeys(name for entry in entries for name in entry)
+        return cls({name: [entry.get(name, MISSING) for entry in entries] for name in columns}, len(entries))
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]], length: Optional[int] = None) -> None:
+        """
+        :param columns: The values of each attribute, by attribute name.
+        :param length: The number of records; required when there are no columns.
+        """
+        lengths = {len(values) for values in columns.values()}
+        check_argument(len(lengths) <= 1, "All columns must have the same length: {}", sorted(lengths))
+        check_argument(
+            length is None or not lengths or lengths == {length}, "Columns do not have {} records", length
+        )
+        self._columns: Dict[str, Sequence[Any]] = dict(columns)
+        self._length = lengths.pop() if lengths else length or 0
+
+    def __str__(self) -> str:
+        return f"RecordBatch(records={self._length}, columns={list(self._columns)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Return the values of the attribute."""
+        return self._columns[name]
+
+    def take(self, indexes: Sequence[int]) -> "RecordBatch":
+        """Return a batch with the records at the indexes, in that order."""
+        return RecordBatch({name: take(values, indexes) for name, values in self._columns.items()}, len(indexes))
+
+    def rows(self, indexes: Optional[Iterable[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the records (at the indexes, if given) as dicts, without their missing attributes."""
+        columns = [(name, values.tolist() if is_array(values) else values) for name, values in self._columns.items()]
+        for index in range(self._length) if indexes is None else indexes:
+            yield {name: value for name, values in columns if (value := values[index]) is not MISSING}
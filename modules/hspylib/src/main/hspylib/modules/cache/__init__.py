@@ -6,6 +6,10 @@
 """Package initialization."""
 
 __all__ = [
+    'cached', 
+    'disk_cache', 
+    'memory_cache', 
+    'tiered_cache', 
     'ttl_cache', 
     'ttl_keyring_be'
 ]
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.cache
+      @file: cached.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from concurrent.futures import Future
+from functools import update_wrapper
+from hspylib.core.preconditions import check_argument
+from hspylib.modules.cache.memory_cache import MemoryCache
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import asyncio
+import inspect
+
+CACHE_KEY_FN = Callable[..., Hashable]
+
+# Sentinel telling a missing entry apart from a cached None.
+_MISSING = object()
+
+# Separates the positional from the keyword arguments of a cache key.
+_KWD_MARK = object()
+
+
+def _make_key(args: Tuple, kwargs: Dict[str, Any]) -> Hashable:
+    """Create the default cache key out of the call arguments."""
+    if not kwargs:
+        return args[0] if len(args) == 1 and type(args[0]) in (str, int) else args
+    return args + (_KWD_MARK,) + tuple(sorted(kwargs.items()))
+
+
+class _CallCache:
+    """The entries of one cached function, or of one instance of a cached method, along with the computations
+    in flight."""
+
+    def __init__(self, ttl: Optional[float], maxsize: int) -> None:
+        stripes = 1 if maxsize < 64 else MemoryCache.DEFAULT_STRIPES
+        self.entries: MemoryCache = MemoryCache(maxsize, 0, 0, stripes=stripes)
+        self.ttl = float("inf") if ttl is None else ttl
+        self.lock = Lock()
+        self.in_flight: Dict[Hashable, Future | asyncio.Future] = {}
+
+
+class CachedFunction:
+    """A function, method or coroutine function whose results are cached. Concurrent calls missing the same key
+    share a single computation (single-flight). Method results are cached per instance, and the instance is only
+    weakly referenced, so it is not kept alive by the cache."""
+
+    def __init__(self, func: Callable, ttl: Optional[float], maxsize: int, key: Optional[CACHE_KEY_FN]) -> None:
+        check_argument(maxsize > 0, "Max size must be positive: {}", maxsize)
+        check_argument(ttl is None or ttl >= 0, "TTL can't be negative: {}", ttl)
+        update_wrapper(self, func)
+        self._func = func
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._key = key
+        self._is_async = inspect.iscoroutinefunction(func)
+        self._cache = _CallCache(ttl, maxsize)
+        self._instances: WeakKeyDictionary = WeakKeyDictionary()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def __str__(self) -> str:
+        return f"CachedFunction(func={self._func.__qualname__}, ttl={self._ttl}, maxsize={self._maxsize})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        return _BoundCachedMethod(self, instance)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._invoke(self._cache, args, args, kwargs)
+
+    def invalidate(self, *args, **kwargs) -> bool:
+        """Remove the cached result of the call with the specified arguments.
+        :return: whether a result was cached.
+        """
+        return self._cache.entries.delete(self._cache_key(args, args, kwargs))
+
+    def clear(self) -> None:
+        """Remove all cached results, including the ones of every instance, when it is a method."""
+        self._cache.entries.clear()
+        with self._lock:
+            caches = list(self._instances.values())
+        for cache in caches:
+            cache.entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit/miss counters. Shared are the misses served by a computation already in flight."""
+        with self._lock:
+            size = len(self._cache.entries) + sum(len(c.entries) for c in self._instances.values())
+            return {"hits": self.hits, "misses": self.misses, "shared": self.shared, "size": size}
+
+    def call_bound(self, instance: Any, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        """Return the cached result of the method call on the instance."""
+        return self._invoke(self._instance_cache(instance), (instance, *args), args, kwargs)
+
+    def invalidate_bound(self, instance: Any, args: Tuple, kwargs: Dict[str, Any]) -> bool:
+        """Remove the cached result of the method call on the instance.
+        :return: whether a result was cached.
+        """
+        return self._instance_cache(instance).entries.delete(self._cache_key((instance, *args), args, kwargs))
+
+    def clear_bound(self, instance: Any) -> None:
+        """Remove all cached method results of the instance."""
+        self._instance_cache(instance).entries.clear()
+
+    def _instance_cache(self, instance: Any) -> _CallCache:
+        """Return the cache of the method results of the instance."""
+        with self._lock:
+            if (cache := self._instances.get(instance)) is None:
+                cache = _CallCache(self._ttl, self._maxsize)
+                self._instances[instance] = cache
+            return cache
+
+    def _cache_key(self, call_args: Tuple, key_args: Tuple, kwargs: Dict[str, Any]) -> Hashable:
+        """Return the cache key of a call. Custom key functions receive all call arguments (including self)."""
+        return self._key(*call_args, **kwargs) if self._key else _make_key(key_args, kwargs)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _invoke(self, cache: _CallCache, call_args: Tuple, key_args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        """Return the cached result of the call, computing it if needed."""
+        key = self._cache_key(call_args, key_args, kwargs)
+        if self._is_async:
+            return self._ainvoke(cache, key, call_args, kwargs)
+        if (value := cache.entries.get(key, _MISSING)) is not _MISSING:
+            self._count("hits")
+            return value
+        with cache.lock:
+            # The computation in flight may have completed since the cache was looked up.
+            if (value := cache.entries.get(key, _MISSING)) is not _MISSING:
+                owner, future = False, None
+            elif (future := cache.in_flight.get(key)) is None:
+                future = cache.in_flight[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if future is None:
+            self._count("hits")
+            return value
+        if not owner:
+            self._count("shared")
+            return future.result()
+        self._count("misses")
+        try:
+            value = self._func(*call_args, **kwargs)
+            cache.entries.set(key, value, cache.ttl)
+            future.set_result(value)
+            return value
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with cache.lock:
+                cache.in_flight.pop(key, None)
+
+    async def _ainvoke(self, cache: _CallCache, key: Hashable, call_args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        """Return the cached result of the coroutine call, awaiting it if needed."""
+        if (value := cache.entries.get(key, _MISSING)) is not _MISSING:
+            self._count("hits")
+            return value
+        flight_key = asyncio.get_running_loop(), key
+        with cache.lock:
+            if (task := cache.in_flight.get(flight_key)) is None:
+                task = cache.in_flight[flight_key] = asyncio.ensure_future(self._func(*call_args, **kwargs))
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            self._count("shared")
+            return await asyncio.shield(task)
+        self._count("misses")
+        try:
+            value = await asyncio.shield(task)
+            cache.entries.set(key, value, cache.ttl)
+            return value
+        finally:
+            with cache.lock:
+                cache.in_flight.pop(flight_key, None)
+
+
+class _BoundCachedMethod:
+    """A cached method bound to one instance."""
+
+    def __init__(self, method: CachedFunction, instance: Any) -> None:
+        self._method = method
+        self._instance = instance
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._method.call_bound(self._instance, args, kwargs)
+
+    def invalidate(self, *args, **kwargs) -> bool:
+        """Remove the cached result of the call with the specified arguments, for this instance only.
+        :return: whether a result was cached.
+        """
+        return self._method.invalidate_bound(self._instance, args, kwargs)
+
+    def clear(self) -> None:
+        """Remove all cached results of this instance."""
+        self._method.clear_bound(self._instance)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit/miss counters of the method (all instances)."""
+        return self._method.stats()
+
+
+def cached(
+    ttl: Optional[float] | Callable = 300, maxsize: int = 128, key: Optional[CACHE_KEY_FN] = None
+) -> CachedFunction | Callable[[Callable], CachedFunction]:
+    """Cache the results of the decorated function, method or coroutine function. May be used bare (@cached), or
+    with arguments.
+    :param ttl: how many seconds a result is cached. None means it never expires.
+    :param maxsize: the maximum number of results cached; the least recently used ones are evicted.
+    :param key: function creating the cache key out of the call arguments. Defaults to the arguments themselves.
+    """
+    if callable(ttl):
+        return CachedFunction(ttl, 300, maxsize, key)
+
+    def _decorator(func: Callable) -> CachedFunction:
+        return CachedFunction(func, ttl, maxsize, key)
+
+    return _decorator
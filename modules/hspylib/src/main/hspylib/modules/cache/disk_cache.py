@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.cache
+      @file: disk_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from abc import ABC, abstractmethod
+from hspylib.core.preconditions import check_argument, check_state
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Generic, Iterable, Optional, Tuple, TypeVar
+
+import logging as log
+import os
+import pickle
+import sqlite3
+import time
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+T = TypeVar("T")
+
+
+class Serializer(ABC):
+    """Convert the cache entries to and from bytes."""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize the value."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserialize the value."""
+
+
+class PickleSerializer(Serializer):
+    """Serialize any picklable value. Only read caches written by trusted processes."""
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """Serialize plain values (None, bool, numbers, str, bytes, lists and dicts) using msgpack. It is compact and
+    safe to load, but requires the msgpack package."""
+
+    def __init__(self) -> None:
+        check_state(msgpack is not None, "The msgpack serializer requires the 'msgpack' package")
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+class DiskCache(Generic[T]):
+    """Persistent cache with per entry time-to-live, kept in a single indexed SQLite file. Entries are serialized
+    to binary, expired entries are compacted in the background, and the file is memory mapped, so large values are
+    read without extra copies. The cache may be shared by several threads."""
+
+    # Default seconds between background compactions.
+    COMPACT_INTERVAL: float = 60.0
+
+    # Default bytes of the store file that are memory mapped.
+    MMAP_SIZE: int = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        ttl_minutes: int = 15,
+        ttl_seconds: int = 0,
+        serializer: Serializer | None = None,
+        compact_interval: float = COMPACT_INTERVAL,
+        mmap_size: int = MMAP_SIZE,
+    ) -> None:
+        check_argument(compact_interval >= 0, "Compact interval can't be negative: {}", compact_interval)
+        self._path = path
+        self._ttl = ttl_minutes * 60 + ttl_seconds
+        self._serializer = serializer or PickleSerializer()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)")
+        self._stop = Event()
+        self._compactor: Optional[Thread] = None
+        if compact_interval > 0:
+            self._compactor = Thread(
+                target=self._compact_forever, args=(compact_interval,), name="disk-cache-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    def __str__(self) -> str:
+        return f"DiskCache(path={self._path}, ttl={self._ttl}s)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries WHERE expires > ?", (time.time(),)).fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM entries WHERE key = ? AND expires > ?", (key, time.time()))
+            return row.fetchone() is not None
+
+    def __enter__(self) -> "DiskCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def ttl(self) -> float:
+        """Return the default time-to-live of the entries, in seconds."""
+        return self._ttl
+
+    def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """Return the entry identified by key, or the default if it does not exist or has expired."""
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[T, float]]:
+        """Return the entry identified by key along with its expiry timestamp, or None if it does not exist or has
+        expired."""
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            if row[1] <= time.time():
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._misses += 1
+                self._expirations += 1
+                return None
+            self._hits += 1
+        return self._serializer.loads(row[0]), row[1]
+
+    def set(self, key: str, value: T, ttl: Optional[float] = None) -> None:
+        """Store the entry identified by key.
+        :param key: the entry key.
+        :param value: the entry value.
+        :param ttl: the entry time-to-live, in seconds. Defaults to the cache time-to-live.
+        """
+        data = self._serializer.dumps(value)
+        expires = time.time() + (self._ttl if ttl is None else ttl)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)", (key, data, expires)
+            )
+
+    def set_many(self, entries: Iterable[Tuple[str, T, float]]) -> int:
+        """Store several entries in a single transaction.
+        :param entries: the (key, value, expiry timestamp) of each entry.
+        :return: the number of entries stored.
+        """
+        rows = [(key, self._serializer.dumps(value), expires) for key, value, expires in entries]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def delete(self, key: str) -> bool:
+        """Delete the entry identified by key.
+        :return: whether the entry existed.
+        """
+        with self._lock:
+            return self._conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+        self.compact()
+
+    def purge_expired(self) -> int:
+        """Delete all the expired entries.
+        :return: the number of entries deleted.
+        """
+        with self._lock:
+            purged = self._conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),)).rowcount
+            self._expirations += purged
+        return purged
+
+    def compact(self) -> int:
+        """Delete the expired entries and give their space back to the file system.
+        :return: the number of entries deleted.
+        """
+        purged = self.purge_expired()
+        with self._lock:
+            self._conn.execute("PRAGMA incremental_vacuum")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        log.debug("Disk cache %s compacted: %d expired entries removed", self._path, purged)
+        return purged
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache counters."""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {
+                "size": size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "expirations": self._expirations,
+                "file_size": os.path.getsize(self._path) if os.path.exists(self._path) else 0,
+            }
+
+    def close(self) -> None:
+        """Stop the background compaction and close the store file."""
+        self._stop.set()
+        if self._compactor:
+            self._compactor.join()
+        with self._lock:
+            self._conn.close()
+
+    def _compact_forever(self, interval: float) -> None:
+        """Compact the store every interval seconds, until the cache is closed."""
+        while not self._stop.wait(interval):
+            try:
+                self.compact()
+            except sqlite3.Error as err:
+                log.warning("Unable to compact disk cache %s => %s", self._path, err)
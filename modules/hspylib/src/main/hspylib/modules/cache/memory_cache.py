@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.cache
+      @file: memory_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from collections import OrderedDict
+from hspylib.core.preconditions import check_argument
+from itertools import count
+from threading import Lock
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+import time
+
+T = TypeVar("T")
+
+ENTRY_EXPIRED_CB = Callable[[Hashable, Any], Any]
+
+# Sentinel telling a missing entry apart from a cached None.
+_MISSING = object()
+
+
+class _Stripe:
+    """One independently locked partition of the cache, holding its own LRU order. Each entry records the tick of its
+    last use, which orders the entries of distinct stripes."""
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.entries: OrderedDict[Hashable, Tuple[Any, float, int]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+class MemoryCache(Generic[T]):
+    """Thread-safe in-memory cache with per entry time-to-live and least recently used (LRU) eviction. Get and set
+    are O(1), apart from evictions, which look at the least recently used entry of every stripe. Keys are spread over
+    independently locked stripes, so concurrent callers rarely contend; max_size applies to the whole cache, and the
+    evicted entry is the least recently used of all stripes, however the keys are spread."""
+
+    # Default number of independently locked stripes.
+    DEFAULT_STRIPES: int = 16
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_minutes: int = 15,
+        ttl_seconds: int = 0,
+        stripes: int = DEFAULT_STRIPES,
+        cb_expired: ENTRY_EXPIRED_CB = None,
+    ) -> None:
+        check_argument(max_size > 0, "Max size must be positive: {}", max_size)
+        check_argument(stripes > 0, "Stripes must be positive: {}", stripes)
+        self._ttl = ttl_minutes * 60 + ttl_seconds
+        self._max_size = max_size
+        self._cb_expired = cb_expired
+        self._stripes: List[_Stripe] = [_Stripe() for _ in range(min(stripes, max_size))]
+        self._ticks = count()
+        self._size_lock = Lock()
+        self._size = 0
+
+    def __str__(self) -> str:
+        return f"MemoryCache(size={len(self)}/{self._max_size}, ttl={self._ttl}s, stripes={len(self._stripes)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    @property
+    def ttl(self) -> float:
+        """Return the default time-to-live of the entries, in seconds."""
+        return self._ttl
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, key: Hashable, default: Optional[T] = None) -> Optional[T]:
+        """Return the entry identified by key, or the default if it does not exist or has expired."""
+        stripe = self._stripe(key)
+        expired = _MISSING
+        with stripe.lock:
+            if (item := stripe.entries.get(key, _MISSING)) is _MISSING:
+                stripe.misses += 1
+                return default
+            value, expires, _ = item
+            if expires > time.monotonic():
+                stripe.entries[key] = value, expires, next(self._ticks)
+                stripe.entries.move_to_end(key)
+                stripe.hits += 1
+                return value
+            del stripe.entries[key]
+            stripe.misses += 1
+            stripe.expirations += 1
+            expired = value
+        self._resize(-1)
+        if self._cb_expired:
+            self._cb_expired(key, expired)
+        return default
+
+    def set(self, key: Hashable, value: T, ttl: Optional[float] = None) -> None:
+        """Store the entry identified by key, evicting the least recently used one if the cache is full.
+        :param key: the entry key.
+        :param value: the entry value.
+        :param ttl: the entry time-to-live, in seconds. Defaults to the cache time-to-live.
+        """
+        expires = time.monotonic() + (self._ttl if ttl is None else ttl)
+        stripe = self._stripe(key)
+        with stripe.lock:
+            added = key not in stripe.entries
+            stripe.entries[key] = value, expires, next(self._ticks)
+            stripe.entries.move_to_end(key)
+        if added and self._resize(1) > self._max_size:
+            self._evict()
+
+    def delete(self, key: Hashable) -> bool:
+        """Delete the entry identified by key.
+        :return: whether the entry existed.
+        """
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if stripe.entries.pop(key, _MISSING) is _MISSING:
+                return False
+        self._resize(-1)
+        return True
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        for stripe in self._stripes:
+            with stripe.lock:
+                cleared = len(stripe.entries)
+                stripe.entries.clear()
+            self._resize(-cleared)
+
+    def purge_expired(self) -> int:
+        """Delete all the expired entries.
+        :return: the number of entries deleted.
+        """
+        now, purged = time.monotonic(), []
+        for stripe in self._stripes:
+            with stripe.lock:
+                expired = [(k, v) for k, (v, expires, _) in stripe.entries.items() if expires <= now]
+                for key, _ in expired:
+                    del stripe.entries[key]
+                stripe.expirations += len(expired)
+            self._resize(-len(expired))
+            purged.extend(expired)
+        if self._cb_expired:
+            for key, value in purged:
+                self._cb_expired(key, value)
+        return len(purged)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache counters, summed over all stripes."""
+        counters = {"size": 0, "hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        for stripe in self._stripes:
+            with stripe.lock:
+                counters["size"] += len(stripe.entries)
+                counters["hits"] += stripe.hits
+                counters["misses"] += stripe.misses
+                counters["evictions"] += stripe.evictions
+                counters["expirations"] += stripe.expirations
+        return counters
+
+    def _stripe(self, key: Hashable) -> _Stripe:
+        """Return the stripe holding the key."""
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _resize(self, delta: int) -> int:
+        """Add delta to the number of entries of the cache.
+        :return: the new number of entries.
+        """
+        with self._size_lock:
+            self._size += delta
+            return self._size
+
+    def _evict(self) -> None:
+        """Delete the least recently used entry of all stripes. Stripes are locked one at a time, so the entry evicted
+        is the oldest one found when its stripe was looked at."""
+        while True:
+            oldest, oldest_tick = None, 0
+            for stripe in self._stripes:
+                with stripe.lock:
+                    if not stripe.entries:
+                        continue
+                    _, _, tick = next(iter(stripe.entries.values()))
+                if oldest is None or tick < oldest_tick:
+                    oldest, oldest_tick = stripe, tick
+            if oldest is None:
+                return
+            with oldest.lock:
+                if not oldest.entries:
+                    continue
+                oldest.entries.popitem(last=False)
+                oldest.evictions += 1
+            self._resize(-1)
+            return
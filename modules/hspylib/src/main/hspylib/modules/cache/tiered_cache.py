@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.cache
+      @file: tiered_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.preconditions import check_argument, check_state
+from hspylib.modules.cache.disk_cache import DiskCache, Serializer
+from hspylib.modules.cache.memory_cache import MemoryCache
+from threading import Condition, Thread
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
+
+import atexit
+import logging as log
+import time
+
+T = TypeVar("T")
+
+# Marks a pending write that deletes the entry.
+_DELETED = object()
+
+# Sentinel telling a missing entry apart from a cached None.
+_MISSING = object()
+
+
+class TieredCache(Generic[T]):
+    """Two tier cache with per entry time-to-live: a small in-memory LRU tier (L1) in front of a larger disk tier
+    (L2). Entries read from L2 are promoted to L1. Entries saved are put in L1 right away, and written behind to L2
+    by a background thread, so callers never wait for the disk. Pending writes of the same key are coalesced, and
+    each batch of writes is stored in a single transaction."""
+
+    # Default number of entries kept in memory.
+    L1_SIZE: int = 256
+
+    def __init__(
+        self,
+        path: str,
+        ttl_minutes: int = 15,
+        ttl_seconds: int = 0,
+        l1_size: int = L1_SIZE,
+        serializer: Serializer | None = None,
+        compact_interval: float = DiskCache.COMPACT_INTERVAL,
+    ) -> None:
+        check_argument(l1_size > 0, "L1 size must be positive: {}", l1_size)
+        self._ttl = ttl_minutes * 60 + ttl_seconds
+        self._l1: MemoryCache[T] = MemoryCache(l1_size, ttl_minutes, ttl_seconds)
+        self._l2: DiskCache[T] = DiskCache(path, ttl_minutes, ttl_seconds, serializer, compact_interval)
+        self._cond = Condition()
+        # Writes not yet stored in L2: key -> (value or _DELETED, expiry timestamp).
+        self._pending: Dict[str, Tuple[Any, float]] = {}
+        # The batch being stored in L2 right now. Still looked up, until it is committed.
+        self._writing: Dict[str, Tuple[Any, float]] = {}
+        self._written = 0
+        self._batches = 0
+        self._errors = 0
+        self._closed = False
+        self._writer = Thread(target=self._write_behind, name="tiered-cache-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def __str__(self) -> str:
+        return f"TieredCache(l1={self._l1}, l2={self._l2})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __enter__(self) -> "TieredCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def ttl(self) -> float:
+        """Return the default time-to-live of the entries, in seconds."""
+        return self._ttl
+
+    def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """Return the entry identified by key, or the default if it does not exist or has expired. Entries found
+        in L2 are promoted to L1."""
+        if (value := self._l1.get(key, _MISSING)) is not _MISSING:
+            return value
+        with self._cond:
+            item = self._pending.get(key) or self._writing.get(key)
+        if item is not None:
+            value, expires = item
+            if value is _DELETED or expires <= time.time():
+                return default
+        elif (entry := self._l2.get_entry(key)) is not None:
+            value, expires = entry
+        else:
+            return default
+        self._l1.set(key, value, expires - time.time())
+        return value
+
+    def set(self, key: str, value: T, ttl: Optional[float] = None) -> None:
+        """Store the entry identified by key in L1, and queue it to be written behind to L2.
+        :param key: the entry key.
+        :param value: the entry value.
+        :param ttl: the entry time-to-live, in seconds. Defaults to the cache time-to-live.
+        """
+        ttl = self._ttl if ttl is None else ttl
+        self._l1.set(key, value, ttl)
+        self._enqueue(key, value, time.time() + ttl)
+
+    def delete(self, key: str) -> bool:
+        """Delete the entry identified by key from both tiers. L2 is updated behind.
+        :return: whether the entry existed.
+        """
+        existed = key in self
+        self._l1.delete(key)
+        self._enqueue(key, _DELETED, 0)
+        return existed
+
+    def clear(self) -> None:
+        """Delete all entries of both tiers, discarding the pending writes."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writing)
+            self._pending.clear()
+            self._l1.clear()
+            self._l2.clear()
+
+    def purge_expired(self) -> int:
+        """Delete all the expired entries of both tiers.
+        :return: the number of entries deleted from L2.
+        """
+        self._l1.purge_expired()
+        return self._l2.purge_expired()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all pending writes are stored in L2.
+        :return: False if the timeout elapsed first.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the counters of each tier, and of the write-behind queue."""
+        with self._cond:
+            write_behind = {
+                "pending": len(self._pending) + len(self._writing),
+                "written": self._written,
+                "batches": self._batches,
+                "errors": self._errors,
+            }
+        return {"l1": self._l1.stats(), "l2": self._l2.stats(), "write_behind": write_behind}
+
+    def close(self) -> None:
+        """Store the pending writes, stop the writer and close the disk tier."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        atexit.unregister(self.close)
+        self._writer.join()
+        self._l2.close()
+
+    def _enqueue(self, key: str, value: Any, expires: float) -> None:
+        """Queue a write (or delete) of the entry to L2, replacing any pending write of the same key."""
+        with self._cond:
+            check_state(not self._closed, "The cache is closed")
+            self._pending[key] = value, expires
+            self._cond.notify_all()
+
+    def _write_behind(self) -> None:
+        """Store the pending writes in L2, one batch at a time, until the cache is closed."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                self._writing, self._pending = self._pending, {}
+                batch = self._writing
+            try:
+                self._l2.set_many((k, v, exp) for k, (v, exp) in batch.items() if v is not _DELETED)
+                for key in (k for k, (v, _) in batch.items() if v is _DELETED):
+                    self._l2.delete(key)
+                written, failed = len(batch), 0
+            except Exception as err:  # pylint: disable=broad-except
+                log.warning("Unable to write %d cache entries behind => %s", len(batch), err)
+                written, failed = 0, 1
+            with self._cond:
+                self._writing = {}
+                self._written += written
+                self._batches += 1
+                self._errors += failed
+                self._cond.notify_all()
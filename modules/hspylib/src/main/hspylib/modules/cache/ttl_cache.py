@@ -12,60 +12,61 @@
 
    Copyright·(c)·2024,·HSPyLib
 """
-from hspylib.core.enums.charset import Charset
 from hspylib.core.metaclass.singleton import Singleton
 from hspylib.core.preconditions import check_not_none
-from hspylib.core.tools.commons import safe_delete_file
-from hspylib.modules.cache.ttl_keyring_be import TTLKeyringBE
-from hspylib.modules.security.security import b64_decode, b64_encode
-from threading import Lock
-from typing import Generic, Optional, TypeVar
-
-import ast
-import keyring
-import os
-import tempfile
+from hspylib.modules.cache.disk_cache import DiskCache
+from hspylib.modules.cache.memory_cache import MemoryCache
+from hspylib.modules.cache.tiered_cache import TieredCache
+from typing import Any, Dict, Generic, Optional, TypeVar
 
 T = TypeVar("T")
 
 
 class TTLCache(Generic[T], metaclass=Singleton):
-    """Class to provide a cache with time-to-live timeout."""
+    """Class to provide a cache with time-to-live timeout. Entries are kept in memory, and the least recently used
+    ones are evicted once max_size is reached. When a path is provided, entries are kept in a disk cache file
+    instead, so they survive process restarts. When it is also tiered, the max_size most recently used entries are
+    kept in memory in front of the disk cache file, and saved entries are written to the file behind."""
 
     CACHE_SERVICE = "HS-CACHE-SERVICE"
 
-    def __init__(self, ttl_minutes: int = 15, ttl_seconds: int = 0) -> None:
+    def __init__(
+        self,
+        ttl_minutes: int = 15,
+        ttl_seconds: int = 0,
+        max_size: int = 1024,
+        path: str | None = None,
+        tiered: bool = False,
+    ) -> None:
         super().__init__()
-        self._lock = Lock()
-        keyring.set_keyring(TTLKeyringBE(ttl_minutes, ttl_seconds, safe_delete_file))
+        self._cache: MemoryCache[T] | DiskCache[T] | TieredCache[T]
+        if path and tiered:
+            self._cache = TieredCache(path, ttl_minutes, ttl_seconds, l1_size=max_size)
+        elif path:
+            self._cache = DiskCache(path, ttl_minutes, ttl_seconds)
+        else:
+            self._cache = MemoryCache(max_size, ttl_minutes, ttl_seconds)
 
     def save(self, key: str, entry: T) -> str:
         """Save an entry identified by key containing the given value."""
         check_not_none(key, entry)
-        with self._lock:
-            with tempfile.NamedTemporaryFile(delete=False, mode="w", encoding=Charset.UTF_8.val) as f_temp:
-                content = b64_encode(f"{repr(entry)}")
-                f_temp.write(content)
-                keyring.set_password(self.CACHE_SERVICE, key, f_temp.name)
-                return f_temp.name
+        self._cache.set(key, entry)
+        return key
 
     def read(self, key: str) -> Optional[T]:
         """Read an entry identified by key."""
         check_not_none(key)
-        with self._lock:
-            cache_name = keyring.get_password(self.CACHE_SERVICE, key)
-            if not cache_name or not os.path.exists(cache_name):
-                return None
-            try:
-                with open(cache_name, encoding=Charset.UTF_8.val) as f_cache:
-                    content = b64_decode(f_cache.readline())
-                    return ast.literal_eval(content)
-            except (ValueError, TypeError, SyntaxError):
-                pass  # Just ignore those exceptions.
-        return None
+        return self._cache.get(key)
 
     def delete(self, key: str) -> None:
         """Delete an entry identified by key."""
         check_not_none(key)
-        with self._lock:
-            keyring.delete_password(self.CACHE_SERVICE, key)
+        self._cache.delete(key)
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache counters."""
+        return self._cache.stats()
@@ -12,29 +12,55 @@
 
    Copyright·(c)·2024,·HSPyLib
 """
-from datetime import datetime
 from hspylib.core.preconditions import check_not_none
 from hspylib.core.zoned_datetime import now_ms
 from hspylib.modules.security.security import b64_decode, b64_encode
 from keyring.backends.chainer import ChainerBackend
 from keyring.errors import PasswordDeleteError, PasswordSetError
-from typing import Any, Callable, Optional
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import heapq
 import json
-import keyring
+import logging as log
+import time
 
 PWD_EXPIRED_CB = Callable[[str], Any]
 
 
 class TTLKeyringBE(ChainerBackend):
-    """Class to provide a customized Keyring backend with time-to-live timeout."""
+    """Class to provide a customized Keyring backend with time-to-live timeout. The deadlines of the known
+    passwords are indexed in memory, so expired passwords can be deleted in bulk, either by calling sweep or by the
+    optional background sweeper. Decoded passwords are also cached for cache_seconds, so repeated reads do not hit
+    the OS keyring every time."""
 
     priority = 1
 
-    def __init__(self, ttl_minutes: int = 15, ttl_seconds: int = 0, cb_expired: PWD_EXPIRED_CB = None) -> None:
+    def __init__(
+        self,
+        ttl_minutes: int = 15,
+        ttl_seconds: int = 0,
+        cb_expired: PWD_EXPIRED_CB = None,
+        sweep_interval: float = 0,
+        cache_seconds: float = 5,
+    ) -> None:
         super().__init__()
         self._ttl = ttl_minutes, ttl_seconds
         self._cb_expired = cb_expired
+        self._cache_seconds = cache_seconds
+        self._lock = Lock()
+        # Expiry index: the deadline of each known password, and a min-heap of (deadline, service, username).
+        self._deadlines: Dict[Tuple[str, str], int] = {}
+        self._expiry_heap: List[Tuple[int, str, str]] = []
+        # Decoded passwords: (password, deadline, cached until).
+        self._decoded: Dict[Tuple[str, str], Tuple[str, int, float]] = {}
+        self._stop = Event()
+        self._sweeper: Optional[Thread] = None
+        if sweep_interval > 0:
+            self._sweeper = Thread(
+                target=self._sweep_forever, args=(sweep_interval,), name="ttl-keyring-sweeper", daemon=True
+            )
+            self._sweeper.start()
 
     def set_password(self, service: str, username: str, password: str) -> None:
         """Set password for the username of the service."""
@@ -44,21 +70,26 @@ class TTLKeyringBE(ChainerBackend):
             passwd_obj = {"sn": service, "un": username, "pw": password, "ttl": expires_sec}
             b64_pwd = b64_encode(json.dumps(passwd_obj))
             super().set_password(service, username, b64_pwd)
+            self._remember(service, username, password, expires_sec)
         except PasswordSetError:
             pass  # it does not matter if the password set failed.
 
     def get_password(self, service: str, username: str) -> Optional[str]:
         """Get password of the username for the service."""
         check_not_none(service, username)
+        with self._lock:
+            decoded = self._decoded.get((service, username))
+            if decoded and now_ms() <= decoded[1] and time.monotonic() < decoded[2]:
+                return decoded[0]
         if b64_pwd := super().get_password(service, username):
             passwd_str = b64_decode(b64_pwd)
             passwd_obj = json.loads(passwd_str)
-            dt_object = datetime.fromtimestamp(passwd_obj["ttl"])
-            if now_ms() - dt_object.timestamp() > 0:
-                keyring.delete_password(service, username)
+            if now_ms() - passwd_obj["ttl"] > 0:
+                self.delete_password(service, username)
                 if self._cb_expired:
                     self._cb_expired(passwd_obj["pw"])
             else:
+                self._remember(service, username, passwd_obj["pw"], passwd_obj["ttl"])
                 return passwd_obj["pw"]
 
         return None
@@ -66,7 +97,68 @@ class TTLKeyringBE(ChainerBackend):
     def delete_password(self, service: str, username: str) -> None:
         """Delete the password for the username of the service."""
         check_not_none(service, username)
+        with self._lock:
+            self._deadlines.pop((service, username), None)
+            self._decoded.pop((service, username), None)
         try:
             super().delete_password(service, username)
         except PasswordDeleteError:
             pass  # it does not matter if the password does not exist.
+
+    def sweep(self) -> int:
+        """Delete all the known passwords that have expired. Each one is read back from the keyring first, and kept
+        if it was set again, by another thread or process, since its deadline was indexed.
+        :return: the number of passwords deleted.
+        """
+        expired = []
+        with self._lock:
+            now = now_ms()
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                deadline, service, username = heapq.heappop(self._expiry_heap)
+                # Passwords set again, or deleted, left stale heap items behind.
+                if self._deadlines.get((service, username)) == deadline:
+                    del self._deadlines[(service, username)]
+                    decoded = self._decoded.pop((service, username), None)
+                    expired.append((service, username, deadline, decoded[0] if decoded else None))
+        swept = 0
+        for service, username, deadline, password in expired:
+            if b64_pwd := super().get_password(service, username):
+                passwd_obj = json.loads(b64_decode(b64_pwd))
+                if passwd_obj["ttl"] != deadline and now_ms() <= passwd_obj["ttl"]:
+                    self._remember(service, username, passwd_obj["pw"], passwd_obj["ttl"])
+                    continue
+                password = passwd_obj["pw"]
+                try:
+                    super().delete_password(service, username)
+                except PasswordDeleteError:
+                    pass  # it may have been deleted by another process.
+            swept += 1
+            if self._cb_expired and password is not None:
+                self._cb_expired(password)
+        if swept:
+            log.debug("TTL keyring swept %d expired passwords", swept)
+        return swept
+
+    def close(self) -> None:
+        """Stop the background sweeper, if any."""
+        self._stop.set()
+        if self._sweeper:
+            self._sweeper.join()
+
+    def _remember(self, service: str, username: str, password: str, deadline: int) -> None:
+        """Index the password deadline and cache the decoded password."""
+        with self._lock:
+            key = service, username
+            if self._deadlines.get(key) != deadline:
+                self._deadlines[key] = deadline
+                heapq.heappush(self._expiry_heap, (deadline, service, username))
+            if self._cache_seconds > 0:
+                self._decoded[key] = password, deadline, time.monotonic() + self._cache_seconds
+
+    def _sweep_forever(self, interval: float) -> None:
+        """Sweep the expired passwords every interval seconds, until closed."""
+        while not self._stop.wait(interval):
+            try:
+                self.sweep()
+            except Exception as err:  # pylint: disable=broad-except
+                log.error("TTL keyring sweep failed => %s", err)
@@ -6,8 +6,16 @@
 """Package initialization."""
 
 __all__ = [
+    'broker', 
+    'delivery', 
+    'dispatcher', 
     'event', 
     'eventbus', 
-    'fluid'
+    'fluid', 
+    'metrics', 
+    'subscription', 
+    'topic_matcher', 
+    'transport', 
+    'wire'
 ]
 __version__ = '1.12.55'
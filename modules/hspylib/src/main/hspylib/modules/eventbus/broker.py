@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: broker.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.enums.charset import Charset
+from hspylib.core.preconditions import check_state
+from hspylib.modules.eventbus.wire import bus_names, FRAME_HEADER, FrameType, split_frames
+from threading import Event as Signal, Thread
+from typing import Dict, Optional, Set
+
+import logging as log
+import os
+import selectors
+import socket
+import struct
+import tempfile
+
+
+def default_socket_path() -> str:
+    """Return the path of the broker socket shared by the processes of the current user."""
+    return os.path.join(tempfile.gettempdir(), f"hspylib-eventbus-{os.getuid()}.sock")
+
+
+class _Peer:
+    """One process connected to the broker."""
+
+    __slots__ = ("sock", "inbox", "outbox", "buses")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+        self.buses: Set[str] = set()
+
+
+class EventBroker:
+    """Relay the event frames published by the processes connected to a Unix domain socket, to the other connected
+    processes subscribed to the same buses. Frames are relayed as they are, without decoding the events. A peer
+    that does not keep up with its frames, letting MAX_OUTBOX bytes pile up, is disconnected, and so is a peer
+    sending a malformed frame. The socket is only accessible by the current user: the events are decoded by the
+    connected processes with marshal, which is not safe against crafted data, so only trusted local processes must
+    ever be able to connect to it."""
+
+    # Bytes of frames waiting for a peer, after which it is disconnected.
+    MAX_OUTBOX: int = 8 * 1024 * 1024
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        check_state(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not supported on this platform")
+        self._path = path or default_socket_path()
+        self._server: Optional[socket.socket] = None
+        self._selector = selectors.DefaultSelector()
+        self._peers: Dict[socket.socket, _Peer] = {}
+        self._stop = Signal()
+        self._thread: Optional[Thread] = None
+
+    def __str__(self) -> str:
+        return f"EventBroker(path={self._path}, peers={len(self._peers)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "EventBroker":
+        """Bind the socket and start relaying frames from a daemon thread. A socket file left behind by a broker
+        that is gone is replaced; if another broker is listening on it, InvalidStateError is raised."""
+        check_state(not self.running, "The broker is already running")
+        if os.path.exists(self._path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                check_state(probe.connect_ex(self._path) != 0, "Another broker is listening on: {}", self._path)
+            os.unlink(self._path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            self._server.bind(self._path)
+        finally:
+            os.umask(old_umask)
+        self._server.listen()
+        self._server.setblocking(False)
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="eventbus-broker", daemon=True)
+        self._thread.start()
+        log.debug("EventBus broker listening on %s", self._path)
+        return self
+
+    def stop(self) -> None:
+        """Disconnect all peers, and remove the socket."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                for key, mask in self._selector.select(timeout=0.2):
+                    if key.fileobj is self._server:
+                        self._accept()
+                    elif (peer := self._peers.get(key.fileobj)) is not None:
+                        if mask & selectors.EVENT_READ:
+                            self._read(peer)
+                        if mask & selectors.EVENT_WRITE and peer.sock in self._peers:
+                            self._write(peer)
+        finally:
+            for peer in list(self._peers.values()):
+                self._disconnect(peer)
+            self._selector.unregister(self._server)
+            self._server.close()
+            if os.path.exists(self._path):
+                os.unlink(self._path)
+
+    def _accept(self) -> None:
+        sock, _ = self._server.accept()
+        sock.setblocking(False)
+        self._peers[sock] = _Peer(sock)
+        self._selector.register(sock, selectors.EVENT_READ)
+
+    def _read(self, peer: _Peer) -> None:
+        try:
+            if not (data := peer.sock.recv(65536)):
+                self._disconnect(peer)
+                return
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._disconnect(peer)
+            return
+        peer.inbox += data
+        try:
+            for frame_type, payload in split_frames(peer.inbox):
+                if frame_type == FrameType.SUBSCRIBE:
+                    peer.buses = set(filter(None, payload.decode(Charset.UTF_8.val).split("\n")))
+                elif frame_type == FrameType.EVENTS:
+                    self._relay(peer, FRAME_HEADER.pack(len(payload), frame_type.value) + payload, bus_names(payload))
+        except (struct.error, TypeError, ValueError) as err:
+            log.warning("EventBus peer sent a malformed frame, disconnecting it => %s", err)
+            self._disconnect(peer)
+            return
+        if len(peer.inbox) > self.MAX_OUTBOX:
+            log.warning("EventBus peer sent a frame too large to be relayed, disconnecting it")
+            self._disconnect(peer)
+
+    def _relay(self, sender: _Peer, data: bytes, buses: Set[str]) -> None:
+        """Queue the frame to the other peers subscribed to any one of its buses."""
+        for peer in list(self._peers.values()):
+            if peer is sender or not peer.buses & buses:
+                continue
+            if len(peer.outbox) + len(data) > self.MAX_OUTBOX:
+                log.warning("EventBus peer is not keeping up with its events, disconnecting it")
+                self._disconnect(peer)
+                continue
+            if not peer.outbox:
+                self._selector.modify(peer.sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+            peer.outbox += data
+
+    def _write(self, peer: _Peer) -> None:
+        try:
+            sent = peer.sock.send(peer.outbox)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._disconnect(peer)
+            return
+        del peer.outbox[:sent]
+        if not peer.outbox:
+            self._selector.modify(peer.sock, selectors.EVENT_READ)
+
+    def _disconnect(self, peer: _Peer) -> None:
+        self._peers.pop(peer.sock, None)
+        self._selector.unregister(peer.sock)
+        peer.sock.close()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: delivery.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from collections import OrderedDict
+from hspylib.core.preconditions import check_argument
+from hspylib.modules.eventbus.event import Event
+from hspylib.modules.eventbus.subscription import Subscription
+from itertools import count
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+import heapq
+import logging as log
+import time
+
+COALESCE_KEY = str | Callable[[Event], Hashable]
+
+
+class _DeliveryScheduler:
+    """Fire the delivery timers of all buffered subscriptions from a single daemon thread, started on first use."""
+
+    def __init__(self) -> None:
+        self._cond = Condition()
+        self._timers: List[Tuple[float, int, "BufferedSubscription", int]] = []
+        self._sequence = count()
+        self._thread: Optional[Thread] = None
+
+    def schedule(self, due: float, subscription: "BufferedSubscription", token: int) -> None:
+        """Call the subscription back, with the token, at the due monotonic time."""
+        with self._cond:
+            heapq.heappush(self._timers, (due, next(self._sequence), subscription, token))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="eventbus-delivery", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._timers or self._timers[0][0] > time.monotonic():
+                    self._cond.wait(self._timers[0][0] - time.monotonic() if self._timers else None)
+                _, _, subscription, token = heapq.heappop(self._timers)
+            try:
+                subscription.on_timer(token)
+            except Exception as err:  # pylint: disable=broad-except
+                log.error("EventBus callback failed: %s => %s", subscription, err)
+
+
+_scheduler = _DeliveryScheduler()
+
+
+class BufferedSubscription(Subscription):
+    """A subscription whose events are buffered and delivered according to its options:
+      - debounce: deliver once no events arrived for this many seconds.
+      - throttle: deliver at most this many times per second; the first event goes at once, the rest at the end of
+        the interval.
+      - coalesce: keep only the latest buffered event per key; either the name of an event argument, or a function
+        of the event. Without it, debounce and throttle keep only the latest event.
+      - batch: deliver once this many events are buffered, as one list.
+      - batch_window: deliver the events buffered over this many seconds, as one list.
+    At most one of debounce, throttle and batch_window may be set. Batches call back with a list of events; otherwise
+    each buffered event is delivered on its own. Deliveries due to timers are made from a shared scheduler thread,
+    and their callback errors are logged."""
+
+    # fmt: off
+    __slots__ = (
+        "debounce", "throttle", "coalesce", "batch", "batch_window",
+        "_lock", "_delivery_lock", "_buffer", "_sequence", "_token", "_armed", "_due", "_next_allowed",
+    )
+    # fmt: on
+
+    def __init__(
+        self,
+        bus_name: str,
+        event_name: str,
+        callback: Callable[[Any], None],
+        debounce: float = 0,
+        throttle: float = 0,
+        coalesce: Optional[COALESCE_KEY] = None,
+        batch: int = 0,
+        batch_window: float = 0,
+    ) -> None:
+        super().__init__(bus_name, event_name, callback)
+        check_argument(min(debounce, throttle, batch, batch_window) >= 0, "Delivery options can't be negative")
+        check_argument(
+            sum(1 for opt in (debounce, throttle, batch_window) if opt) <= 1,
+            "Only one of debounce, throttle and batch_window may be set",
+        )
+        check_argument(
+            not coalesce or any((debounce, throttle, batch, batch_window)),
+            "Coalescing requires a debounce, throttle or batch option",
+        )
+        self.debounce = debounce
+        self.throttle = throttle
+        self.coalesce = coalesce
+        self.batch = batch
+        self.batch_window = batch_window
+        self._lock = Lock()
+        self._delivery_lock = Lock()
+        self._buffer: OrderedDict[Hashable, Event] = OrderedDict()
+        self._sequence = count()
+        self._token = 0
+        self._armed = False
+        self._due = 0.0
+        self._next_allowed = 0.0
+
+    @property
+    def batching(self) -> bool:
+        """Whether the events are delivered as lists."""
+        return bool(self.batch or self.batch_window)
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    def deliver(self, event: Event) -> None:
+        """Buffer the event, delivering the buffer if it is due."""
+        with self._lock:
+            self._buffer.pop(key := self._key(event), None)
+            self._buffer[key] = event
+            now = time.monotonic()
+            if self.batch and len(self._buffer) >= self.batch:
+                due_now = True
+            elif self.throttle:
+                due_now = now >= self._next_allowed
+                if not due_now:
+                    self._arm(self._next_allowed)
+            else:
+                due_now = False
+                if self.debounce:
+                    self._due = now + self.debounce
+                    self._arm(self._due)
+                elif self.batch_window:
+                    self._arm(now + self.batch_window)
+        if due_now:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver all buffered events now."""
+        with self._delivery_lock:
+            with self._lock:
+                events = list(self._buffer.values())
+                self._buffer.clear()
+                self._armed = False
+                self._token += 1
+                if self.throttle:
+                    self._next_allowed = time.monotonic() + 1 / self.throttle
+            if not events:
+                return
+            if self.batching:
+                self.invoke(events)
+            else:
+                for event in events:
+                    self.invoke(event)
+
+    def on_timer(self, token: int) -> None:
+        """Deliver the buffered events, unless they were already delivered, or the debounce window moved on."""
+        with self._lock:
+            if token != self._token:
+                return
+            if self.debounce and self._due > time.monotonic():
+                _scheduler.schedule(self._due, self, self._token)
+                return
+        self.flush()
+
+    def _arm(self, due: float) -> None:
+        """Schedule a delivery, unless one is already scheduled. Must be called holding the lock."""
+        if not self._armed:
+            self._armed = True
+            _scheduler.schedule(due, self, self._token)
+
+    def _key(self, event: Event) -> Hashable:
+        """Return the buffer key of the event. Events with the same key replace each other."""
+        if self.coalesce:
+            return self.coalesce(event) if callable(self.coalesce) else getattr(event.args, self.coalesce, None)
+        return next(self._sequence) if self.batching else None
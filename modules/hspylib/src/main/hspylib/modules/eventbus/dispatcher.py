@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: dispatcher.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from hspylib.core.enums.enumeration import Enumeration
+from hspylib.core.exception.exceptions import HSBaseException
+from hspylib.core.preconditions import check_argument, check_state
+from hspylib.modules.eventbus.event import Event
+from hspylib.modules.eventbus.subscription import Subscription
+from threading import Condition, local
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+from weakref import WeakKeyDictionary
+
+import logging as log
+
+DISPATCH_ERROR_CB = Callable[[Event, Exception], Any]
+
+
+class BackpressurePolicy(Enumeration):
+    """What to do when an event is emitted to a subscriber whose queue is full."""
+
+    # fmt: off
+    BLOCK           = 'block'           # Wait until the subscriber catches up. Callbacks never wait: their events
+                                        # go past the queue capacity, as waiting could leave no worker to drain it.
+    DROP_OLDEST     = 'drop-oldest'     # Discard the oldest queued event.
+    DROP_NEWEST     = 'drop-newest'     # Discard the event being emitted.
+    # fmt: on
+
+
+class Dispatcher(ABC):
+    """Deliver the emitted events to the subscriptions of a bus."""
+
+    @abstractmethod
+    def dispatch(self, event: Event, subscriptions: Iterable[Subscription]) -> None:
+        """Deliver the event to each one of the subscriptions."""
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all dispatched events are delivered.
+        :return: False if the timeout elapsed first.
+        """
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop delivering events. When wait is set, the queued events are delivered first."""
+
+    def queue_depth(self, subscription: Subscription) -> int:
+        """Return the number of events queued for the subscription."""
+        return 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the dispatch counters."""
+        return {}
+
+
+class SyncDispatcher(Dispatcher):
+    """Deliver the events on the emitting thread, before emit returns. Callback errors are raised to the emitter."""
+
+    def dispatch(self, event: Event, subscriptions: Iterable[Subscription]) -> None:
+        for subscription in subscriptions:
+            try:
+                subscription.deliver(event)
+            except Exception as err:
+                raise HSBaseException(f"EventBus::emit Callback invocation failed - {str(err)}") from err
+
+
+class _Lane:
+    """The queued events of one subscription. At most one worker drains a lane at a time, which keeps the events of
+    a subscription in order."""
+
+    __slots__ = ("events", "scheduled")
+
+    def __init__(self) -> None:
+        self.events: Deque[Event] = deque()
+        self.scheduled = False
+
+
+class ThreadPoolDispatcher(Dispatcher):
+    """Deliver the events from a pool of worker threads, so emitters do not wait for the subscribers. Each
+    subscription has its own bounded queue (lane), and receives its events in the order they were emitted; distinct
+    subscriptions are delivered concurrently. When a lane is full, the backpressure policy applies; with the BLOCK
+    policy, events emitted by callbacks are queued past the lane capacity instead, and counted as overflowed. Callback
+    errors are logged, and passed to cb_error, if provided."""
+
+    # Default number of worker threads.
+    MAX_WORKERS: int = 4
+
+    # Default capacity of each subscription queue.
+    QUEUE_SIZE: int = 1024
+
+    # Events delivered from one lane before the worker moves to another one, so busy lanes do not starve the rest.
+    DRAIN_BATCH: int = 64
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        queue_size: int = QUEUE_SIZE,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        cb_error: DISPATCH_ERROR_CB = None,
+    ) -> None:
+        check_argument(max_workers > 0, "Max workers must be positive: {}", max_workers)
+        check_argument(queue_size > 0, "Queue size must be positive: {}", queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="eventbus")
+        self._queue_size = queue_size
+        self._policy = policy
+        self._cb_error = cb_error
+        self._cond = Condition()
+        self._lanes: WeakKeyDictionary[Subscription, _Lane] = WeakKeyDictionary()
+        self._worker = local()
+        self._in_flight = 0
+        self._shutdown = False
+        self._counters = {"dispatched": 0, "delivered": 0, "dropped": 0, "overflowed": 0, "errors": 0}
+
+    def __str__(self) -> str:
+        return f"ThreadPoolDispatcher(queue_size={self._queue_size}, policy={self._policy})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def policy(self) -> BackpressurePolicy:
+        return self._policy
+
+    def dispatch(self, event: Event, subscriptions: Iterable[Subscription]) -> None:
+        with self._cond:
+            check_state(not self._shutdown, "The dispatcher is shut down")
+            for subscription in subscriptions:
+                if (lane := self._lanes.get(subscription)) is None:
+                    lane = self._lanes[subscription] = _Lane()
+                if not self._offer(lane, event):
+                    continue
+                if not lane.scheduled:
+                    lane.scheduled = True
+                    self._executor.submit(self._drain, subscription, lane)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if wait:
+            self.flush()
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        self._executor.shutdown(wait=wait)
+
+    def queue_depth(self, subscription: Subscription) -> int:
+        with self._cond:
+            return len(lane.events) if (lane := self._lanes.get(subscription)) else 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {**self._counters, "queued": self._in_flight}
+
+    def _offer(self, lane: _Lane, event: Event) -> bool:
+        """Queue the event into the lane, applying the backpressure policy. Must be called holding the condition.
+        :return: whether the event was queued.
+        """
+        if len(lane.events) >= self._queue_size:
+            # A worker waiting for a lane to drain may be holding the very worker the lane needs.
+            if self._policy == BackpressurePolicy.BLOCK and not getattr(self._worker, "active", False):
+                self._cond.wait_for(lambda: len(lane.events) < self._queue_size or self._shutdown)
+                if self._shutdown:  # Nothing drains the lanes anymore.
+                    return False
+            elif self._policy == BackpressurePolicy.BLOCK:
+                self._counters["overflowed"] += 1
+            elif self._policy == BackpressurePolicy.DROP_OLDEST:
+                lane.events.popleft()
+                self._in_flight -= 1
+                self._counters["dropped"] += 1
+            elif self._policy == BackpressurePolicy.DROP_NEWEST:
+                self._counters["dropped"] += 1
+                return False
+        lane.events.append(event)
+        self._in_flight += 1
+        self._counters["dispatched"] += 1
+        return True
+
+    def _drain(self, subscription: Subscription, lane: _Lane) -> None:
+        """Deliver up to DRAIN_BATCH events of the lane, then give the worker back to the pool."""
+        self._worker.active = True
+        for _ in range(self.DRAIN_BATCH):
+            with self._cond:
+                if not lane.events:
+                    lane.scheduled = False
+                    return
+                event = lane.events.popleft()
+                # Only emitters blocked on a full lane, and flush, wait on the condition.
+                if len(lane.events) == self._queue_size - 1:
+                    self._cond.notify_all()
+            failed = 0
+            try:
+                subscription.deliver(event)
+            except Exception as err:  # pylint: disable=broad-except
+                failed = 1
+                log.error("EventBus callback failed: %s => %s", subscription, err)
+                if self._cb_error:
+                    self._cb_error(event, err)
+            with self._cond:
+                self._in_flight -= 1
+                self._counters["delivered"] += 1 - failed
+                self._counters["errors"] += failed
+                if self._in_flight == 0:
+                    self._cond.notify_all()
+        with self._cond:
+            if self._shutdown:
+                lane.scheduled = False
+            else:
+                self._executor.submit(self._drain, subscription, lane)
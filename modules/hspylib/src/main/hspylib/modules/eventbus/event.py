@@ -12,16 +12,81 @@
 
    Copyright·(c)·2024,·HSPyLib
 """
-from hspylib.core.namespace import Namespace
-from typing import Any
+from typing import Any, Dict, Iterator, Tuple
+
+
+class EventArgs:
+    """Read-only view of the event arguments, whose values can be read as attributes (args.name) or items
+    (args["name"]). Like a Namespace, iterating it yields the (name, value) pairs, and it has no methods of its own
+    but as_dict, so arguments named items, keys or get read as such; as_dict copies them, whatever their names. The
+    arguments are wrapped as they are, with no copies nor validation, so building it costs one small object."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_data", data)
+
+    def __str__(self) -> str:
+        return f"EventArgs({', '.join(f'{k}={v}' for k, v in self._data.items())})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, EventArgs):
+            return self._data == other._data
+        if isinstance(other, dict):
+            return self._data == other
+        return NotImplemented
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self._data,)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(f"Event has no argument '{name}'") from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Event arguments are read-only: '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Event arguments are read-only: '{name}'")
+
+    def __getitem__(self, name: str) -> Any:
+        return self._data[name]
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return iter(self._data.items())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._data
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a copy of the arguments, as a dict."""
+        return dict(self._data)
 
 
 class Event:
     """Class that represents an EventBus Event."""
 
+    __slots__ = ("_name", "_args")
+
+    @classmethod
+    def of(cls, event_name: str, args: Dict[str, Any]) -> "Event":
+        """Create an event wrapping the arguments dict as is. The caller must not change it afterwards."""
+        event = cls.__new__(cls)
+        event._name = event_name
+        event._args = EventArgs(args)
+        return event
+
     def __init__(self, event_name: str, **kwargs):
         self._name = event_name
-        self._args = Namespace("EventArgs", True, **kwargs)
+        self._args = EventArgs(kwargs)
 
     def __str__(self) -> str:
         return f"Event(name={self.name}  args={str(self.args)})"
@@ -30,11 +95,11 @@ class Event:
         return str(self)
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return hash(self._name)
 
     def __eq__(self, other: "Event") -> bool:
         if isinstance(other, self.__class__):
-            return self.name == other.name
+            return self._name == other._name and self._args == other._args
         return NotImplemented
 
     def __getitem__(self, item: str):
@@ -45,5 +110,5 @@ class Event:
         return self._name
 
     @property
-    def args(self) -> Any:
+    def args(self) -> EventArgs:
         return self._args
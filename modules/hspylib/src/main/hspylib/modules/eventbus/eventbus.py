@@ -12,20 +12,23 @@
 
    Copyright·(c)·2024,·HSPyLib
 """
-from typing import Any, Callable, Dict, List
-
-from hspylib.core.exception.exceptions import HSBaseException
+from hspylib.modules.eventbus.delivery import BufferedSubscription, COALESCE_KEY
+from hspylib.modules.eventbus.dispatcher import Dispatcher, SyncDispatcher
 from hspylib.modules.eventbus.event import Event
-
-EVENT_CALLBACK = Callable[[Event], None]
+from hspylib.modules.eventbus.metrics import BusMetrics
+from hspylib.modules.eventbus.subscription import EVENT_CALLBACK, Subscription
+from hspylib.modules.eventbus.topic_matcher import TopicMatcher
+from hspylib.modules.eventbus.transport import Transport
+from threading import Lock
+from typing import Any, Dict, Optional
 
 
-def subscribe(bus: str, events: str | list[str]):
-    """Decorator to subscribe to a given bus event."""
+def subscribe(bus: str, events: str | list[str], **options):
+    """Decorator to subscribe to a given bus event. Options are the delivery options of EventBus.subscribe."""
 
     def helper(func: EVENT_CALLBACK):
         """'subscribe' wrapper to handle both instance methods and functions."""
-        EventBus.get(bus).subscribe(events, func)
+        EventBus.get(bus).subscribe(events, func, **options)
 
     return helper
 
@@ -39,68 +42,176 @@ def emit(bus_name: str, event_name: str, **kwargs):
 
 
 class EventBus:
-    """Provide an eventbus pattern for events and subscribers."""
+    """Provide an eventbus pattern for events and subscribers. Events are delivered by the bus dispatcher, which
+    by default invokes the subscriber callbacks synchronously, on the emitting thread. Event names are hierarchical
+    topics (e.g. 'kafka.consumer.started'), and subscriptions may use wildcards: '*' matches one level, and '#'
+    matches any number of levels (e.g. 'kafka.consumer.*' or 'ui.#'). When a transport is set, the events are
+    exchanged with the buses of the same name in other processes as well. Buses may be instrumented (see
+    enable_metrics), to find out which events and subscribers are keeping them busy."""
 
-    _buses: Dict[str, Any] = {}
-    _subscribers: Dict[str, Any] = {}
-    _events: List[Event] = []
+    _buses: Dict[str, "EventBus"] = {}
+    _lock = Lock()
 
     @classmethod
     def get(cls, bus_name: str) -> "EventBus":
         """Return the bus instance referred to the specified bus name.
         :param bus_name: The name of the event bus.
         """
-        if bus_name in cls._buses:
-            return cls._buses[bus_name]
-        bus_instance = EventBus(bus_name)
-        cls._buses[bus_name] = bus_instance
-        return bus_instance
+        with cls._lock:
+            if bus_name in cls._buses:
+                return cls._buses[bus_name]
+            bus_instance = EventBus(bus_name)
+            cls._buses[bus_name] = bus_instance
+            return bus_instance
 
     @classmethod
-    def _get_subscriber(cls, bus_name: str, event_name: str) -> Any:
-        """Return the subscriber of the referred bus name and event name.
-        :param bus_name: The name of the event bus.
-        :param event_name: The name of the event.
-        """
-        cache_key = f"{bus_name}.{event_name}"
-        if cache_key in cls._subscribers:
-            return cls._subscribers[cache_key]
-        subscriber = {"callbacks": []}
-        cls._subscribers[cache_key] = subscriber
-        return subscriber
-
-    def __init__(self, name: str):
+    def snapshots(cls, slowest: int = 5) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics snapshot of each instrumented bus obtained through get, by bus name."""
+        with cls._lock:
+            buses = list(cls._buses.values())
+        return {bus.name: bus.snapshot(slowest) for bus in buses if bus.metrics}
+
+    def __init__(
+        self,
+        name: str,
+        dispatcher: Optional[Dispatcher] = None,
+        transport: Optional[Transport] = None,
+        metrics: bool = False,
+    ):
         self._name = name
+        self._dispatcher = dispatcher or SyncDispatcher()
+        self._subscriptions: TopicMatcher[Subscription] = TopicMatcher()
+        self._metrics: Optional[BusMetrics] = BusMetrics(name) if metrics else None
+        self._transport: Optional[Transport] = None
+        self.transport = transport
 
     @property
     def name(self) -> str:
         return self._name
 
-    def subscribe(self, events: str | list[str], cb_event_handler: EVENT_CALLBACK) -> None:
-        """Subscribe to the specified event bus.
-        :param events: The name of the events.
-        :param cb_event_handler: A callback that handles the event.
+    @property
+    def dispatcher(self) -> Dispatcher:
+        return self._dispatcher
+
+    @dispatcher.setter
+    def dispatcher(self, dispatcher: Dispatcher) -> None:
+        """Replace the bus dispatcher. The previous dispatcher is not shut down."""
+        self._dispatcher = dispatcher
+
+    @property
+    def metrics(self) -> Optional[BusMetrics]:
+        return self._metrics
+
+    @property
+    def transport(self) -> Optional[Transport]:
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: Optional[Transport]) -> None:
+        """Replace the transport exchanging the bus events with other processes. The previous transport stops
+        exchanging them, but is not closed."""
+        if self._transport:
+            self._transport.unbind(self.name)
+        self._transport = transport
+        if transport:
+            transport.bind(self.name, self._deliver_remote)
+
+    def subscribe(
+        self,
+        events: str | list[str],
+        cb_event_handler: EVENT_CALLBACK,
+        debounce: float = 0,
+        throttle: float = 0,
+        coalesce: Optional[COALESCE_KEY] = None,
+        batch: int = 0,
+        batch_window: float = 0,
+    ) -> None:
+        """Subscribe to the specified event bus. By default, each event is delivered as soon as it is emitted; the
+        delivery options reduce the callbacks of chatty events (see BufferedSubscription).
+        :param events: The name of the events, or event patterns.
+        :param cb_event_handler: A callback that handles the event, or the list of events when batching.
+        :param debounce: Deliver once no events arrived for this many seconds.
+        :param throttle: Deliver at most this many times per second.
+        :param coalesce: Keep only the latest event per key: an event argument name, or a function of the event.
+        :param batch: Deliver the events in lists of this size.
+        :param batch_window: Deliver the events emitted over this many seconds, in one list.
         """
         events = [events] if isinstance(events, str) else events
+        buffered = any((debounce, throttle, coalesce, batch, batch_window))
         for ev in events:
-            subscriber = self._get_subscriber(self.name, ev)
-            subscriber["callbacks"].append(cb_event_handler)
+            if buffered:
+                subscription = BufferedSubscription(
+                    self.name, ev, cb_event_handler, debounce, throttle, coalesce, batch, batch_window
+                )
+            else:
+                subscription = Subscription(self.name, ev, cb_event_handler)
+            if self._metrics:
+                self._metrics.attach(subscription)
+            self._subscriptions.add(ev, subscription)
+
+    def unsubscribe(self, events: str | list[str], cb_event_handler: EVENT_CALLBACK) -> int:
+        """Unsubscribe the callback from the specified events.
+        :param events: The name of the events, or event patterns, exactly as subscribed.
+        :param cb_event_handler: The callback subscribed.
+        :return: The number of subscriptions removed.
+        """
+        events = [events] if isinstance(events, str) else events
+        removed = 0
+        for ev in events:
+            for subscription in self._subscriptions.values(ev):
+                if subscription.callback == cb_event_handler and self._subscriptions.discard(ev, subscription):
+                    removed += 1
+                    if self._metrics:
+                        self._metrics.detach(subscription)
+        return removed
 
     def emit(self, event_name: str, **kwargs) -> None:
         """Emit an event to this bus.
         :param event_name: The name of the event.
         :param kwargs: The event keyword arguments.
         """
-        self._events.append(Event(event_name, **kwargs))
-        while len(self._events) > 0:
-            event = self._events.pop()
-            cache_key = f"{self.name}.{event.name}"
-            subscribers = self._subscribers[cache_key] if cache_key in self._subscribers else None
-            if subscribers and len(subscribers["callbacks"]) > 0:
-                for callback in subscribers["callbacks"]:
-                    try:
-                        callback(event)
-                    except Exception as err:
-                        raise HSBaseException(
-                            f"{self.__class__.__name__}::emit Callback invocation failed - {str(err)}"
-                        ) from err
+        if metrics := self._metrics:
+            metrics.emitted(event_name)
+        if transport := self._transport:
+            event = Event.of(event_name, kwargs)
+            transport.publish(self.name, event)
+            if subscriptions := self._subscriptions.match(event_name):
+                self._dispatcher.dispatch(event, subscriptions)
+        elif subscriptions := self._subscriptions.match(event_name):
+            self._dispatcher.dispatch(Event.of(event_name, kwargs), subscriptions)
+
+    def enable_metrics(self) -> BusMetrics:
+        """Start counting the events emitted and delivered, and timing the subscriber callbacks. Until then, the
+        bus does not pay for any of it.
+        :return: The bus metrics; if they were already enabled, the existing ones, with their figures.
+        """
+        if not self._metrics:
+            metrics = BusMetrics(self.name)
+            for subscription in self._subscriptions:
+                metrics.attach(subscription)
+            self._metrics = metrics
+        return self._metrics
+
+    def disable_metrics(self) -> None:
+        """Stop counting and timing, discarding the figures collected so far."""
+        if metrics := self._metrics:
+            self._metrics = None
+            for subscription in self._subscriptions:
+                metrics.detach(subscription)
+
+    def snapshot(self, slowest: int = 5) -> Dict[str, Any]:
+        """Return the bus metrics figures (see BusMetrics.snapshot), or an empty dict if they are not enabled.
+        :param slowest: The number of slowest subscribers to report.
+        """
+        return self._metrics.snapshot(self._dispatcher, slowest) if self._metrics else {}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all events emitted to this bus are delivered.
+        :return: False if the timeout elapsed first.
+        """
+        return self._dispatcher.flush(timeout)
+
+    def _deliver_remote(self, event: Event) -> None:
+        """Deliver an event emitted to this bus by another process."""
+        if subscriptions := self._subscriptions.match(event.name):
+            self._dispatcher.dispatch(event, subscriptions)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: metrics.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from bisect import bisect_left
+from hspylib.modules.eventbus.dispatcher import Dispatcher
+from hspylib.modules.eventbus.event import Event
+from hspylib.modules.eventbus.subscription import Subscription
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Tuple
+
+import time
+
+
+class LatencyHistogram:
+    """Count the latencies of one callback into fixed buckets, from 10us to 1s. Percentiles are estimated as the
+    upper bound of the bucket they fall into (the maximum latency, for the last bucket)."""
+
+    # Upper bounds of the buckets, in seconds. Latencies above the last bound go to an extra, open, bucket.
+    BOUNDS: Tuple[float, ...] = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+    __slots__ = ("counts", "total", "max", "errors")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+    def __str__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, mean_ms={self.mean * 1000:.3f}, max_ms={self.max * 1000:.3f})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        return self.total / count if (count := self.count) else 0.0
+
+    def record(self, elapsed: float, failed: bool = False) -> None:
+        """Count one callback invocation that took elapsed seconds."""
+        self.counts[bisect_left(self.BOUNDS, elapsed)] += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.errors += failed
+
+    def percentile(self, fraction: float) -> float:
+        """Return the estimated latency, in seconds, below which the fraction (0..1) of the invocations fall."""
+        rank, seen = fraction * self.count, 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(self.BOUNDS[index], self.max) if index < len(self.BOUNDS) else self.max
+        return 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the histogram figures, with latencies in milliseconds."""
+        labels = [f"<={bound * 1000:g}ms" for bound in self.BOUNDS] + [f">{self.BOUNDS[-1] * 1000:g}ms"]
+        return {
+            "calls": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.mean * 1000, 3),
+            "p50_ms": round(self.percentile(0.5) * 1000, 3),
+            "p90_ms": round(self.percentile(0.9) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "total_ms": round(self.total * 1000, 3),
+            "histogram": {label: count for label, count in zip(labels, self.counts) if count},
+        }
+
+
+class BusMetrics:
+    """The counters and callback latencies of one instrumented bus: events emitted and delivered per event name,
+    and one LatencyHistogram per subscription. Subscriptions attached to it time their callbacks through invoke."""
+
+    def __init__(self, bus_name: str) -> None:
+        self._bus_name = bus_name
+        self._lock = Lock()
+        self._since = time.monotonic()
+        self._emitted: Dict[str, int] = {}
+        self._delivered: Dict[str, int] = {}
+        self._latencies: Dict[Subscription, LatencyHistogram] = {}
+
+    def __str__(self) -> str:
+        return f"BusMetrics(bus={self._bus_name}, subscriptions={len(self._latencies)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def attach(self, subscription: Subscription) -> None:
+        """Start timing the callback of the subscription."""
+        with self._lock:
+            self._latencies.setdefault(subscription, LatencyHistogram())
+        subscription.metrics = self
+
+    def detach(self, subscription: Subscription) -> None:
+        """Stop timing the callback of the subscription, discarding its figures."""
+        subscription.metrics = None
+        with self._lock:
+            self._latencies.pop(subscription, None)
+
+    def emitted(self, event_name: str) -> None:
+        """Count one event emitted to the bus."""
+        with self._lock:
+            self._emitted[event_name] = self._emitted.get(event_name, 0) + 1
+
+    def invoke(self, subscription: Subscription, arg: Event | List[Event]) -> None:
+        """Invoke the subscription callback with the event (or list of events), timing it."""
+        started = time.perf_counter()
+        try:
+            subscription.callback(arg)
+        except Exception:
+            self._record(subscription, time.perf_counter() - started, (), failed=True)
+            raise
+        self._record(subscription, time.perf_counter() - started, arg if isinstance(arg, list) else (arg,))
+
+    def _record(
+        self, subscription: Subscription, elapsed: float, delivered: Iterable[Event], failed: bool = False
+    ) -> None:
+        """Record one callback invocation, and the events it delivered."""
+        with self._lock:
+            if (histogram := self._latencies.get(subscription)) is not None:
+                histogram.record(elapsed, failed)
+            for event in delivered:
+                self._delivered[event.name] = self._delivered.get(event.name, 0) + 1
+
+    def reset(self) -> None:
+        """Zero all counters and histograms."""
+        with self._lock:
+            self._since = time.monotonic()
+            self._emitted.clear()
+            self._delivered.clear()
+            for subscription in list(self._latencies):
+                self._latencies[subscription] = LatencyHistogram()
+
+    def snapshot(self, dispatcher: Dispatcher, slowest: int = 5) -> Dict[str, Any]:
+        """Return the bus figures since the metrics were enabled (or reset):
+          - emitted/delivered: events per event name, their totals and rates per second;
+          - queued: events waiting for delivery in the dispatcher;
+          - subscribers: the latency figures (see LatencyHistogram) and queued events of each subscription;
+          - slowest: the subscribers with the highest mean latency, up to slowest of them.
+        """
+        with self._lock:
+            elapsed = max(time.monotonic() - self._since, 1e-9)
+            emitted, delivered = dict(self._emitted), dict(self._delivered)
+            latencies = [(sub, histogram.snapshot()) for sub, histogram in self._latencies.items()]
+        subscribers = [
+            {
+                "event": sub.event_name,
+                "callback": getattr(sub.callback, "__qualname__", str(sub.callback)),
+                "queued": dispatcher.queue_depth(sub) + sub.buffered,
+                **figures,
+            }
+            for sub, figures in latencies
+        ]
+        return {
+            "bus": self._bus_name,
+            "elapsed_s": round(elapsed, 3),
+            "emitted": emitted,
+            "delivered": delivered,
+            "emitted_total": (emitted_total := sum(emitted.values())),
+            "delivered_total": (delivered_total := sum(delivered.values())),
+            "emitted_per_s": round(emitted_total / elapsed, 1),
+            "delivered_per_s": round(delivered_total / elapsed, 1),
+            "queued": dispatcher.stats().get("queued", 0),
+            "subscribers": subscribers,
+            "slowest": self._slowest(subscribers, slowest),
+        }
+
+    @staticmethod
+    def _slowest(subscribers: Iterable[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        called = (sub for sub in subscribers if sub["calls"])
+        return [
+            {key: sub[key] for key in ("event", "callback", "calls", "mean_ms", "p99_ms", "max_ms", "total_ms")}
+            for sub in sorted(called, key=lambda sub: sub["mean_ms"], reverse=True)[:limit]
+        ]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: subscription.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.modules.eventbus.event import Event
+from typing import Any, Callable
+
+EVENT_CALLBACK = Callable[[Event], None]
+
+
+class Subscription:
+    """Class that represents one callback subscribed to one event of a bus. Dispatchers deliver the events of
+    each subscription in the order they were emitted. When the bus is instrumented, metrics holds its BusMetrics,
+    which times the callback invocations."""
+
+    __slots__ = ("bus_name", "event_name", "callback", "metrics", "__weakref__")
+
+    def __init__(self, bus_name: str, event_name: str, callback: EVENT_CALLBACK) -> None:
+        self.bus_name = bus_name
+        self.event_name = event_name
+        self.callback = callback
+        self.metrics = None
+
+    def __str__(self) -> str:
+        return f"Subscription(event={self.bus_name}.{self.event_name}, callback={self.callback})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def buffered(self) -> int:
+        """The number of events held by the subscription, waiting to be delivered."""
+        return 0
+
+    def invoke(self, arg: Any) -> None:
+        """Invoke the subscription callback with the argument, through the bus metrics if it is instrumented."""
+        if self.metrics is None:
+            self.callback(arg)
+        else:
+            self.metrics.invoke(self, arg)
+
+    def deliver(self, event: Event) -> None:
+        """Invoke the subscription callback with the event."""
+        # Same as invoke, inlined: this is called once per subscriber of every emitted event.
+        if self.metrics is None:
+            self.callback(event)
+        else:
+            self.metrics.invoke(self, event)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: topic_matcher.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.preconditions import check_argument
+from itertools import count
+from threading import Lock
+from typing import Any, Dict, Generic, Iterator, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Node:
+    """One level of the topic trie, holding the (sequence, value) pairs of the patterns that end on it."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        self.values: Tuple[Tuple[int, Any], ...] = ()
+
+
+class TopicMatcher(Generic[T]):
+    """Match hierarchical topics, whose levels are separated by dots (e.g. 'kafka.consumer.started'), against
+    patterns. In a pattern, '*' matches exactly one level and '#' matches any number of levels, including none; so
+    'kafka.consumer.*' matches 'kafka.consumer.started', and 'ui.#' matches 'ui' and 'ui.menu.opened'. Patterns are
+    kept in a trie, so matching a topic costs O(depth), no matter how many patterns there are. The values matched by
+    each topic are cached until a pattern is added or removed."""
+
+    # fmt: off
+    SEPARATOR       = '.'
+    ONE_LEVEL       = '*'
+    ANY_LEVELS      = '#'
+    # fmt: on
+
+    # Maximum number of distinct topics whose matches are cached.
+    CACHE_SIZE: int = 4096
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._lock = Lock()
+        self._sequence = count()
+        self._size = 0
+        self._cache: Dict[str, Tuple[T, ...]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over all registered values, in the order they were added."""
+        with self._lock:
+            found: Dict[int, T] = {}
+            nodes = [self._root]
+            while nodes:
+                node = nodes.pop()
+                found.update(node.values)
+                nodes.extend(node.children.values())
+        return iter([found[seq] for seq in sorted(found)])
+
+    def __str__(self) -> str:
+        return f"TopicMatcher(patterns={self._size}, cached={len(self._cache)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @classmethod
+    def is_pattern(cls, topic: str) -> bool:
+        """Whether the topic has wildcard levels."""
+        return any(level in (cls.ONE_LEVEL, cls.ANY_LEVELS) for level in topic.split(cls.SEPARATOR))
+
+    def add(self, pattern: str, value: T) -> None:
+        """Register the value under the pattern. Values matched by a topic are returned in the order they were added.
+        :param pattern: the topic pattern.
+        :param value: the value to be matched.
+        """
+        check_argument(bool(pattern), "The topic pattern must not be empty")
+        with self._lock:
+            node = self._root
+            for level in pattern.split(self.SEPARATOR):
+                node = node.children.setdefault(level, _Node())
+            node.values = node.values + ((next(self._sequence), value),)
+            self._size += 1
+            self._cache = {}
+
+    def discard(self, pattern: str, value: T) -> bool:
+        """Unregister the value from the pattern.
+        :return: whether the value was registered.
+        """
+        with self._lock:
+            levels, path = pattern.split(self.SEPARATOR), [self._root]
+            for level in levels:
+                if (node := path[-1].children.get(level)) is None:
+                    return False
+                path.append(node)
+            values = tuple(item for item in path[-1].values if item[1] is not value)
+            if len(values) == len(path[-1].values):
+                return False
+            path[-1].values = values
+            self._size -= 1
+            self._cache = {}
+            # Prune the levels left without patterns.
+            for depth in range(len(levels), 0, -1):
+                if path[depth].values or path[depth].children:
+                    break
+                del path[depth - 1].children[levels[depth - 1]]
+            return True
+
+    def values(self, pattern: str) -> Tuple[T, ...]:
+        """Return the values registered exactly under the pattern (not the ones matching it)."""
+        node = self._root
+        for level in pattern.split(self.SEPARATOR):
+            if (node := node.children.get(level)) is None:
+                return ()
+        return tuple(value for _, value in node.values)
+
+    def match(self, topic: str) -> Tuple[T, ...]:
+        """Return the values of all patterns matching the topic, in the order they were added."""
+        if (matched := self._cache.get(topic)) is not None:
+            return matched
+        with self._lock:
+            found: Dict[int, T] = {}
+            self._collect(self._root, topic.split(self.SEPARATOR), 0, found)
+            matched = tuple(found[seq] for seq in sorted(found))
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache = {}
+            self._cache[topic] = matched
+            return matched
+
+    def _collect(self, node: _Node, levels: Sequence[str], index: int, found: Dict[int, T]) -> None:
+        """Collect the values of the patterns under node matching the topic levels from index on. Values are keyed by
+        their sequence, since a value may be reached through more than one path (e.g. '#.#')."""
+        if any_levels := node.children.get(self.ANY_LEVELS):
+            # The '#' level may swallow any number of the remaining levels, including none.
+            for rest in range(index, len(levels) + 1):
+                self._collect(any_levels, levels, rest, found)
+        if index == len(levels):
+            found.update(node.values)
+            return
+        if exact := node.children.get(levels[index]):
+            self._collect(exact, levels, index + 1, found)
+        if one_level := node.children.get(self.ONE_LEVEL):
+            self._collect(one_level, levels, index + 1, found)
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: transport.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from abc import ABC, abstractmethod
+from collections import deque
+from hspylib.core.exception.exceptions import InvalidArgumentError, InvalidStateError
+from hspylib.core.preconditions import check_argument, check_state
+from hspylib.modules.eventbus.broker import default_socket_path, EventBroker
+from hspylib.modules.eventbus.event import Event
+from hspylib.modules.eventbus.wire import (
+    Codec,
+    decode_events,
+    encode_message,
+    events_frame,
+    FrameType,
+    MAX_BATCH,
+    MAX_FRAME_BYTES,
+    split_frames,
+    subscribe_frame,
+)
+from threading import Condition, Event as Signal, Lock, Thread
+from typing import Any, Callable, Deque, Dict, Optional
+
+import logging as log
+import os
+import socket
+import struct
+import time
+
+REMOTE_EVENT_CB = Callable[[Event], None]
+
+
+class Transport(ABC):
+    """Carry the events emitted to the buses bound to it to other processes, and the events they emit back."""
+
+    @abstractmethod
+    def bind(self, bus_name: str, on_event: REMOTE_EVENT_CB) -> None:
+        """Start exchanging the events of the bus. Events received from other processes are passed to on_event."""
+
+    @abstractmethod
+    def unbind(self, bus_name: str) -> None:
+        """Stop exchanging the events of the bus."""
+
+    @abstractmethod
+    def publish(self, bus_name: str, event: Event) -> None:
+        """Send the event, emitted to the bus, to the other processes. Must not block the emitter."""
+
+    def close(self) -> None:
+        """Stop exchanging events."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the transport counters."""
+        return {}
+
+
+class UnixSocketTransport(Transport):
+    """Exchange events with the other processes of the same host through an EventBroker, listening on a Unix domain
+    socket. If no broker is running, this process starts one (start_broker). Published events are encoded on the
+    emitting thread and sent in batches by a background thread; when linger is set, it waits that many seconds
+    for more events before sending each batch. Batches are cut at MAX_FRAME_BYTES, so a backlog never makes a frame
+    the broker would refuse to relay. While the broker is unreachable, up to max_pending events are kept, the oldest
+    ones being dropped. Events whose arguments can't be encoded, or that take more than MAX_FRAME_BYTES, are dropped
+    as well, and counted as unencodable. The latency from publishing to receiving each event is tracked. The events
+    are decoded with marshal (or msgpack), so the transport is meant for trusted local processes only: it only
+    connects to a socket owned by the current user, and drops the connection when a malformed frame is received."""
+
+    # Default maximum number of events kept while the broker is unreachable.
+    MAX_PENDING: int = 10_000
+
+    # Number of recent latencies kept to compute the percentiles.
+    LATENCY_SAMPLES: int = 1024
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        start_broker: bool = True,
+        codec: Codec = Codec.MARSHAL,
+        linger: float = 0.0,
+        max_pending: int = MAX_PENDING,
+        reconnect_interval: float = 0.5,
+    ) -> None:
+        check_argument(max_pending > 0, "Max pending must be positive: {}", max_pending)
+        self._path = path or default_socket_path()
+        self._start_broker = start_broker
+        self._codec = codec
+        self._linger = linger
+        self._max_pending = max_pending
+        self._reconnect_interval = reconnect_interval
+        self._bindings: Dict[str, REMOTE_EVENT_CB] = {}
+        self._broker: Optional[EventBroker] = None
+        self._sock: Optional[socket.socket] = None
+        self._sock_lock = Lock()
+        self._send_lock = Lock()
+        self._connected = Signal()
+        self._closed = Signal()
+        self._cond = Condition()
+        self._pending: Deque[bytes] = deque()
+        self._sending = 0
+        self._latencies: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self._latency_max = 0.0
+        self._counters = dict.fromkeys(
+            ("published", "sent", "received", "dropped", "unencodable", "frames_sent", "frames_received"), 0
+        )
+        self._receiver = Thread(target=self._receive, name="eventbus-transport-rx", daemon=True)
+        self._sender = Thread(target=self._send, name="eventbus-transport-tx", daemon=True)
+        self._receiver.start()
+        self._sender.start()
+
+    def __str__(self) -> str:
+        return f"UnixSocketTransport(path={self._path}, connected={self.connected})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the transport is connected to the broker.
+        :return: False if the timeout elapsed first.
+        """
+        return self._connected.wait(timeout)
+
+    def bind(self, bus_name: str, on_event: REMOTE_EVENT_CB) -> None:
+        with self._sock_lock:
+            self._bindings[bus_name] = on_event
+        self._subscribe()
+
+    def unbind(self, bus_name: str) -> None:
+        with self._sock_lock:
+            self._bindings.pop(bus_name, None)
+        self._subscribe()
+
+    def publish(self, bus_name: str, event: Event) -> None:
+        check_state(not self._closed.is_set(), "The transport is closed")
+        try:
+            message = encode_message(bus_name, event, self._codec)
+            check_argument(len(message) <= MAX_FRAME_BYTES, "Event takes more than {} bytes", MAX_FRAME_BYTES)
+        except (InvalidArgumentError, TypeError, ValueError) as err:
+            log.warning("Unable to send event '%s' to other processes => %s", event.name, err)
+            with self._cond:
+                self._counters["unencodable"] += 1
+            return
+        with self._cond:
+            if len(self._pending) >= self._max_pending:
+                self._pending.popleft()
+                self._counters["dropped"] += 1
+            self._pending.append(message)
+            self._counters["published"] += 1
+            self._cond.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all published events are sent.
+        :return: False if the timeout elapsed first.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._sending, timeout)
+
+    def close(self) -> None:
+        """Send the pending events, if connected, disconnect, and stop the broker started by this transport."""
+        if self._closed.is_set():
+            return
+        if self.connected:
+            self.flush(timeout=1)
+        self._closed.set()
+        with self._cond:
+            self._cond.notify_all()
+        self._sender.join()
+        with self._sock_lock:
+            self._disconnect(self._sock)
+        self._receiver.join()
+        if self._broker:
+            self._broker.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            counters = dict(self._counters)
+            latencies = sorted(self._latencies)
+        counters["pending"] = len(self._pending)
+        counters["connected"] = self.connected
+        if latencies:
+            counters["latency_ms"] = {
+                "mean": round(sum(latencies) / len(latencies) * 1000, 3),
+                "p50": round(latencies[len(latencies) // 2] * 1000, 3),
+                "p99": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3),
+                "max": round(self._latency_max * 1000, 3),
+            }
+        return counters
+
+    def _subscribe(self) -> None:
+        """Tell the broker which buses this process wants the events of."""
+        if (sock := self._sock) is not None:
+            with self._sock_lock:
+                names = set(self._bindings)
+            try:
+                with self._send_lock:
+                    sock.sendall(subscribe_frame(names))
+            except OSError:
+                with self._sock_lock:
+                    self._disconnect(sock)
+
+    def _connect(self) -> Optional[socket.socket]:
+        """Connect to the broker, starting one if there is none and start_broker is set."""
+        if (sock := self._open()) is None and self._start_broker:
+            try:
+                self._broker = EventBroker(self._path).start()
+            except InvalidStateError:
+                pass  # Another process started a broker in the meantime.
+            except OSError as err:
+                log.warning("Unable to start the EventBus broker on %s => %s", self._path, err)
+                return None
+            sock = self._open()
+        if sock is None:
+            return None
+        with self._sock_lock:
+            if self._closed.is_set():
+                sock.close()
+                return None
+            self._sock = sock
+            self._connected.set()
+        self._subscribe()
+        log.debug("EventBus transport connected to %s", self._path)
+        return sock
+
+    def _open(self) -> Optional[socket.socket]:
+        """Open a connection to the broker socket, if there is a broker of the current user listening on it."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            if os.stat(self._path).st_uid != os.getuid():
+                log.warning("Not connecting to the EventBus broker on %s, owned by another user", self._path)
+                sock.close()
+                return None
+            sock.connect(self._path)
+            return sock
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            return None
+
+    def _disconnect(self, sock: Optional[socket.socket]) -> None:
+        """Close the connection, if it is still the current one. Must be called holding the socket lock."""
+        if sock is not None and sock is self._sock:
+            self._sock = None
+            self._connected.clear()
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def _receive(self) -> None:
+        """Read the frames relayed by the broker, reconnecting whenever the connection is lost."""
+        while not self._closed.is_set():
+            if (sock := self._sock) is None and (sock := self._connect()) is None:
+                self._closed.wait(self._reconnect_interval)
+                continue
+            buffer = bytearray()
+            while True:
+                try:
+                    data = sock.recv(65536)
+                except OSError:
+                    data = b""
+                if not data:
+                    break
+                buffer += data
+                try:
+                    for frame_type, payload in split_frames(buffer):
+                        if frame_type == FrameType.EVENTS:
+                            self._deliver(payload)
+                except (EOFError, struct.error, TypeError, ValueError) as err:
+                    log.warning("Received a malformed frame from the EventBus broker, reconnecting => %s", err)
+                    break
+            with self._sock_lock:
+                self._disconnect(sock)
+
+    def _deliver(self, payload: bytes) -> None:
+        """Pass the received events to their buses."""
+        received_at = time.time()
+        with self._cond:
+            self._counters["frames_received"] += 1
+        for bus_name, event, sent_at in decode_events(payload):
+            if (on_event := self._bindings.get(bus_name)) is None:
+                continue
+            with self._cond:
+                latency = max(0.0, received_at - sent_at)
+                self._latencies.append(latency)
+                self._latency_max = max(self._latency_max, latency)
+                self._counters["received"] += 1
+            try:
+                on_event(event)
+            except Exception as err:  # pylint: disable=broad-except
+                log.error("Unable to deliver remote event '%s' => %s", event.name, err)
+
+    def _send(self) -> None:
+        """Send the published events in batches, until the transport is closed."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed.is_set())
+                if self._closed.is_set():
+                    return
+            if not self._connected.wait(self._reconnect_interval):
+                continue
+            if self._linger:
+                self._closed.wait(self._linger)
+            with self._cond:
+                batch, size = [], 0
+                while self._pending and len(batch) < MAX_BATCH and size + len(self._pending[0]) <= MAX_FRAME_BYTES:
+                    size += len(self._pending[0])
+                    batch.append(self._pending.popleft())
+                self._sending = len(batch)
+            sock = self._sock
+            try:
+                if sock is None:
+                    raise ConnectionError("Not connected to the broker")
+                with self._send_lock:
+                    sock.sendall(events_frame(batch, self._codec))
+                sent = len(batch)
+            except OSError:
+                with self._sock_lock:
+                    self._disconnect(sock)
+                sent = 0
+            with self._cond:
+                self._sending = 0
+                self._counters["sent"] += sent
+                self._counters["dropped"] += len(batch) - sent
+                self._counters["frames_sent"] += 1 if sent else 0
+                self._cond.notify_all()
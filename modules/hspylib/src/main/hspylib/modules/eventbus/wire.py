@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.eventbus
+      @file: wire.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+
+   The binary format of the events exchanged between processes. Every frame is:
+     length (uint32) | type (uint8) | payload (length bytes)
+   SUBSCRIBE payloads are the newline separated bus names. EVENTS payloads are:
+     codec (uint8) | count (uint16) | count x [bus len (uint16) | name len (uint16) | sent at (double) |
+                                               args len (uint32) | bus | name | args]
+"""
+from hspylib.core.enums.charset import Charset
+from hspylib.core.enums.enumeration import Enumeration
+from hspylib.modules.eventbus.event import Event
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+import marshal
+import struct
+import time
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+FRAME_HEADER = struct.Struct("!IB")
+
+EVENTS_HEADER = struct.Struct("!BH")
+
+MESSAGE_HEADER = struct.Struct("!HHdI")
+
+# Maximum number of events batched in one frame.
+MAX_BATCH: int = 0xFFFF
+
+# Maximum size of the encoded events batched in one frame, well below the bytes the broker queues for each peer.
+MAX_FRAME_BYTES: int = 1024 * 1024
+
+
+class FrameType(Enumeration):
+    """The types of the frames exchanged with the broker."""
+
+    # fmt: off
+    SUBSCRIBE       = 1
+    EVENTS          = 2
+    # fmt: on
+
+
+class Codec(Enumeration):
+    """The encodings of the event arguments. Marshal is always available, but its format may change across Python
+    versions; msgpack is portable, but requires the msgpack package in all processes."""
+
+    # fmt: off
+    MARSHAL         = 0
+    MSGPACK         = 1
+    # fmt: on
+
+    def dumps(self, args: Dict[str, Any]) -> bytes:
+        """Encode the event arguments. Only plain values (None, bool, numbers, str, bytes, lists and dicts) can be
+        encoded; anything else raises ValueError or TypeError."""
+        if self == Codec.MSGPACK:
+            if not msgpack:
+                raise ValueError("The msgpack codec requires the 'msgpack' package")
+            return msgpack.packb(args, use_bin_type=True)
+        return marshal.dumps(args, 4)
+
+    def loads(self, data: bytes) -> Dict[str, Any]:
+        """Decode the event arguments."""
+        if self == Codec.MSGPACK:
+            if not msgpack:
+                raise ValueError("Received msgpack encoded events, but the 'msgpack' package is not installed")
+            return msgpack.unpackb(data, raw=False)
+        return marshal.loads(data)
+
+
+def frame(frame_type: FrameType, payload: bytes) -> bytes:
+    """Return the frame of the payload."""
+    return FRAME_HEADER.pack(len(payload), frame_type.value) + payload
+
+
+def subscribe_frame(bus_names: Set[str]) -> bytes:
+    """Return the frame subscribing to the buses."""
+    return frame(FrameType.SUBSCRIBE, "\n".join(sorted(bus_names)).encode(Charset.UTF_8.val))
+
+
+def encode_message(bus_name: str, event: Event, codec: Codec) -> bytes:
+    """Encode one event of the bus, stamped with the current time, to be batched into an EVENTS frame."""
+    bus, name = bus_name.encode(Charset.UTF_8.val), event.name.encode(Charset.UTF_8.val)
+    args = codec.dumps(event.args.as_dict())
+    return MESSAGE_HEADER.pack(len(bus), len(name), time.time(), len(args)) + bus + name + args
+
+
+def events_frame(messages: List[bytes], codec: Codec) -> bytes:
+    """Return the frame batching the encoded messages."""
+    return frame(FrameType.EVENTS, EVENTS_HEADER.pack(codec.value, len(messages)) + b"".join(messages))
+
+
+def split_frames(buffer: bytearray) -> Iterator[Tuple[FrameType, bytes]]:
+    """Consume the complete frames from the beginning of the buffer, yielding their types and payloads. A frame of an
+    unknown type raises TypeError as soon as its header is read."""
+    while len(buffer) >= FRAME_HEADER.size:
+        length, frame_type = FRAME_HEADER.unpack_from(buffer)
+        frame_type = FrameType.of_value(frame_type)
+        end = FRAME_HEADER.size + length
+        if len(buffer) < end:
+            return
+        payload = bytes(buffer[FRAME_HEADER.size : end])
+        del buffer[:end]
+        yield frame_type, payload
+
+
+def bus_names(payload: bytes) -> Set[str]:
+    """Return the names of the buses of an EVENTS payload, without decoding the events."""
+    _, count = EVENTS_HEADER.unpack_from(payload)
+    offset, names = EVENTS_HEADER.size, set()
+    for _ in range(count):
+        bus_len, name_len, _, args_len = MESSAGE_HEADER.unpack_from(payload, offset)
+        offset += MESSAGE_HEADER.size
+        names.add(payload[offset : offset + bus_len].decode(Charset.UTF_8.val))
+        offset += bus_len + name_len + args_len
+    return names
+
+
+def decode_events(payload: bytes) -> Iterator[Tuple[str, Event, float]]:
+    """Decode an EVENTS payload, yielding the bus name, the event and the time it was sent, of each message."""
+    codec, count = EVENTS_HEADER.unpack_from(payload)
+    codec, offset = Codec.of_value(codec), EVENTS_HEADER.size
+    for _ in range(count):
+        bus_len, name_len, sent_at, args_len = MESSAGE_HEADER.unpack_from(payload, offset)
+        offset += MESSAGE_HEADER.size
+        bus = payload[offset : offset + bus_len].decode(Charset.UTF_8.val)
+        offset += bus_len
+        name = payload[offset : offset + name_len].decode(Charset.UTF_8.val)
+        offset += name_len
+        args = codec.loads(payload[offset : offset + args_len])
+        offset += args_len
+        yield bus, Event.of(name, args), sent_at
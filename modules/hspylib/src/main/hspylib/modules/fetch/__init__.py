@@ -6,8 +6,15 @@
 """Package initialization."""
 
 __all__ = [
+    'afetch', 
+    'compression', 
     'fetch', 
+    'http_cache', 
     'http_response', 
+    'http_stream_response', 
+    'rate_limiter', 
+    'retry_policy', 
+    'session_pool', 
     'uri_builder', 
     'uri_scheme'
 ]
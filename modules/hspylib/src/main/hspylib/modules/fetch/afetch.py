@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.fetch
+      @file: afetch.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from concurrent.futures import ThreadPoolExecutor
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.core.preconditions import check_argument
+from hspylib.modules.fetch.compression import ContentEncoding
+from hspylib.modules.fetch.fetch import _request, get_retry_policy
+from hspylib.modules.fetch.http_response import HttpResponse
+from hspylib.modules.fetch.rate_limiter import rate_limiter
+from hspylib.modules.fetch.retry_policy import RetryPolicy
+from hspylib.modules.fetch.session_pool import PoolKey
+from hspylib.modules.fetch.uri_builder import UriBuilder
+from threading import Lock
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+import asyncio
+
+# Maximum number of requests in flight, considering all hosts.
+MAX_IN_FLIGHT: int = 64
+
+# Maximum number of requests in flight to the same (scheme, host, port).
+MAX_PER_HOST: int = 8
+
+
+class _Limits:
+    """Hold the concurrency limits of an event loop."""
+
+    def __init__(self, max_in_flight: int, max_per_host: int) -> None:
+        self.max_per_host = max_per_host
+        self.all_hosts = asyncio.Semaphore(max_in_flight)
+        self.hosts: Dict[PoolKey, asyncio.Semaphore] = {}
+
+    def host(self, key: PoolKey) -> asyncio.Semaphore:
+        """Return the semaphore limiting the requests to the specified host."""
+        if not (semaphore := self.hosts.get(key)):
+            semaphore = asyncio.Semaphore(self.max_per_host)
+            self.hosts[key] = semaphore
+        return semaphore
+
+
+_lock = Lock()
+
+_limits: WeakKeyDictionary = WeakKeyDictionary()
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def configure_limits(max_in_flight: int = MAX_IN_FLIGHT, max_per_host: int = MAX_PER_HOST) -> None:
+    """Change the asyncio fetch concurrency limits. Takes effect on the next request of each event loop.
+    :param max_in_flight: the maximum number of requests in flight, considering all hosts.
+    :param max_per_host: the maximum number of requests in flight to the same host.
+    """
+    global MAX_IN_FLIGHT, MAX_PER_HOST, _executor  # pylint: disable=global-statement
+    check_argument(max_in_flight > 0, "Max in flight requests must be positive: {}", max_in_flight)
+    check_argument(max_per_host > 0, "Max per host requests must be positive: {}", max_per_host)
+    with _lock:
+        MAX_IN_FLIGHT, MAX_PER_HOST = max_in_flight, max_per_host
+        _limits.clear()
+        executor, _executor = _executor, None
+    if executor:
+        executor.shutdown(wait=False)
+
+
+def _loop_limits() -> _Limits:
+    """Return the concurrency limits of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        if not (limits := _limits.get(loop)):
+            limits = _Limits(MAX_IN_FLIGHT, MAX_PER_HOST)
+            _limits[loop] = limits
+        return limits
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the executor running the blocking pooled requests. It never exceeds the in flight limit."""
+    global _executor  # pylint: disable=global-statement
+    with _lock:
+        if not _executor:
+            _executor = ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT, thread_name_prefix="afetch")
+        return _executor
+
+
+async def afetch(
+    url: str,
+    method: HttpMethod = HttpMethod.GET,
+    headers: List[Dict[str, str]] = None,
+    body: Any = None,
+    silent: bool = True,
+    timeout: Union[float, Tuple[float, float]] = 10,
+    retry_policy: RetryPolicy | None = None,
+    compress: bool | ContentEncoding = False,
+) -> HttpResponse:
+    """Asynchronously do a request specified by method and according to parameters. The same retry policy of
+    the blocking fetch is applied, however, the event loop is never blocked while waiting to retry.
+    :param url: The url to make the request.
+    :param method: The http method to be used [ GET, HEAD, POST, PUT, PATCH, DELETE, OPTIONS ].
+    :param headers: The http request headers.
+    :param body: The http request body (payload).
+    :param silent: Omits all informational messages.
+    :param timeout: How many seconds to wait for the server to send data or connect before giving up.
+    :param retry_policy: The policy used to retry failed requests. Defaults to the blocking fetch one.
+    :param compress: Whether to compress large request bodies, using gzip (or the specified encoding).
+    :return:
+    """
+
+    encoding = ContentEncoding.of_request(compress)
+    final_url = UriBuilder.ensure_scheme(url)
+    limits = _loop_limits()
+    host = limits.host(PoolKey.of(final_url))
+
+    async def _attempt() -> HttpResponse:
+        if (delay := rate_limiter.reserve(final_url)) > 0:
+            await asyncio.sleep(delay)
+        async with host, limits.all_hosts:
+            return await asyncio.get_running_loop().run_in_executor(
+                _get_executor(), _request, url, method, headers, body, silent, timeout, False, False, encoding
+            )
+
+    return await (retry_policy or get_retry_policy()).acall(url, _attempt)
+
+
+async def ahead(
+    url: str, headers: List[Dict[str, str]] = None, silent: bool = True, timeout: Union[float, Tuple[float, float]] = 10
+) -> HttpResponse:
+    """Asynchronously do HEAD request and according to parameters."""
+
+    return await afetch(url=url, method=HttpMethod.HEAD, headers=headers, silent=silent, timeout=timeout)
+
+
+async def aget(
+    url: str, headers: List[Dict[str, str]] = None, silent: bool = True, timeout: Union[float, Tuple[float, float]] = 10
+) -> HttpResponse:
+    """Asynchronously do GET request and according to parameters."""
+
+    return await afetch(url=url, headers=headers, silent=silent, timeout=timeout)
+
+
+async def adelete(
+    url: str, headers: List[Dict[str, str]] = None, silent: bool = True, timeout: Union[float, Tuple[float, float]] = 10
+) -> HttpResponse:
+    """Asynchronously do DELETE request and according to parameters."""
+
+    return await afetch(url=url, method=HttpMethod.DELETE, headers=headers, silent=silent, timeout=timeout)
+
+
+async def apost(
+    url: str,
+    body=None,
+    headers: List[Dict[str, str]] = None,
+    silent: bool = True,
+    timeout: Union[float, Tuple[float, float]] = 10,
+) -> HttpResponse:
+    """Asynchronously do POST request and according to parameters."""
+
+    return await afetch(url=url, method=HttpMethod.POST, headers=headers, body=body, silent=silent, timeout=timeout)
+
+
+async def aput(
+    url: str,
+    body=None,
+    headers: List[Dict[str, str]] = None,
+    silent: bool = True,
+    timeout: Union[float, Tuple[float, float]] = 10,
+) -> HttpResponse:
+    """Asynchronously do PUT request and according to parameters."""
+
+    return await afetch(url=url, method=HttpMethod.PUT, headers=headers, body=body, silent=silent, timeout=timeout)
+
+
+async def apatch(
+    url: str,
+    body=None,
+    headers: List[Dict[str, str]] = None,
+    silent: bool = True,
+    timeout: Union[float, Tuple[float, float]] = 10,
+) -> HttpResponse:
+    """Asynchronously do PATCH request and according to parameters."""
+
+    return await afetch(url=url, method=HttpMethod.PATCH, headers=headers, body=body, silent=silent, timeout=timeout)
+
+
+async def agather(
+    *requests: Awaitable[HttpResponse], return_exceptions: bool = True
+) -> List[Union[HttpResponse, BaseException]]:
+    """Run all the specified fetch awaitables concurrently, and return their responses in the same order. The
+    concurrency is bounded by the in flight limits, regardless of how many awaitables are provided.
+    :param requests: the fetch awaitables (e.g: aget(url)) to be run.
+    :param return_exceptions: whether failed requests return their exception instead of cancelling the others.
+    """
+
+    return await asyncio.gather(*requests, return_exceptions=return_exceptions)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.fetch
+      @file: compression.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.enums.charset import Charset
+from hspylib.core.enums.enumeration import Enumeration
+from hspylib.core.preconditions import check_state
+from hspylib.modules.fetch.session_pool import PoolKey
+from threading import Lock
+from typing import Any, List, Optional, Set, Tuple
+
+import gzip
+import logging as log
+import urllib3.response
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Minimum request body size, in bytes, worth compressing.
+COMPRESSION_THRESHOLD: int = 1024
+
+
+class ContentEncoding(Enumeration):
+    """The http content encodings supported by fetch."""
+
+    # fmt: off
+    GZIP        = 'gzip'
+    DEFLATE     = 'deflate'
+    ZSTD        = 'zstd'
+    # fmt: on
+
+    @classmethod
+    def available(cls) -> List["ContentEncoding"]:
+        """Return the encodings the responses can be decoded from, the preferred one first. Zstd is only available
+        when the installed urllib3 can decode it (urllib3 2.x, with the zstandard package)."""
+        return ([cls.ZSTD] if getattr(urllib3.response, "HAS_ZSTD", False) else []) + [cls.GZIP, cls.DEFLATE]
+
+    @classmethod
+    def of_request(cls, compress: "bool | ContentEncoding | None") -> Optional["ContentEncoding"]:
+        """Return the encoding to compress request bodies with: gzip, when compress is True, since it is the one
+        servers accept; the specified encoding, to opt in to any other; or None, not to compress them."""
+        return cls.GZIP if compress is True else compress or None
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress the data using this encoding."""
+        match self:
+            case ContentEncoding.GZIP:
+                return gzip.compress(data, compresslevel=6)
+            case ContentEncoding.DEFLATE:
+                return zlib.compress(data, 6)
+            case ContentEncoding.ZSTD:
+                check_state(zstandard is not None, "Zstd compression requires the 'zstandard' package")
+                return zstandard.ZstdCompressor().compress(data)
+        raise ValueError(f"Unsupported content encoding: {self}")
+
+
+class TransferStats:
+    """Count the bytes of one call, both as sent/received over the wire and before/after (de)compression."""
+
+    def __init__(self, sent: int = 0, sent_wire: int = 0, received: int = 0, received_wire: int = 0) -> None:
+        self.sent = sent
+        self.sent_wire = sent_wire
+        self.received = received
+        self.received_wire = received_wire
+
+    def __str__(self) -> str:
+        return (
+            f"TransferStats(sent={self.sent}/{self.sent_wire}, received={self.received}/{self.received_wire}, "
+            f"saved={self.saved})"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def saved(self) -> int:
+        """Return how many bytes compression kept off the wire."""
+        return (self.sent - self.sent_wire) + (self.received - self.received_wire)
+
+
+_lock = Lock()
+
+# Hosts that answered 415 (Unsupported Media Type) to a compressed request body.
+_identity_hosts: Set[PoolKey] = set()
+
+
+def accept_encoding() -> str:
+    """Return the Accept-Encoding header value advertising all encodings that can be decoded."""
+    return ", ".join(map(str, ContentEncoding.available()))
+
+
+def compress_body(
+    url: str, body: Any, encoding: ContentEncoding, threshold: int = COMPRESSION_THRESHOLD
+) -> Tuple[Any, Optional[ContentEncoding]]:
+    """Compress the request body, when it is text or bytes larger than the threshold, and the url host accepts it.
+    :param url: the absolute url to be requested.
+    :param body: the request body.
+    :param encoding: the encoding to use.
+    :param threshold: the minimum body size, in bytes, worth compressing.
+    :return: the body to be sent, and the encoding used, or None if the body was not compressed.
+    """
+    if not isinstance(body, (str, bytes)):
+        return body, None
+    data = body.encode(Charset.UTF_8.val) if isinstance(body, str) else body
+    if len(data) < threshold:
+        return body, None
+    with _lock:
+        if PoolKey.of(url) in _identity_hosts:
+            return body, None
+    compressed = encoding.compress(data)
+    if len(compressed) >= len(data):
+        return body, None
+    return compressed, encoding
+
+
+def reject_compression(url: str) -> None:
+    """Stop compressing the request bodies sent to the url host."""
+    log.warning("Host does not accept compressed request bodies, sending them as is: %s", url)
+    with _lock:
+        _identity_hosts.add(PoolKey.of(url))
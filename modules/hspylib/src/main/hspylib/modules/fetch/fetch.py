@@ -12,31 +12,60 @@
 
    Copyright·(c)·2024,·HSPyLib
 """
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from hspylib.core.enums.charset import Charset
+from hspylib.core.enums.http_code import HttpCode
 from hspylib.core.enums.http_method import HttpMethod
+from hspylib.core.preconditions import check_argument
 from hspylib.core.tools.commons import sysout
+from hspylib.modules.fetch.compression import (
+    accept_encoding,
+    compress_body,
+    ContentEncoding,
+    reject_compression,
+    TransferStats,
+)
+from hspylib.modules.fetch.http_cache import HttpCache
 from hspylib.modules.fetch.http_response import HttpResponse
+from hspylib.modules.fetch.http_stream_response import HttpStreamResponse
+from hspylib.modules.fetch.rate_limiter import rate_limiter
+from hspylib.modules.fetch.retry_policy import RETRYABLE_EXS, RetryPolicy
+from hspylib.modules.fetch.session_pool import session_pool
 from hspylib.modules.fetch.uri_builder import UriBuilder
-from retry import retry
-from typing import Any, Dict, List, Tuple, Union
-from urllib3.exceptions import NewConnectionError
-from urllib.error import HTTPError
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import logging as log
+import os
 import requests
 import requests.exceptions as exs
+import time
+
+DOWNLOAD_PROGRESS_CB = Callable[[int, Optional[int]], None]
+
+# Maximum number of worker threads shared by all fetch_many batches.
+MAX_BATCH_WORKERS: int = 16
+
+# Maximum number of worker threads probing urls, apart from the fetch_many ones, so probes never queue behind batches.
+MAX_PROBE_WORKERS: int = 4
+
+# Retry policy used by the blocking and the asyncio fetch APIs, unless another one is specified.
+_retry_policy: RetryPolicy = RetryPolicy()
 
-RETRYABLE_EXS = (
-    NewConnectionError,
-    HTTPError,
-    exs.ConnectTimeout,
-    exs.ConnectionError,
-    exs.ReadTimeout,
-    exs.InvalidURL,
-    exs.InvalidSchema,
-)
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the default retry policy."""
+    return _retry_policy
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """Replace the default retry policy.
+    :param policy: the retry policy used by all requests not specifying one.
+    """
+    global _retry_policy  # pylint: disable=global-statement
+    _retry_policy = policy
 
 
-@retry(exceptions=RETRYABLE_EXS, tries=3, delay=1, backoff=3, max_delay=30, jitter=0.75)
 def fetch(
     url: str,
     method: HttpMethod = HttpMethod.GET,
@@ -44,7 +73,11 @@ def fetch(
     body: Any = None,
     silent: bool = True,
     timeout: Union[float, Tuple[float, float]] = 10,
-) -> HttpResponse:
+    stream: bool = False,
+    cache: HttpCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    compress: bool | ContentEncoding = False,
+) -> HttpResponse | HttpStreamResponse:
     """Do a request specified by method and according to parameters.
     :param url: The url to make the request.
     :param method: The http method to be used [ GET, HEAD, POST, PUT, PATCH, DELETE, OPTIONS ].
@@ -52,26 +85,128 @@ def fetch(
     :param body: The http request body (payload).
     :param silent: Omits all informational messages.
     :param timeout: How many seconds to wait for the server to send data or connect before giving up.
+    :param stream: Whether to return without reading the body, which must then be iterated (and closed).
+    :param cache: The http cache used to serve (and revalidate) GET requests. Not used when streaming.
+    :param retry_policy: The policy used to retry failed requests. Defaults to the one set by set_retry_policy.
+    :param compress: Whether to compress large request bodies, using gzip (or the specified encoding).
     :return:
     """
 
-    final_url = UriBuilder.ensure_scheme(url)
-    if not silent:
-        sysout(
-            f"Fetching: "
-            f"method={method} headers={headers if headers else '[]'} "
-            f"body={body if body else '{}'} url={final_url} ..."
+    policy = retry_policy or _retry_policy
+    encoding = ContentEncoding.of_request(compress)
+    if cache is not None and method == HttpMethod.GET and not stream:
+        return cache.get(
+            UriBuilder.ensure_scheme(url),
+            lambda validators: policy.call(
+                url, lambda: _request(url, method, [*(headers or []), validators], body, silent, timeout)
+            ),
+            {name: value for header in headers or [] for name, value in header.items()},
         )
 
-    all_headers = {}
-    if headers:
-        list(map(all_headers.update, headers))
+    return policy.call(url, lambda: _request(url, method, headers, body, silent, timeout, stream, True, encoding))
+
+
+class FetchSpec(NamedTuple):
+    """Describe one request of a fetch_many batch."""
+
+    method: HttpMethod
+    url: str
+    headers: Optional[List[Dict[str, str]]] = None
+    body: Any = None
+
+    @staticmethod
+    def of(spec: Union["FetchSpec", Tuple]) -> "FetchSpec":
+        """Create a fetch spec from a (method, url[, headers[, body]]) tuple. The method may be a name string."""
+        if isinstance(spec, FetchSpec):
+            return spec
+        method, *others = spec
+        return FetchSpec(method if isinstance(method, HttpMethod) else HttpMethod.value_of(method), *others)
 
-    response = requests.request(
-        url=final_url, method=method.name, headers=all_headers, data=body, timeout=timeout, verify=False
-    )
 
-    return HttpResponse.of(response)
+class FetchResult(NamedTuple):
+    """Hold the outcome of one request of a fetch_many batch. Either response or error is set."""
+
+    index: int
+    spec: FetchSpec
+    response: Optional[HttpResponse] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request was done, regardless of the response status code."""
+        return self.error is None
+
+    def get(self) -> HttpResponse:
+        """Return the response, or raise the error that prevented the request from being done."""
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+_batch_lock = Lock()
+
+_batch_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    """Return the executor shared by all fetch_many batches."""
+    global _batch_executor  # pylint: disable=global-statement
+    with _batch_lock:
+        if not _batch_executor:
+            _batch_executor = ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS, thread_name_prefix="fetch_many")
+        return _batch_executor
+
+
+def fetch_many(
+    requests_specs: Iterable[FetchSpec | Tuple],
+    max_workers: int = MAX_BATCH_WORKERS,
+    ordered: bool = True,
+    silent: bool = True,
+    timeout: Union[float, Tuple[float, float]] = 10,
+) -> Iterator[FetchResult]:
+    """Do all the specified requests concurrently, yielding their results. A failed request does not abort the
+    batch; its error is reported by the corresponding result instead.
+    :param requests_specs: the (method, url[, headers[, body]]) of the requests to be done.
+    :param max_workers: the maximum number of requests of this batch in flight.
+    :param ordered: whether to yield the results in input order, or as they complete.
+    :param silent: Omits all informational messages.
+    :param timeout: How many seconds to wait for the server to send data or connect before giving up.
+    """
+
+    def _fetch_one(index: int, spec: FetchSpec) -> FetchResult:
+        try:
+            response = fetch(spec.url, spec.method, spec.headers, spec.body, silent, timeout)
+            return FetchResult(index, spec, response=response)
+        except Exception as err:  # pylint: disable=broad-except
+            log.warning("Batch request %s %s failed => %s", spec.method, spec.url, err)
+            return FetchResult(index, spec, error=err)
+
+    check_argument(max_workers > 0, "Max workers must be positive: {}", max_workers)
+    executor = _get_batch_executor()
+    specs = enumerate(map(FetchSpec.of, requests_specs))
+    pending: Dict[Future, int] = {}
+    completed: Dict[int, FetchResult] = {}
+    next_index = 0
+
+    def _submit_next() -> None:
+        if (item := next(specs, None)) is not None:
+            pending[executor.submit(_fetch_one, *item)] = item[0]
+
+    for _ in range(max_workers):
+        _submit_next()
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            del pending[future]
+            _submit_next()
+            result: FetchResult = future.result()
+            if ordered:
+                completed[result.index] = result
+                while next_index in completed:
+                    yield completed.pop(next_index)
+                    next_index += 1
+            else:
+                yield result
 
 
 def head(
@@ -83,11 +218,15 @@ def head(
 
 
 def get(
-    url: str, headers: List[Dict[str, str]] = None, silent: bool = True, timeout: Union[float, Tuple[float, float]] = 10
+    url: str,
+    headers: List[Dict[str, str]] = None,
+    silent: bool = True,
+    timeout: Union[float, Tuple[float, float]] = 10,
+    cache: HttpCache | None = None,
 ) -> HttpResponse:
     """Do GET request and according to parameters."""
 
-    return fetch(url=url, headers=headers, silent=silent, timeout=timeout)
+    return fetch(url=url, headers=headers, silent=silent, timeout=timeout, cache=cache)
 
 
 def delete(
@@ -104,10 +243,13 @@ def post(
     headers: List[Dict[str, str]] = None,
     silent: bool = True,
     timeout: Union[float, Tuple[float, float]] = 10,
+    compress: bool | ContentEncoding = False,
 ) -> HttpResponse:
     """Do POST request and according to parameters."""
 
-    return fetch(url=url, method=HttpMethod.POST, headers=headers, body=body, silent=silent, timeout=timeout)
+    return fetch(
+        url=url, method=HttpMethod.POST, headers=headers, body=body, silent=silent, timeout=timeout, compress=compress
+    )
 
 
 def put(
@@ -116,10 +258,13 @@ def put(
     headers: List[Dict[str, str]] = None,
     silent: bool = True,
     timeout: Union[float, Tuple[float, float]] = 10,
+    compress: bool | ContentEncoding = False,
 ) -> HttpResponse:
     """Do PUT request and according to parameters."""
 
-    return fetch(url=url, method=HttpMethod.PUT, headers=headers, body=body, silent=silent, timeout=timeout)
+    return fetch(
+        url=url, method=HttpMethod.PUT, headers=headers, body=body, silent=silent, timeout=timeout, compress=compress
+    )
 
 
 def patch(
@@ -128,22 +273,209 @@ def patch(
     headers: List[Dict[str, str]] = None,
     silent: bool = True,
     timeout: Union[float, Tuple[float, float]] = 10,
+    compress: bool | ContentEncoding = False,
 ) -> HttpResponse:
     """Do PATCH request and according to parameters."""
 
-    return fetch(url=url, method=HttpMethod.PATCH, headers=headers, body=body, silent=silent, timeout=timeout)
+    return fetch(
+        url=url, method=HttpMethod.PATCH, headers=headers, body=body, silent=silent, timeout=timeout, compress=compress
+    )
 
 
-def is_reachable(urls: str | Tuple[str], timeout: Union[float, Tuple[float, float]] = 1) -> bool:
-    """Check if the specified url is reachable"""
-    reachable = True
+def _request(
+    url: str,
+    method: HttpMethod,
+    headers: List[Dict[str, str]] | None,
+    body: Any,
+    silent: bool,
+    timeout: Union[float, Tuple[float, float]],
+    stream: bool = False,
+    throttle: bool = True,
+    compress: ContentEncoding | None = None,
+) -> HttpResponse | HttpStreamResponse:
+    """Do a single request attempt (no retries) through the pooled sessions. Unless throttle is False, meaning that
+    the caller already waited for its rate limiter slot, the request is shaped by the rate limiter. Bodies are
+    compressed using the compress encoding, unless the host rejected compressed bodies before (415)."""
+
+    final_url = UriBuilder.ensure_scheme(url)
+    if throttle:
+        rate_limiter.acquire(final_url)
+    if not silent:
+        sysout(
+            f"Fetching: "
+            f"method={method} headers={headers if headers else '[]'} "
+            f"body={body if body else '{}'} url={final_url} ..."
+        )
+
+    all_headers = {"Accept-Encoding": accept_encoding()}
+    if headers:
+        list(map(all_headers.update, headers))
 
+    def _send(data: Any, encoding: ContentEncoding | None) -> requests.Response:
+        return session_pool.request(
+            url=final_url,
+            method=method.name,
+            headers={**all_headers, "Content-Encoding": str(encoding)} if encoding else all_headers,
+            data=data,
+            timeout=timeout,
+            verify=False,
+            stream=stream,
+        )
+
+    data, encoding = compress_body(final_url, body, compress) if compress else (body, None)
+    response = _send(data, encoding)
+    if encoding and response.status_code == HttpCode.UNSUPPORTED_MEDIA_TYPE.code:
+        response.close()
+        reject_compression(final_url)
+        data = body
+        response = _send(data, None)
+
+    result = HttpStreamResponse.of(response) if stream else HttpResponse.of(response)
+    result.transfer = TransferStats(_body_size(body), _body_size(data))
+    if not stream:
+        result.transfer.received = len(response.content)
+        result.transfer.received_wire = response.raw.tell() or result.transfer.received
+    rate_limiter.observe(final_url, result)
+
+    return result
+
+
+def _body_size(body: Any) -> int:
+    """Return the size, in bytes, of a text or binary request body. Other bodies are not accounted."""
+    if isinstance(body, str):
+        return len(body.encode(Charset.UTF_8.val))
+    return len(body) if isinstance(body, bytes) else 0
+
+
+def download(
+    url: str,
+    dest_path: str,
+    headers: List[Dict[str, str]] = None,
+    chunk_size: int = HttpStreamResponse.CHUNK_SIZE,
+    cb_progress: DOWNLOAD_PROGRESS_CB = None,
+    silent: bool = True,
+    timeout: Union[float, Tuple[float, float]] = 10,
+) -> int:
+    """Download the url body straight into the destination file, one chunk at a time. The file is only replaced
+    when the download succeeds.
+    :param url: The url to be downloaded.
+    :param dest_path: The path of the destination file.
+    :param headers: The http request headers.
+    :param chunk_size: The maximum number of bytes held in memory.
+    :param cb_progress: Callback invoked after each chunk with (bytes downloaded, total bytes or None if unknown).
+    :param silent: Omits all informational messages.
+    :param timeout: How many seconds to wait for the server to send data or connect before giving up.
+    :return: the number of bytes downloaded.
+    """
+
+    part_path, downloaded = f"{dest_path}.part", 0
+    with fetch(url, headers=headers, silent=silent, timeout=timeout, stream=True) as response:
+        if not response.status_code.is_2xx():
+            raise exs.HTTPError(f"{response.status_code} => Unable to download from={url}")
+        total = response.content_length
+        try:
+            with open(part_path, "wb") as f_part:
+                for chunk in response.iter_bytes(chunk_size):
+                    f_part.write(chunk)
+                    downloaded += len(chunk)
+                    if cb_progress:
+                        cb_progress(downloaded, total)
+            os.replace(part_path, dest_path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    log.debug("Downloaded %d bytes from %s into %s", downloaded, url, dest_path)
+    return downloaded
+
+
+class ProbeResult(NamedTuple):
+    """Hold the outcome of one reachability probe."""
+
+    url: str
+    reachable: bool
+    latency: float
+    status_code: Optional[int] = None
+    error: Optional[Exception] = None
+    checked_at: float = 0.0
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Whether this probe was done less than max_age seconds ago."""
+        return time.monotonic() - self.checked_at < max_age
+
+
+_probe_lock = Lock()
+
+# Last known reachability state of each probed url.
+_probes: Dict[str, ProbeResult] = {}
+
+_probe_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_probe_executor() -> ThreadPoolExecutor:
+    """Return the executor shared by all probes."""
+    global _probe_executor  # pylint: disable=global-statement
+    with _probe_lock:
+        if not _probe_executor:
+            _probe_executor = ThreadPoolExecutor(max_workers=MAX_PROBE_WORKERS, thread_name_prefix="probe")
+        return _probe_executor
+
+
+def _probe_one(url: str, timeout: Union[float, Tuple[float, float]]) -> ProbeResult:
+    """Probe the url (OPTIONS) and remember the outcome."""
+    started = time.monotonic()
     try:
-        if isinstance(urls, Tuple):
-            return all(is_reachable(UriBuilder.ensure_scheme(u)) for u in urls)
-        requests.options(url=UriBuilder.ensure_scheme(urls), timeout=timeout)
+        response = session_pool.request(method=HttpMethod.OPTIONS.name, url=url, timeout=timeout)
+        result = ProbeResult(url, True, time.monotonic() - started, response.status_code, None, time.monotonic())
     except RETRYABLE_EXS as err:
-        log.warning("URLs %s is not reachable => %s", urls, err)
-        reachable = False
+        log.warning("URL %s is not reachable => %s", url, err)
+        result = ProbeResult(url, False, time.monotonic() - started, None, err, time.monotonic())
+    with _probe_lock:
+        _probes[url] = result
+    return result
+
+
+def probe(
+    urls: str | Iterable[str],
+    timeout: Union[float, Tuple[float, float]] = 1,
+    fail_fast: bool = False,
+    max_age: float = 0,
+) -> List[ProbeResult]:
+    """Check, in parallel, whether the specified urls are reachable. Up to MAX_PROBE_WORKERS urls are probed at a
+    time, on workers not shared with fetch_many, so probing a few urls takes about one timeout, rather than one each.
+    :param urls: the url, or the urls, to be probed.
+    :param timeout: How many seconds to wait for the server to send data or connect before giving up.
+    :param fail_fast: whether to return as soon as one url is found unreachable. Then, only the probes completed so
+    far are returned; the others keep running, and their outcome is remembered.
+    :param max_age: how many seconds a previous probe outcome may be reused, instead of probing the url again.
+    :return: the probe results, in the same order of the urls.
+    """
+
+    urls = list(dict.fromkeys(map(UriBuilder.ensure_scheme, [urls] if isinstance(urls, str) else urls)))
+    results: Dict[str, ProbeResult] = {}
+    if max_age > 0:
+        with _probe_lock:
+            results = {u: r for u in urls if (r := _probes.get(u)) and r.is_fresh(max_age)}
+    executor = _get_probe_executor()
+    pending = {executor.submit(_probe_one, u, timeout) for u in urls if u not in results}
+    failed = fail_fast and any(not r.reachable for r in results.values())
+    while pending and not failed:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            result = future.result()
+            results[result.url] = result
+            failed = failed or (fail_fast and not result.reachable)
+
+    return [results[u] for u in urls if u in results]
+
+
+def is_reachable(
+    urls: str | Iterable[str], timeout: Union[float, Tuple[float, float]] = 1, max_age: float = 0
+) -> bool:
+    """Check if all the specified urls are reachable. The urls are probed in parallel.
+    :param urls: the url, or the urls, to be checked.
+    :param timeout: How many seconds to wait for the server to send data or connect before giving up.
+    :param max_age: how many seconds a previous probe outcome may be reused, instead of probing the url again.
+    """
 
-    return reachable
+    return all(r.reachable for r in probe(urls, timeout, fail_fast=True, max_age=max_age))
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.fetch
+      @file: http_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from collections import OrderedDict
+from hspylib.core.enums.charset import Charset
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.core.preconditions import check_argument
+from hspylib.core.tools.commons import safe_delete_file
+from hspylib.modules.fetch.http_response import HttpResponse
+from requests.structures import CaseInsensitiveDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import hashlib
+import json
+import logging as log
+import os
+import time
+
+REVALIDATE_FN = Callable[[Dict[str, str]], HttpResponse]
+
+
+def vary_names(headers: Mapping[str, str]) -> List[str]:
+    """Return the request header names listed by the Vary header of the response, lower cased."""
+    return [name for name in map(str.strip, (headers.get("Vary") or "").lower().split(",")) if name]
+
+
+class CachedResponse:
+    """A cached HTTP response, along with its freshness and validators."""
+
+    @staticmethod
+    def of(response: HttpResponse, max_age: int, request_headers: Mapping[str, str]) -> "CachedResponse":
+        """Create a cache entry from a fresh 200 response, and the headers of the request it answered."""
+        headers = CaseInsensitiveDict(response.headers or {})
+        vary = {name: request_headers.get(name) for name in vary_names(headers)}
+        return CachedResponse(
+            response.url, dict(headers), response.body, str(response.encoding), time.time() + max_age, vary
+        )
+
+    @staticmethod
+    def from_dict(entry: Dict[str, Any]) -> "CachedResponse":
+        """Create a cache entry from its on-disk (dict) representation."""
+        return CachedResponse(
+            entry["url"], entry["headers"], entry["body"], entry["encoding"], entry["expires"], entry.get("vary", {})
+        )
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[str],
+        encoding: str,
+        expires: float,
+        vary: Optional[Dict[str, Optional[str]]] = None,
+    ):
+        self.url = url
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+        self.encoding = encoding
+        self.expires = expires
+        self.vary = vary or {}
+
+    def __str__(self) -> str:
+        return f"CachedResponse(url={self.url}, etag={self.etag}, expires={self.expires})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+    def matches(self, request_headers: Mapping[str, str]) -> bool:
+        """Whether this entry may answer a request with the headers: the ones named by the response Vary header must
+        have the values of the request that was cached."""
+        return all(request_headers.get(name) == value for name, value in self.vary.items())
+
+    def is_fresh(self) -> bool:
+        """Whether the entry may be served without revalidating it with the server."""
+        return time.time() < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Return the conditional request headers able to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> HttpResponse:
+        """Create an HTTP response out of this entry."""
+        return HttpResponse(
+            HttpMethod.GET,
+            self.url,
+            HttpCode.OK,
+            CaseInsensitiveDict(self.headers),
+            self.body,
+            Charset.of_value(self.encoding),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the on-disk (dict) representation of this entry."""
+        return {
+            "url": self.url,
+            "headers": dict(self.headers),
+            "body": self.body,
+            "encoding": self.encoding,
+            "expires": self.expires,
+            "vary": self.vary,
+        }
+
+
+class HttpCache:
+    """Opt-in cache of GET responses. Entries are kept in a bounded in-memory LRU and, optionally, in a directory
+    that survives process restarts. Cache-Control max-age and no-store are honored, and stale entries carrying an
+    ETag or Last-Modified are revalidated, so a 304 (Not Modified) is served from the cache.
+
+    Since the cache may be shared, and persisted, it never stores responses to requests carrying credentials
+    (Authorization), nor private (Cache-Control: private) ones. An entry only answers requests whose headers named
+    by the response Vary header match the cached request ones; Vary: * responses are not stored.
+    """
+
+    def __init__(self, max_entries: int = 256, cache_dir: str | None = None, default_max_age: int = 0) -> None:
+        check_argument(max_entries > 0, "Max entries must be positive: {}", max_entries)
+        self._lock = Lock()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._max_entries = max_entries
+        self._cache_dir = cache_dir
+        self._default_max_age = default_max_age
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __str__(self) -> str:
+        return f"HttpCache(entries={len(self)}, {', '.join(f'{k}={v}' for k, v in self.stats().items())})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return self._lookup(url) is not None
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache hit/miss counters. Revalidated (304) responses are also accounted as hits."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.evictions,
+        }
+
+    def get(self, url: str, do_request: REVALIDATE_FN, headers: Optional[Mapping[str, str]] = None) -> HttpResponse:
+        """Return the cached response of the url, requesting (or revalidating) it from the server if needed.
+        :param url: the absolute url of the GET request.
+        :param do_request: the function doing the request, given the extra (conditional) headers to send.
+        :param headers: the request headers.
+        """
+        request_headers = CaseInsensitiveDict(headers or {})
+        if "Authorization" in request_headers:
+            self._count("misses")
+            return do_request({})
+        if (entry := self._lookup(url)) and not entry.matches(request_headers):
+            entry = None
+        if entry and entry.is_fresh():
+            self._count("hits")
+            return entry.to_response()
+        response = do_request(entry.validators() if entry else {})
+        if entry and response.status_code == HttpCode.NOT_MODIFIED:
+            self._count("hits", "revalidated")
+            entry.expires = time.time() + self._max_age(CaseInsensitiveDict(response.headers or {}))
+            self._store(url, entry)
+            return entry.to_response()
+        self._count("misses")
+        if response.status_code == HttpCode.OK:
+            self.put(url, response, request_headers)
+        return response
+
+    def put(self, url: str, response: HttpResponse, headers: Optional[Mapping[str, str]] = None) -> bool:
+        """Store the response, when it is cacheable.
+        :param url: the absolute url of the GET request.
+        :param response: the response to be cached.
+        :param headers: the headers of the request the response answered.
+        :return: whether the response was cached.
+        """
+        request_headers = CaseInsensitiveDict(headers or {})
+        response_headers = CaseInsensitiveDict(response.headers or {})
+        cache_control = self._cache_control(response_headers)
+        if "Authorization" in request_headers or "no-store" in cache_control or "private" in cache_control:
+            return False
+        if "*" in vary_names(response_headers):
+            return False
+        max_age = self._max_age(response_headers)
+        if max_age <= 0 and not ("ETag" in response_headers or "Last-Modified" in response_headers):
+            return False
+        self._store(url, CachedResponse.of(response, max_age, request_headers))
+        return True
+
+    def invalidate(self, url: str) -> None:
+        """Remove the cached response of the url."""
+        with self._lock:
+            self._entries.pop(url, None)
+        if self._cache_dir:
+            safe_delete_file(self._disk_path(url))
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            urls = list(self._entries.keys())
+            self._entries.clear()
+        if self._cache_dir:
+            for name in filter(lambda n: n.endswith((".json", ".tmp")), os.listdir(self._cache_dir)):
+                safe_delete_file(f"{self._cache_dir}/{name}")
+        log.debug("Http cache cleared: %d entries removed from memory", len(urls))
+
+    def _count(self, *counters: str) -> None:
+        """Increment the specified counters."""
+        with self._lock:
+            for counter in counters:
+                setattr(self, counter, getattr(self, counter) + 1)
+
+    def _lookup(self, url: str) -> Optional[CachedResponse]:
+        """Find the cached response of the url, first in memory, then on disk."""
+        with self._lock:
+            if entry := self._entries.get(url):
+                self._entries.move_to_end(url)
+                return entry
+        if self._cache_dir and os.path.exists(path := self._disk_path(url)):
+            try:
+                with open(path, encoding=Charset.UTF_8.val) as f_entry:
+                    entry = CachedResponse.from_dict(json.load(f_entry))
+                self._remember(url, entry)
+                return entry
+            except (OSError, ValueError, KeyError) as err:
+                log.warning("Discarding unreadable http cache entry %s => %s", path, err)
+                safe_delete_file(path)
+        return None
+
+    def _store(self, url: str, entry: CachedResponse) -> None:
+        """Store the entry in memory, and on disk if enabled."""
+        self._remember(url, entry)
+        if self._cache_dir:
+            path = self._disk_path(url)
+            with open(f"{path}.tmp", "w", encoding=Charset.UTF_8.val) as f_entry:
+                json.dump(entry.as_dict(), f_entry)
+            os.replace(f"{path}.tmp", path)
+
+    def _remember(self, url: str, entry: CachedResponse) -> None:
+        """Keep the entry in the in-memory LRU, evicting the least recently used ones."""
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _disk_path(self, url: str) -> str:
+        """Return the on-disk path of the url entry."""
+        return f"{self._cache_dir}/{hashlib.sha256(url.encode(Charset.UTF_8.val)).hexdigest()}.json"
+
+    def _max_age(self, headers: Dict[str, str]) -> int:
+        """Return the freshness lifetime set by the Cache-Control header, or the default one."""
+        cache_control = self._cache_control(headers)
+        if "no-cache" in cache_control:
+            return 0
+        try:
+            return int(cache_control.get("max-age", self._default_max_age))
+        except ValueError:
+            return self._default_max_age
+
+    @staticmethod
+    def _cache_control(headers: Dict[str, str]) -> Dict[str, str]:
+        """Parse the Cache-Control header directives."""
+        directives = {}
+        for directive in (headers.get("Cache-Control") or "").split(","):
+            if name := directive.strip().lower():
+                key, _, value = name.partition("=")
+                directives[key.strip()] = value.strip().strip('"')
+        return directives
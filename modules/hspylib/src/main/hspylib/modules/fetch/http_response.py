@@ -16,6 +16,7 @@ from hspylib.core.enums.charset import Charset
 from hspylib.core.enums.content_type import ContentType
 from hspylib.core.enums.http_code import HttpCode
 from hspylib.core.enums.http_method import HttpMethod
+from hspylib.modules.fetch.compression import TransferStats
 from requests.models import CaseInsensitiveDict, Response
 from typing import Optional
 
@@ -52,6 +53,7 @@ class HttpResponse:
         self.headers = headers
         self.encoding = encoding
         self.content_type = content_type
+        self.transfer: Optional[TransferStats] = None
         if self.content_type:
             self.content_type.charset = self.encoding
 
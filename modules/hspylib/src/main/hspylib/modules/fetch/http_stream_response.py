@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.fetch
+      @file: http_stream_response.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.enums.charset import Charset
+from hspylib.core.enums.content_type import ContentType
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.core.preconditions import check_state
+from hspylib.modules.fetch.http_response import HttpResponse
+from requests.models import CaseInsensitiveDict, Response
+from typing import Iterator, Optional
+
+
+class HttpStreamResponse(HttpResponse):
+    """Class that represents an HTTP status whose body was not read yet. The body is consumed, only once, by
+    iterating over its chunks or lines, so the memory used does not depend on the payload size."""
+
+    # Default size of the body chunks.
+    CHUNK_SIZE: int = 64 * 1024
+
+    @staticmethod
+    def of(response: Response) -> "HttpStreamResponse":
+        """Create a streamed HTTP status based on a Requests.Response object (requested with stream=True)."""
+        return HttpStreamResponse(
+            response,
+            HttpMethod.value_of(response.request.method),
+            response.url,
+            HttpCode.of(response.status_code),
+            response.headers,
+            Charset.of_value(response.encoding.lower()) if response.encoding else Charset.UTF_8,
+        )
+
+    def __init__(
+        self,
+        response: Response,
+        method: HttpMethod,
+        url: str,
+        status_code: HttpCode,
+        headers: CaseInsensitiveDict = None,
+        encoding: Charset = Charset.UTF_8,
+        content_type=ContentType.APPLICATION_JSON,
+    ):
+        super().__init__(method, url, status_code, headers, None, encoding, content_type)
+        self._response = response
+        self._consumed = False
+
+    def __enter__(self) -> "HttpStreamResponse":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Return the body size announced by the server, if any."""
+        length = self.headers.get("Content-Length") if self.headers else None
+        return int(length) if length and length.isdigit() else None
+
+    @property
+    def consumed(self) -> bool:
+        return self._consumed
+
+    def iter_bytes(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the body chunks, decompressed as they arrive. The connection is released when the body is
+        exhausted.
+        :param chunk_size: the maximum size of each chunk.
+        """
+        check_state(not self._consumed, "The response body was already consumed: {}", self.url)
+        self._consumed = True
+        try:
+            for chunk in self._response.iter_content(chunk_size=chunk_size):
+                if self.transfer:
+                    self.transfer.received += len(chunk)
+                    self.transfer.received_wire = self._response.raw.tell() or self.transfer.received
+                yield chunk
+        finally:
+            self.close()
+
+    def iter_lines(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        """Iterate over the body lines, decoded using the response encoding.
+        :param chunk_size: the size of the chunks read to find the lines.
+        """
+        pending = b""
+        for chunk in self.iter_bytes(chunk_size):
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r").decode(str(self.encoding))
+        if pending:
+            yield pending.rstrip(b"\r").decode(str(self.encoding))
+
+    def close(self) -> None:
+        """Release the connection back to the pool. Any unread body is discarded."""
+        self._response.close()
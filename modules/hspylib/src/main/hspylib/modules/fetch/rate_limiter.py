@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.fetch
+      @file: rate_limiter.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from email.utils import parsedate_to_datetime
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.preconditions import check_argument
+from hspylib.modules.fetch.http_response import HttpResponse
+from hspylib.modules.fetch.session_pool import PoolKey
+from threading import Lock
+from typing import Any, Dict, Optional
+
+import logging as log
+import time
+
+
+class TokenBucket:
+    """Shape requests to a sustained rate, allowing bursts of up to burst requests. Requests beyond the available
+    tokens are not rejected; each one reserves the next free slot, so callers are spaced evenly at the rate."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        check_argument(rate > 0, "Rate must be positive: {}", rate)
+        check_argument(burst > 0, "Burst must be positive: {}", burst)
+        self._lock = Lock()
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self.waited = 0.0
+        self.throttled = 0
+
+    def __str__(self) -> str:
+        return f"TokenBucket(rate={self._rate}/s, burst={self._burst}, tokens={self.tokens:.2f})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return self._burst
+
+    @property
+    def tokens(self) -> float:
+        """Return the available tokens. A negative number means that slots are already reserved ahead."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before sending its request."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(-self._tokens / self._rate, 0.0)
+            self.waited += delay
+            return delay
+
+    def acquire(self) -> float:
+        """Block until the caller may send its request.
+        :return: the seconds waited.
+        """
+        if (delay := self.reserve()) > 0:
+            time.sleep(delay)
+        return delay
+
+    def block(self, seconds: float) -> None:
+        """Hold all requests for the specified seconds, as told by the server (Retry-After). The held requests are
+        resumed one at a time, at the bucket rate, instead of all at once."""
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            if now + seconds > self._blocked_until:
+                self._refill(now)
+                self._blocked_until = now + seconds
+                self._tokens = min(self._tokens, 1.0) - seconds * self._rate
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill. Must hold the lock."""
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class RateLimiter(metaclass=Singleton):
+    """Provide client-side rate limits, attached to hosts or url prefixes. A request is shaped by the bucket of the
+    longest matching prefix. A server answering 429 (Too Many Requests) or 503 (Service Unavailable) with a
+    Retry-After header holds the further requests to that host, limited or not, for the time it asked for."""
+
+    # Maximum seconds honored from a Retry-After header.
+    MAX_RETRY_AFTER: float = 120.0
+
+    # Status codes whose Retry-After header is honored.
+    THROTTLE_CODES = (HttpCode.TOO_MANY_REQUESTS, HttpCode.SERVICE_UNAVAILABLE)
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._limits: Dict[str, TokenBucket] = {}
+        self._held: Dict[PoolKey, float] = {}
+
+    def __str__(self) -> str:
+        return f"RateLimiter(limits={list(self._limits.keys())})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def limit(self, prefix: str, rate: float, burst: int = 1) -> TokenBucket:
+        """Limit the requests to the urls starting with the prefix. The scheme is ignored, so a prefix such as
+        'localhost:8080' or 'api.github.com/repos' matches both http and https urls. A prefix only matches whole
+        hosts, ports and path segments: 'localhost:80' does not match 'localhost:8080', nor 'api.github.com' match
+        'api.github.com.evil.com'.
+        :param prefix: the host or url prefix to be limited.
+        :param rate: the sustained number of requests per second.
+        :param burst: the number of requests that may be sent at once, after being idle.
+        """
+        bucket = TokenBucket(rate, burst)
+        with self._lock:
+            self._limits[self._normalize(prefix)] = bucket
+        return bucket
+
+    def unlimit(self, prefix: str) -> None:
+        """Remove the limit of the prefix."""
+        with self._lock:
+            self._limits.pop(self._normalize(prefix), None)
+
+    def clear(self) -> None:
+        """Remove all limits and forget all Retry-After holds."""
+        with self._lock:
+            self._limits.clear()
+            self._held.clear()
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        """Return the bucket of the longest prefix matching the url, if any."""
+        target = self._normalize(url)
+        with self._lock:
+            matches = [p for p in self._limits if self._matches(target, p)]
+            return self._limits[max(matches, key=len)] if matches else None
+
+    def reserve(self, url: str) -> float:
+        """Reserve a slot to request the url.
+        :param url: the absolute url to be requested.
+        :return: the seconds to wait before sending the request.
+        """
+        delay = bucket.reserve() if (bucket := self.bucket(url)) else 0.0
+        with self._lock:
+            held_until = self._held.get(PoolKey.of(url), 0.0)
+        return max(delay, held_until - time.monotonic())
+
+    def acquire(self, url: str) -> float:
+        """Block until the url may be requested.
+        :param url: the absolute url to be requested.
+        :return: the seconds waited.
+        """
+        if (delay := self.reserve(url)) > 0:
+            log.debug("Rate limited, waiting %.3f seconds to request: %s", delay, url)
+            time.sleep(delay)
+        return delay
+
+    def observe(self, url: str, response: HttpResponse) -> None:
+        """Honor the Retry-After header of throttled responses.
+        :param url: the absolute url requested.
+        :param response: the server response.
+        """
+        if response.status_code not in self.THROTTLE_CODES or not response.headers:
+            return
+        if (seconds := self.retry_after(response.headers.get("Retry-After"))) is None:
+            return
+        log.warning("%s requesting %s, holding requests for %.1f seconds", response.status_code, url, seconds)
+        if bucket := self.bucket(url):
+            bucket.block(seconds)
+        with self._lock:
+            key = PoolKey.of(url)
+            self._held[key] = max(self._held.get(key, 0.0), time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return a snapshot of the limits."""
+        with self._lock:
+            limits = dict(self._limits)
+        return {
+            p: {"rate": b.rate, "burst": b.burst, "tokens": b.tokens, "waited": b.waited, "throttled": b.throttled}
+            for p, b in limits.items()
+        }
+
+    @classmethod
+    def retry_after(cls, value: str | None) -> Optional[float]:
+        """Parse a Retry-After header value, either delay seconds or an HTTP date, capped to MAX_RETRY_AFTER."""
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), cls.MAX_RETRY_AFTER)
+
+    @staticmethod
+    def _matches(target: str, prefix: str) -> bool:
+        """Whether the normalized url starts with the prefix, ending at a boundary of the url."""
+        if not target.startswith(prefix):
+            return False
+        return len(target) == len(prefix) or prefix[-1:] in ("/", "?", "#") or target[len(prefix)] in "/?#"
+
+    @staticmethod
+    def _normalize(url: str) -> str:
+        """Return the url without its scheme, in lowercase."""
+        url = url.lower()
+        return url.split("://", 1)[1] if "://" in url else url
+
+
+assert (rate_limiter := RateLimiter().INSTANCE) is not None
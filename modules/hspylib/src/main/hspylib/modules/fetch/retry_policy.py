@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.fetch
+      @file: retry_policy.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.enums.enumeration import Enumeration
+from hspylib.core.preconditions import check_argument
+from hspylib.modules.fetch.http_response import HttpResponse
+from hspylib.modules.fetch.session_pool import PoolKey
+from hspylib.modules.fetch.uri_builder import UriBuilder
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Iterator, Tuple, Type, TypeVar
+from urllib3.exceptions import NewConnectionError
+from urllib.error import HTTPError
+
+import asyncio
+import logging as log
+import requests.exceptions as exs
+import time
+
+R = TypeVar("R")
+
+RETRYABLE_EXS = (
+    NewConnectionError,
+    HTTPError,
+    exs.ConnectTimeout,
+    exs.ConnectionError,
+    exs.ReadTimeout,
+    exs.InvalidURL,
+    exs.InvalidSchema,
+)
+
+
+class CircuitOpenError(exs.ConnectionError):
+    """Raised, without reaching the server, when the circuit of the requested host is open."""
+
+
+class CircuitState(Enumeration):
+    """The states of a circuit breaker."""
+
+    # fmt: off
+    CLOSED      = 'closed'
+    OPEN        = 'open'
+    HALF_OPEN   = 'half-open'
+    # fmt: on
+
+
+class CircuitBreaker:
+    """Track the failures of one host. After failure_threshold consecutive failures the circuit opens and requests
+    fail fast. Once reset_timeout seconds have elapsed, the circuit becomes half-open and lets a single probe
+    request through: its success closes the circuit, and its failure opens it again."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self._lock = Lock()
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._rejected = 0
+
+    def __str__(self) -> str:
+        return f"CircuitBreaker(name={self._name}, state={self.state}, failures={self._failures})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent to the host now."""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Account a successful request; it closes the circuit."""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                log.info("Circuit of %s is now closed", self._name)
+            self._state, self._failures, self._probing = CircuitState.CLOSED, 0, False
+
+    def record_failure(self) -> None:
+        """Account a failed request; it may open the circuit."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self._failure_threshold:
+                if self._state != CircuitState.OPEN:
+                    log.warning("Circuit of %s is now open after %d failures", self._name, self._failures)
+                self._state, self._opened_at, self._probing = CircuitState.OPEN, time.monotonic(), False
+
+    def release(self) -> None:
+        """Let another probe through, when a request ended without telling whether the host recovered."""
+        with self._lock:
+            self._probing = False
+
+    def reset(self) -> None:
+        """Close the circuit, forgetting all failures."""
+        with self._lock:
+            self._state, self._failures, self._probing, self._rejected = CircuitState.CLOSED, 0, False, 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current state of this circuit."""
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": str(state),
+                "failures": self._failures,
+                "rejected": self._rejected,
+                "retry_in": (
+                    max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+                    if state == CircuitState.OPEN
+                    else 0.0
+                ),
+            }
+
+    def _current_state(self) -> CircuitState:
+        """Return the state, moving from open to half-open when the reset timeout elapsed. Must hold the lock."""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+
+class RetryBudget:
+    """A token bucket shared by all retries. Each retry takes one token, and tokens are refilled at a constant
+    rate, so the retries can't amplify the load sent to a recovering server beyond that rate."""
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        self._lock = Lock()
+        self._capacity = capacity
+        self._refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def __str__(self) -> str:
+        return f"RetryBudget(tokens={self.tokens:.2f}/{self._capacity}, refill_rate={self._refill_rate}/s)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self) -> bool:
+        """Take one retry token, if available."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill. Must hold the lock."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._refill_rate)
+        self._updated_at = now
+
+
+class RetryPolicy:
+    """Retry failed requests with exponential backoff, guarded by a per-host circuit breaker and a shared retry
+    budget. Requests to a host whose circuit is open fail fast with CircuitOpenError. Only connection errors and
+    timeouts count as host failures, unless trip_on_server_errors is set: then server error responses (5xx) count
+    as well, so callers may get CircuitOpenError instead of the 5xx responses they would otherwise handle."""
+
+    # fmt: off
+    DEFAULT_TRIES: int                  = 3
+    DEFAULT_DELAY: float                = 1
+    DEFAULT_BACKOFF: float              = 3
+    DEFAULT_MAX_DELAY: float            = 30
+    DEFAULT_JITTER: float               = 0.75
+    DEFAULT_FAILURE_THRESHOLD: int      = 5
+    DEFAULT_RESET_TIMEOUT: float        = 30
+    DEFAULT_BUDGET_CAPACITY: float      = 20
+    DEFAULT_BUDGET_REFILL_RATE: float   = 2
+    # fmt: on
+
+    def __init__(
+        self,
+        tries: int = DEFAULT_TRIES,
+        delay: float = DEFAULT_DELAY,
+        backoff: float = DEFAULT_BACKOFF,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        budget: RetryBudget | None = None,
+        exceptions: Tuple[Type[Exception], ...] = RETRYABLE_EXS,
+        trip_on_server_errors: bool = False,
+    ) -> None:
+        check_argument(tries > 0, "Tries must be positive: {}", tries)
+        check_argument(failure_threshold > 0, "Failure threshold must be positive: {}", failure_threshold)
+        self._lock = Lock()
+        self._tries = tries
+        self._delay = delay
+        self._backoff = backoff
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._budget = budget or RetryBudget(self.DEFAULT_BUDGET_CAPACITY, self.DEFAULT_BUDGET_REFILL_RATE)
+        self._exceptions = exceptions
+        self._trip_on_server_errors = trip_on_server_errors
+        self._breakers: Dict[PoolKey, CircuitBreaker] = {}
+
+    def __str__(self) -> str:
+        return f"RetryPolicy(tries={self._tries}, delay={self._delay}, backoff={self._backoff}, {self._budget})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def budget(self) -> RetryBudget:
+        return self._budget
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Return the circuit breaker of the url host."""
+        key = PoolKey.of(UriBuilder.ensure_scheme(url))
+        with self._lock:
+            if not (breaker := self._breakers.get(key)):
+                breaker = CircuitBreaker(str(key), self._failure_threshold, self._reset_timeout)
+                self._breakers[key] = breaker
+            return breaker
+
+    def circuits(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of all known host circuits."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.name: b.snapshot() for b in breakers}
+
+    def tripped(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of the host circuits that are not closed."""
+        return {name: c for name, c in self.circuits().items() if c["state"] != str(CircuitState.CLOSED)}
+
+    def reset(self) -> None:
+        """Forget all host circuits."""
+        with self._lock:
+            self._breakers.clear()
+
+    def delays(self) -> Iterator[float]:
+        """Yield the delays to wait before each retry."""
+        delay = self._delay
+        for _ in range(self._tries - 1):
+            yield delay
+            delay = min(delay * self._backoff + self._jitter, self._max_delay)
+
+    def call(self, url: str, do_request: Callable[[], R]) -> R:
+        """Do the request, retrying it according to this policy.
+        :param url: the requested url.
+        :param do_request: the function doing a single request attempt.
+        """
+        breaker, delays = self.breaker(url), self.delays()
+        while True:
+            self._check_circuit(breaker, url)
+            try:
+                return self._on_success(breaker, do_request())
+            except self._exceptions as err:
+                breaker.record_failure()
+                delay = self._next_delay(delays, err, url)
+            except BaseException:  # Cancellations and interruptions must not hold the half-open probe either.
+                breaker.release()
+                raise
+            time.sleep(delay)
+
+    async def acall(self, url: str, do_request: Callable[[], Awaitable[R]]) -> R:
+        """Do the request, retrying it according to this policy, without blocking the event loop.
+        :param url: the requested url.
+        :param do_request: the coroutine function doing a single request attempt.
+        """
+        breaker, delays = self.breaker(url), self.delays()
+        while True:
+            self._check_circuit(breaker, url)
+            try:
+                return self._on_success(breaker, await do_request())
+            except self._exceptions as err:
+                breaker.record_failure()
+                delay = self._next_delay(delays, err, url)
+            except BaseException:  # Cancellations and interruptions must not hold the half-open probe either.
+                breaker.release()
+                raise
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _check_circuit(breaker: CircuitBreaker, url: str) -> None:
+        """Fail fast if the circuit of the url host is open."""
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit of {breaker.name} is open, not requesting: {url}")
+
+    def _on_success(self, breaker: CircuitBreaker, response: R) -> R:
+        """Account the request outcome. Server errors (5xx) are returned to the caller; they only count as host
+        failures when trip_on_server_errors is set."""
+        if self._trip_on_server_errors and self._is_server_error(response):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    @staticmethod
+    def _is_server_error(response: Any) -> bool:
+        return isinstance(response, HttpResponse) and bool(response.status_code) and response.status_code.is_5xx()
+
+    def _next_delay(self, delays: Iterator[float], err: Exception, url: str) -> float:
+        """Return the delay before the next retry, or raise the error if it may not be retried."""
+        if (delay := next(delays, None)) is None:
+            raise err
+        if not self._budget.try_acquire():
+            log.warning("Retry budget exhausted, not retrying: %s => %s", url, err)
+            raise err
+        log.warning("%s: %s requesting %s, retrying in %s seconds...", err.__class__.__qualname__, err, url, delay)
+        return delay
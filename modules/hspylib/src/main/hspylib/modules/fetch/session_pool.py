@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   @package: hspylib.modules.fetch
+      @file: session_pool.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from contextlib import contextmanager
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.preconditions import check_argument
+from requests.adapters import HTTPAdapter
+from threading import Lock
+from typing import Any, Dict, Iterator, NamedTuple
+from urllib.parse import urlsplit
+
+import logging as log
+import requests
+import time
+
+
+class PoolKey(NamedTuple):
+    """Identify a keep-alive connection pool."""
+
+    scheme: str
+    host: str
+    port: int
+
+    @staticmethod
+    def of(url: str) -> "PoolKey":
+        """Create a pool key from the specified (absolute) url."""
+        parts = urlsplit(url)
+        scheme = (parts.scheme or "http").lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        return PoolKey(scheme, (parts.hostname or "localhost").lower(), port)
+
+    def __str__(self) -> str:
+        return f"{self.scheme}://{self.host}:{self.port}"
+
+
+class PooledSession:
+    """A requests session bound to a single (scheme, host, port) connection pool."""
+
+    def __init__(self, key: PoolKey, pool_size: int) -> None:
+        self.key = key
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount(f"{key.scheme}://", adapter)
+        self.last_used = time.monotonic()
+        self.in_flight = 0
+
+    def __str__(self) -> str:
+        return f"PooledSession(key={self.key}, in_flight={self.in_flight})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def is_idle(self, now: float, idle_timeout: float) -> bool:
+        """Whether this session was not used for longer than the idle timeout."""
+        return self.in_flight == 0 and now - self.last_used > idle_timeout
+
+    def close(self) -> None:
+        """Close the session and all of its pooled connections."""
+        self.session.close()
+
+
+class SessionPool(metaclass=Singleton):
+    """Provide a thread-safe registry of keep-alive HTTP sessions, one per (scheme, host, port). Sessions not used
+    for longer than the idle timeout are closed and recreated on demand."""
+
+    # Maximum number of connections kept alive for each host.
+    DEFAULT_POOL_SIZE: int = 10
+
+    # Seconds a host pool may stay unused before its connections are closed.
+    DEFAULT_IDLE_TIMEOUT: float = 60.0
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        self._lock = Lock()
+        self._sessions: Dict[PoolKey, PooledSession] = {}
+        self._pool_size = pool_size
+        self._idle_timeout = idle_timeout
+        self._created = 0
+
+    def __str__(self) -> str:
+        return (
+            f"SessionPool(pool_size={self._pool_size}, idle_timeout={self._idle_timeout}, "
+            f"sessions={len(self._sessions)})"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    @property
+    def idle_timeout(self) -> float:
+        return self._idle_timeout
+
+    @property
+    def created(self) -> int:
+        """Return how many host sessions were created since the pool was started."""
+        return self._created
+
+    def configure(self, pool_size: int | None = None, idle_timeout: float | None = None) -> None:
+        """Change the pool settings. Existing sessions are closed, so the new settings take effect immediately.
+        :param pool_size: the maximum number of keep-alive connections per host.
+        :param idle_timeout: the seconds a host pool may stay unused before being closed.
+        """
+        check_argument(pool_size is None or pool_size > 0, "Pool size must be positive: {}", pool_size)
+        check_argument(idle_timeout is None or idle_timeout >= 0, "Idle timeout can't be negative: {}", idle_timeout)
+        with self._lock:
+            self._pool_size = pool_size or self._pool_size
+            self._idle_timeout = self._idle_timeout if idle_timeout is None else idle_timeout
+        self.close()
+
+    @contextmanager
+    def lease(self, url: str) -> Iterator[requests.Session]:
+        """Lease the session that serves the specified url. The session is not evicted while leased.
+        :param url: the absolute url to be requested.
+        """
+        key = PoolKey.of(url)
+        with self._lock:
+            self._evict_idle()
+            if not (pooled := self._sessions.get(key)):
+                pooled = PooledSession(key, self._pool_size)
+                self._sessions[key] = pooled
+                self._created += 1
+                log.debug("Created a new pooled session for: %s", key)
+            pooled.in_flight += 1
+        try:
+            yield pooled.session
+        finally:
+            with self._lock:
+                pooled.in_flight -= 1
+                pooled.last_used = time.monotonic()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the session pooled for the url host.
+        :param method: the http method name.
+        :param url: the absolute url to be requested.
+        :param kwargs: any other argument accepted by requests.Session.request.
+        """
+        with self.lease(url) as session:
+            return session.request(method=method, url=url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled sessions."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        list(map(PooledSession.close, sessions))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the pooled sessions."""
+        with self._lock:
+            return {
+                "pool_size": self._pool_size,
+                "idle_timeout": self._idle_timeout,
+                "created": self._created,
+                "hosts": {str(k): s.in_flight for k, s in self._sessions.items()},
+            }
+
+    def _evict_idle(self) -> None:
+        """Close sessions that exceeded the idle timeout. Must be called holding the lock."""
+        now = time.monotonic()
+        for key in [k for k, s in self._sessions.items() if s.is_idle(now, self._idle_timeout)]:
+            log.debug("Closing idle pooled session for: %s", key)
+            self._sessions.pop(key).close()
+
+
+assert (session_pool := SessionPool().INSTANCE) is not None
@@ -0,0 +1,11 @@
+# _*_ coding: utf-8 _*_
+#
+# hspylib v1.12.55
+#
+# Package: test.benchmark
+"""Package initialization."""
+
+__all__ = [
+    'bench_fetch'
+]
+__version__ = '1.12.55'
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.benchmark
+      @file: bench_collection_filter.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+
+   Measure the cost of filtering a table with CollectionFilter: compiled versus the former eval based matching,
+   columnar (on a RecordBatch) versus compiled per record, a FilteredView kept up to date as rows are appended
+   versus filtering the whole table again, and a filter expression as planned by FilterPlanner versus as written.
+   Run it from the test sources directory:
+     PYTHONPATH=../main:. python -m benchmark.bench_collection_filter [--rows N] [--output FILE] [--baseline FILE]
+"""
+from collections import deque
+from hspylib.core.collection_filter import CollectionFilter, ElementFilter, FilterCondition, FilteredView, FilterValue
+from hspylib.core.filter_expression import FilterExpression, FilterPlanner, Term
+from hspylib.core.record_batch import np, RecordBatch
+from hspylib.core.tools.text_tools import quote
+from itertools import count, islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+# Filters of each scenario: (attribute, condition, value).
+FILTER_SETS: Dict[str, List[Tuple[str, FilterCondition, FilterValue]]] = {
+    "one-filter": [("topic", FilterCondition.CONTAINS, "orders")],
+    "four-filters": [
+        ("topic", FilterCondition.CONTAINS, "orders"),
+        ("partition", FilterCondition.LESS_THAN, 6),
+        ("offset", FilterCondition.GREATER_THAN_OR_EQUALS_TO, 1000),
+        ("committed", FilterCondition.IS, True),
+    ],
+    "mismatched-types": [
+        ("key", FilterCondition.GREATER_THAN, 10),
+        ("partition", FilterCondition.CONTAINS, "1"),
+    ],
+}
+
+# Filter expression of the planner scenario, written with its costly conditions first.
+EXPRESSION: FilterExpression = (
+    Term("value", FilterCondition.CONTAINS, "7") & Term("topic", FilterCondition.EQUALS_TO, "audit")
+) | (Term("key", FilterCondition.CONTAINS, "key-1") & Term("partition", FilterCondition.EQUALS_TO, 3))
+
+# Rows of the table filtered per record, like the kafman consumer table.
+ROWS: int = 500
+
+# Rows of the table filtered as columns.
+COLUMNAR_ROWS: int = 50_000
+
+# Rows of the streaming table, kept while new rows are appended.
+STREAM_ROWS: int = 5_000
+
+# Table refreshes (full filter passes) measured per scenario, for tables of up to ROWS rows.
+REFRESHES: int = 200
+
+
+class _Record:
+    """A table row held as an object, whose attributes are matched through its __dict__."""
+
+    def __init__(self, **kwargs) -> None:
+        self.__dict__.update(kwargs)
+
+
+def records(seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """Yield endless records like the kafman consumer table ones. The same seed yields the same records."""
+    rnd = random.Random(seed)
+    topics = ["orders", "orders-dlq", "payments", "inventory", "audit"]
+    for idx in count():
+        yield {
+            "topic": rnd.choice(topics),
+            "partition": rnd.randrange(12),
+            "offset": rnd.randrange(5000),
+            "key": f"key-{rnd.randrange(1000)}",
+            "value": f"payload {idx}",
+            "committed": rnd.random() < 0.7,
+        }
+
+
+def table(rows: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Return a table like the kafman consumer one: one dict per consumed record."""
+    return list(islice(records(seed), rows))
+
+
+def _eval_matches(f: ElementFilter, element: Any) -> bool:
+    """ElementFilter.matches as it was before the filters were compiled: one eval per element and filter."""
+    try:
+        entry = None
+        if isinstance(element, dict):
+            entry = element
+        elif hasattr(element, "__dict__"):
+            entry = element.__dict__
+        elif isinstance(element, tuple):
+            entry = dict(element)
+        if f.el_name not in entry:
+            return False
+        param_value, value, symbol = entry[f.el_name], f.el_value, f.condition.value[0]
+        if f.condition.name in ["CONTAINS", "DOES_NOT_CONTAIN"]:
+            expression = f"{quote(value)} {symbol} {quote(param_value)}"
+        else:
+            expression = f"{quote(param_value)} {symbol} {quote(value)}"
+        return f.condition.allows(value) and eval(expression)  # pylint: disable=eval-used
+    except (NameError, TypeError, AttributeError):
+        return False
+
+
+def eval_filter(filters: CollectionFilter, data: List[Any]) -> List[Any]:
+    """CollectionFilter.filter as it was before the filters were compiled."""
+    return [element for element in data if all(_eval_matches(f, element) for f in filters)]
+
+
+def _filters(filter_set: str) -> CollectionFilter:
+    filters = CollectionFilter()
+    for idx, (el_name, condition, el_value) in enumerate(FILTER_SETS[filter_set]):
+        filters.apply_filter(f"f{idx}", el_name, condition, el_value)
+    return filters
+
+
+def scenarios(rows: int, columnar_rows: int, stream_rows: int) -> Dict[str, Tuple[str, int, Callable, Callable]]:
+    """Return the benchmark scenarios, by name: the reference version, the table rows, and the functions filtering
+    the table once with the reference and with the measured version."""
+    dicts = table(rows)
+    objects = [_Record(**row) for row in dicts]
+    all_scenarios = {}
+    for filter_set in FILTER_SETS:
+        for kind, data in (("dicts", dicts), ("objects", objects)):
+            filters = _filters(filter_set)
+            all_scenarios[f"{filter_set}/{kind}"] = (
+                "eval",
+                rows,
+                lambda f=filters, d=data: eval_filter(f, d),
+                lambda f=filters, d=data: f.filter(d),
+            )
+    planned = FilterPlanner(sample=dicts[:100]).plan(EXPRESSION)
+    all_scenarios["expression/planned"] = (
+        "as-written",
+        rows,
+        lambda: EXPRESSION.filter(dicts),
+        lambda: planned.filter(dicts),
+    )
+    large = table(columnar_rows)
+    batch = RecordBatch.from_records(large)
+    for filter_set in FILTER_SETS:
+        filters = _filters(filter_set)
+        all_scenarios[f"{filter_set}/columnar"] = (
+            "compiled",
+            columnar_rows,
+            lambda f=filters: f.filter(large),
+            lambda f=filters: [large[index] for index in f.indexes(batch)],
+        )
+    for filter_set in FILTER_SETS:
+        all_scenarios[f"{filter_set}/stream"] = ("compiled", stream_rows, *_streams(filter_set, stream_rows))
+    return all_scenarios
+
+
+def _streams(filter_set: str, rows: int) -> Tuple[Callable[[], List[Any]], Callable[[], List[Any]]]:
+    """Return the functions appending one row to a table of rows, then reading the filtered rows: by filtering the
+    whole table, and through a FilteredView."""
+    data, filters = table(rows), _filters(filter_set)
+    table_rows, table_incoming = deque(data, maxlen=rows), records(seed=7)
+    view, view_incoming = FilteredView(_filters(filter_set), data, max_size=rows), records(seed=7)
+
+    def _refilter() -> List[Any]:
+        table_rows.append(next(table_incoming))
+        return filters.filter(list(table_rows))
+
+    def _view() -> List[Any]:
+        view.append(next(view_incoming))
+        return list(view)
+
+    return _refilter, _view
+
+
+def _measure(refresh: Callable[[], List[Any]], refreshes: int) -> float:
+    refresh()
+    started = time.perf_counter()
+    for _ in range(refreshes):
+        refresh()
+    return (time.perf_counter() - started) / refreshes
+
+
+def run_scenario(name: str, scenario: Tuple[str, int, Callable, Callable], refreshes: int) -> Dict[str, Any]:
+    """Run one scenario, returning its measurements. Both versions must filter the same rows. Tables larger than
+    the default are refreshed proportionally fewer times."""
+    reference, rows, reference_refresh, refresh = scenario
+    if (expected := reference_refresh()) != (result := refresh()):
+        raise AssertionError(f"{name}: filter kept {len(result)} rows, {reference} kept {len(expected)}")
+    refreshes = max(3, refreshes * ROWS // max(rows, ROWS))
+    reference_s, measured_s = _measure(reference_refresh, max(1, refreshes // 10)), _measure(refresh, refreshes)
+    return {
+        "scenario": name,
+        "rows": rows,
+        "matched": len(result),
+        "reference": reference,
+        "reference_us_per_refresh": round(reference_s * 1e6, 1),
+        "us_per_refresh": round(measured_s * 1e6, 1),
+        "ns_per_row": round(measured_s / rows * 1e9, 1),
+        "speedup": round(reference_s / measured_s, 1),
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """Return the scenarios whose cost per row grew more than the tolerance, compared to the baseline."""
+    previous = {b["scenario"]: b for b in baseline}
+    regressions = []
+    for result in results:
+        if (before := previous.get(result["scenario"])) is None:
+            continue
+        if result["ns_per_row"] > before["ns_per_row"] * (1 + tolerance):
+            regressions.append(
+                f"{result['scenario']}: {result['ns_per_row']} ns/row (baseline {before['ns_per_row']} ns/row)"
+            )
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print (or save) its JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark the CollectionFilter compiled and columnar filtering.")
+    parser.add_argument("-r", "--rows", type=int, default=ROWS, help="rows of the table filtered per record")
+    parser.add_argument("-c", "--columnar-rows", type=int, default=COLUMNAR_ROWS, help="rows filtered as columns")
+    parser.add_argument("-s", "--stream-rows", type=int, default=STREAM_ROWS, help="rows kept by the stream table")
+    parser.add_argument("-n", "--refreshes", type=int, default=REFRESHES, help="table refreshes measured")
+    parser.add_argument("-o", "--output", help="file to write the JSON report into, instead of stdout")
+    parser.add_argument("--baseline", help="previous JSON report; exit with 1 if the cost per row regressed")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed cost increase (0.2 = 20%%)")
+    opts = parser.parse_args(args)
+
+    all_scenarios = scenarios(opts.rows, opts.columnar_rows, opts.stream_rows)
+    results = [run_scenario(name, scenario, opts.refreshes) for name, scenario in all_scenarios.items()]
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np is not None,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as f_report:
+            json.dump(report, f_report, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if opts.baseline:
+        with open(opts.baseline, encoding="utf-8") as f_baseline:
+            regressions = compare(results, json.load(f_baseline)["results"], opts.tolerance)
+        for regression in regressions:
+            print(f"Cost per row regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
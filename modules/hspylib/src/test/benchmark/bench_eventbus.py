@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.benchmark
+      @file: bench_eventbus.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+
+   Measure the cost per event of building and dispatching EventBus events. Run it from the test sources directory:
+     PYTHONPATH=../main:. python -m benchmark.bench_eventbus [--events N] [--output FILE] [--baseline FILE]
+"""
+from hspylib.core.namespace import Namespace
+from hspylib.modules.eventbus.dispatcher import ThreadPoolDispatcher
+from hspylib.modules.eventbus.event import Event
+from hspylib.modules.eventbus.eventbus import EventBus
+from typing import Any, Callable, Dict, List, Optional
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+# Arguments of every emitted event.
+EVENT_ARGS: Dict[str, Any] = {"topic": "orders", "partition": 3, "offset": 1024, "key": "order-42", "size": 512}
+
+# Subscribers of each dispatch scenario.
+SUBSCRIBERS: int = 4
+
+# Events built (or emitted), and discarded, before measuring each scenario.
+WARMUP: int = 1000
+
+
+def _build_namespace(count: int) -> None:
+    """The event arguments as they were built before the slotted events: a final Namespace."""
+    for _ in range(count):
+        Namespace("EventArgs", True, **EVENT_ARGS)
+
+
+def _build_event(count: int) -> None:
+    """Events built through the constructor keyword arguments."""
+    for _ in range(count):
+        Event("order-received", **EVENT_ARGS)
+
+
+def _build_event_of(count: int) -> None:
+    """Events wrapping an arguments dict, the way emit builds them."""
+    for _ in range(count):
+        Event.of("order-received", dict(EVENT_ARGS))
+
+
+def _noop(_: Any) -> None:
+    pass
+
+
+def _emitter(bus: EventBus, subscription: str) -> Callable[[int], None]:
+    """Return a scenario emitting events to SUBSCRIBERS callbacks of the bus, subscribed to the subscription."""
+    for _ in range(SUBSCRIBERS):
+        bus.subscribe(subscription, _noop)
+
+    def _emit(count: int) -> None:
+        for _ in range(count):
+            bus.emit("kafka.consumer.received", **EVENT_ARGS)
+        bus.flush()
+
+    return _emit
+
+
+def scenarios(pool: ThreadPoolDispatcher) -> Dict[str, Callable[[int], None]]:
+    """Return the benchmark scenarios, by name. The thread pool scenario dispatches through the pool."""
+    return {
+        "build/namespace": _build_namespace,
+        "build/event": _build_event,
+        "build/event-of": _build_event_of,
+        "emit/sync-exact": _emitter(EventBus("bench-exact"), "kafka.consumer.received"),
+        "emit/sync-wildcard": _emitter(EventBus("bench-wildcard"), "kafka.#"),
+        "emit/sync-metrics": _emitter(EventBus("bench-metrics", metrics=True), "kafka.consumer.received"),
+        "emit/thread-pool": _emitter(EventBus("bench-pool", pool), "kafka.consumer.*"),
+    }
+
+
+def run_scenario(name: str, scenario: Callable[[int], None], count: int) -> Dict[str, Any]:
+    """Run one scenario, returning its measurements."""
+    scenario(WARMUP)
+    gc.collect()
+    started = time.perf_counter()
+    scenario(count)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    scenario(WARMUP)
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "scenario": name,
+        "events": count,
+        "elapsed_s": round(elapsed, 4),
+        "events_per_s": round(count / elapsed, 1),
+        "ns_per_event": round(elapsed / count * 1e9, 1),
+        "py_peak_kb": round(py_peak / 1024, 1),
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """Return the scenarios whose cost per event grew more than the tolerance, compared to the baseline."""
+    previous = {b["scenario"]: b for b in baseline}
+    regressions = []
+    for result in results:
+        if (before := previous.get(result["scenario"])) is None:
+            continue
+        if result["ns_per_event"] > before["ns_per_event"] * (1 + tolerance):
+            regressions.append(
+                f"{result['scenario']}: {result['ns_per_event']} ns/event (baseline {before['ns_per_event']} ns/event)"
+            )
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print (or save) its JSON report."""
+    pool = ThreadPoolDispatcher()
+    all_scenarios = scenarios(pool)
+    parser = argparse.ArgumentParser(description="Benchmark the EventBus events construction and dispatch.")
+    parser.add_argument("-n", "--events", type=int, default=100_000, help="events measured per scenario")
+    parser.add_argument("-s", "--scenarios", nargs="+", choices=list(all_scenarios), default=list(all_scenarios))
+    parser.add_argument("-o", "--output", help="file to write the JSON report into, instead of stdout")
+    parser.add_argument("--baseline", help="previous JSON report; exit with 1 if the cost per event regressed")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed cost increase (0.2 = 20%%)")
+    opts = parser.parse_args(args)
+
+    try:
+        results = [run_scenario(name, all_scenarios[name], opts.events) for name in opts.scenarios]
+    finally:
+        pool.shutdown()
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "subscribers": SUBSCRIBERS,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as f_report:
+            json.dump(report, f_report, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if opts.baseline:
+        with open(opts.baseline, encoding="utf-8") as f_baseline:
+            regressions = compare(results, json.load(f_baseline)["results"], opts.tolerance)
+        for regression in regressions:
+            print(f"Cost per event regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
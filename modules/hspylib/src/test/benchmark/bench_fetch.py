@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.benchmark
+      @file: bench_fetch.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+
+   Measure the fetch throughput and latency against the local MockServer. Run it from the test sources directory:
+     PYTHONPATH=../main:. python -m benchmark.bench_fetch [--requests N] [--output FILE] [--baseline FILE]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.modules.fetch.afetch import afetch, agather
+from hspylib.modules.fetch.fetch import fetch
+from mock.mock_server import MockServer
+from mock.mock_server_handler import MockServerHandler
+from typing import Any, Callable, Dict, List, Optional
+
+import argparse
+import asyncio
+import json
+import platform
+import requests
+import resource
+import sys
+import time
+import tracemalloc
+
+# Body sizes of the mocked responses.
+BODY_SIZES: Dict[str, int] = {"small": 128, "large": 256 * 1024}
+
+# Number of requests in flight of the threaded and async modes.
+CONCURRENCY: int = 8
+
+# Requests done, and discarded, before measuring each scenario.
+WARMUP: int = 5
+
+# Requests measured while tracing the Python heap peak. Tracing is slow, so it is kept out of the timed run.
+TRACED_REQUESTS: int = 20
+
+
+class _QuietHandler(MockServerHandler):
+    """Mock server handler that does not log every request to stderr."""
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _BenchServer(MockServer):
+    """Mock server serving the benchmark bodies."""
+
+    def __init__(self) -> None:
+        super().__init__("localhost", 0)
+        self.RequestHandlerClass = _QuietHandler
+        self.port = self.server_address[1]
+        for name, size in BODY_SIZES.items():
+            self.when_request(HttpMethod.GET, f"/{name}").then_return(code=HttpCode.OK, body="x" * size)
+
+    def url(self, body: str) -> str:
+        return f"http://localhost:{self.port}/{body}"
+
+
+def _serial(url: str, count: int) -> List[float]:
+    """One fresh connection per request, the way fetch worked before the session pool."""
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        requests.get(url, timeout=10).raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _pooled(url: str, count: int) -> List[float]:
+    """Sequential fetch calls, reusing the pooled keep-alive connections."""
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        fetch(url)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _threaded(url: str, count: int) -> List[float]:
+    """Concurrent fetch calls from a pool of threads, sharing the pooled connections."""
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        return list(executor.map(lambda _: _pooled(url, 1)[0], range(count)))
+
+
+def _async(url: str, count: int) -> List[float]:
+    """Concurrent afetch calls, gathered in one event loop. Latencies include the time queued behind the in flight
+    limits, since all calls are started at once."""
+
+    async def _timed() -> float:
+        started = time.perf_counter()
+        await afetch(url)
+        return time.perf_counter() - started
+
+    async def _all() -> List[float]:
+        return await agather(*(_timed() for _ in range(count)), return_exceptions=False)
+
+    return asyncio.run(_all())
+
+
+MODES: Dict[str, Callable[[str, int], List[float]]] = {
+    "serial": _serial,
+    "pooled": _pooled,
+    "threaded": _threaded,
+    "async": _async,
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of the values."""
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))]
+
+
+def run_scenario(server: _BenchServer, mode: str, body: str, count: int) -> Dict[str, Any]:
+    """Run one mode against one body size, returning its measurements."""
+    run, url = MODES[mode], server.url(body)
+    run(url, WARMUP)
+    started = time.perf_counter()
+    latencies = run(url, count)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    run(url, min(count, TRACED_REQUESTS))
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": mode,
+        "body": body,
+        "body_size": BODY_SIZES[body],
+        "requests": count,
+        "elapsed_s": round(elapsed, 4),
+        "req_per_s": round(count / elapsed, 2),
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3),
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "max": round(max(latencies) * 1000, 3),
+        },
+        "py_peak_kb": round(py_peak / 1024, 1),
+        "rss_high_water_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """Return the scenarios whose throughput dropped more than the tolerance, compared to the baseline."""
+    previous = {(b["mode"], b["body"]): b for b in baseline}
+    regressions = []
+    for result in results:
+        if (before := previous.get((result["mode"], result["body"]))) is None:
+            continue
+        if result["req_per_s"] < before["req_per_s"] * (1 - tolerance):
+            regressions.append(
+                f"{result['mode']}/{result['body']}: {result['req_per_s']} req/s "
+                f"(baseline {before['req_per_s']} req/s)"
+            )
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print (or save) its JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark fetch against the local MockServer.")
+    parser.add_argument("-n", "--requests", type=int, default=200, help="requests measured per scenario")
+    parser.add_argument("-m", "--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("-b", "--bodies", nargs="+", choices=list(BODY_SIZES), default=list(BODY_SIZES))
+    parser.add_argument("-o", "--output", help="file to write the JSON report into, instead of stdout")
+    parser.add_argument("--baseline", help="previous JSON report; exit with 1 if the throughput regressed")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed throughput drop (0.2 = 20%%)")
+    opts = parser.parse_args(args)
+
+    server = _BenchServer()
+    server.start()
+    try:
+        results = [run_scenario(server, m, b, opts.requests) for b in opts.bodies for m in opts.modes]
+    finally:
+        server.stop()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": requests.__version__,
+            "concurrency": CONCURRENCY,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as f_report:
+            json.dump(report, f_report, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if opts.baseline:
+        with open(opts.baseline, encoding="utf-8") as f_baseline:
+            regressions = compare(results, json.load(f_baseline)["results"], opts.tolerance)
+        for regression in regressions:
+            print(f"Throughput regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@
 
 from hspylib.core.collection_filter import *
 from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.core.record_batch import np, RecordBatch
 from typing import List
 
 import collections
@@ -255,6 +256,141 @@ class TestCollectionFilter(unittest.TestCase):
         result = self.f.filter_inverse(self.zet)
         self.assertTrue(all(d in expected for d in [{k: v for k, v in e} for e in result]))
 
+    def test_should_filter_objects_and_skip_unmatchable_elements(self) -> None:
+        class Row:
+            def __init__(self, **kwargs) -> None:
+                self.__dict__.update(kwargs)
+
+        rows = [Row(name="hugo", age=43), Row(name="joao", age="22"), Row(name="be"), 42, None]
+        self.f.apply_filter("f1", "age", FilterCondition.GREATER_THAN, 18)
+        self.assertEqual(["hugo"], [row.name for row in self.f.filter(rows)])
+        self.assertEqual(4, len(self.f.filter_inverse(rows)))
+
+    def test_should_match_values_with_quotes(self) -> None:
+        self.f.apply_filter("f1", "name", FilterCondition.CONTAINS, "'")
+        data = [{"name": "d'avila"}, {"name": "'quoted'"}, {"name": "hugo"}]
+        self.assertListEqual([{"name": "d'avila"}, {"name": "'quoted'"}], self.f.filter(data))
+
+    def test_should_compile_filters_until_they_change(self) -> None:
+        self.f.apply_filter("f1", "active", FilterCondition.IS, True)
+        predicate = self.f.compile()
+        self.assertIs(predicate, self.f.compile())
+        self.assertTrue(predicate(self.arr[0]))
+        self.assertFalse(predicate(self.arr[5]))
+        self.f.apply_filter("f2", "age", FilterCondition.GREATER_THAN, 18)
+        self.assertIsNot(predicate, self.f.compile())
+        self.assertFalse(self.f.compile()(self.arr[2]))
+        self.f.clear()
+        self.assertTrue(self.f.compile()(None))
+
+    def test_should_recompile_element_filters_when_changed(self) -> None:
+        f1 = ElementFilter("f1", "active", FilterCondition.IS, True)
+        self.assertTrue(f1.matches({"active": True}))
+        f1.el_value = 1
+        self.assertFalse(f1.matches({"active": True}))
+        f1.condition, f1.el_value = FilterCondition.EQUALS_TO, False
+        self.assertTrue(f1.matches({"active": False}))
+
+    def test_should_filter_columns_like_records(self) -> None:
+        batch = RecordBatch.from_records(self.arr)
+        filter_sets = [
+            [("f1", "score", FilterCondition.LESS_THAN, 5.0)],
+            [("f1", "name", FilterCondition.CONTAINS, "u"), ("f2", "active", FilterCondition.IS, True)],
+            [("f1", "name", FilterCondition.DOES_NOT_CONTAIN, "u"), ("f2", "age", FilterCondition.GREATER_THAN, 5)],
+            [("f1", "age", FilterCondition.DIFFERENT_FROM, 43), ("f2", "score", FilterCondition.EQUALS_TO, 10.0)],
+            [("f1", "name", FilterCondition.GREATER_THAN, 3)],
+            [("f1", "unknown", FilterCondition.EQUALS_TO, 3)],
+            [],
+        ]
+        for filters in filter_sets:
+            with self.subTest(filters=filters):
+                self.f.clear()
+                for f in filters:
+                    self.f.apply_filter(*f)
+                expected = self.f.filter(self.arr)
+                indexes = self.f.indexes(batch)
+                self.assertListEqual(expected, [self.arr[i] for i in indexes])
+                self.assertListEqual(expected, list(self.f.select(batch).rows()))
+                inverse = self.f.indexes(batch, inverse=True)
+                self.assertListEqual(self.f.filter_inverse(self.arr), [self.arr[i] for i in inverse])
+                self.assertListEqual([i in indexes for i in range(len(self.arr))], self.f.mask(batch))
+
+    def test_should_filter_columns_with_missing_and_mismatched_values(self) -> None:
+        columns = {"name": ["hugo", "joao", None, "kako"], "age": [43, "22", 15, 67]}
+        self.f.apply_filter("f1", "age", FilterCondition.GREATER_THAN, 18)
+        self.assertListEqual([0, 3], self.f.indexes(columns))
+        batch = RecordBatch.from_records([{"name": "hugo", "age": 43}, {"name": "be"}, 42, {"age": 20}])
+        self.assertListEqual([0, 3], self.f.indexes(batch))
+        self.f.apply_filter("f2", "name", FilterCondition.DIFFERENT_FROM, "be")
+        self.assertListEqual([0], self.f.indexes(batch))
+        self.assertListEqual([1, 2, 3], self.f.indexes(batch, inverse=True))
+
+    @unittest.skipIf(np is None, "The numpy package is not installed")
+    def test_should_filter_numpy_columns(self) -> None:
+        columns = {
+            "name": np.array([e["name"] for e in self.arr]),
+            "age": np.array([e["age"] for e in self.arr]),
+            "active": np.array([e["active"] for e in self.arr]),
+        }
+        self.f.apply_filter("f1", "name", FilterCondition.CONTAINS, "u")
+        self.f.apply_filter("f2", "age", FilterCondition.GREATER_THAN_OR_EQUALS_TO, 30)
+        self.f.apply_filter("f3", "active", FilterCondition.IS, True)
+        self.assertListEqual([0, 4, 6], self.f.indexes(columns))
+        self.assertListEqual(["hugo", "lucas", "claudia"], self.f.select(columns).column("name").tolist())
+
+    def test_should_keep_a_filtered_view_of_appended_elements(self) -> None:
+        self.f.apply_filter("f1", "active", FilterCondition.IS, True)
+        view = FilteredView(self.f, self.arr[:4])
+        self.assertListEqual(self.f.filter(self.arr[:4]), list(view))
+        evaluated = view.evaluated
+        self.assertTrue(view.append(self.arr[4]))
+        self.assertFalse(view.append(self.arr[5]))
+        self.assertEqual(3, view.extend(self.arr[6:] + [self.arr[0], self.arr[1]]))
+        self.assertEqual(evaluated + 6, view.evaluated)
+        self.assertListEqual(self.f.filter(self.arr + self.arr[:2]), list(view))
+        self.assertEqual(self.arr[6], view[5])
+        self.assertEqual(10, view.source_size)
+
+    def test_should_narrow_and_widen_the_filtered_view(self) -> None:
+        view = FilteredView(source=self.arr)
+        view.apply_filter("f1", "active", FilterCondition.IS, True)
+        evaluated = view.evaluated
+        view.apply_filter("f2", "age", FilterCondition.GREATER_THAN, 18)
+        self.assertEqual(evaluated + 6, view.evaluated)
+        self.assertEqual([0, 1, 3, 4, 6], [e["id"] for e in view])
+        evaluated = view.evaluated
+        view.discard("f1")
+        self.assertEqual(evaluated + 2, view.evaluated)
+        self.assertEqual([0, 1, 3, 4, 6], [e["id"] for e in view])
+        view.discard("f2")
+        self.assertListEqual(self.arr, list(view))
+        view.apply_filter("f3", "score", FilterCondition.LESS_THAN, 5.0)
+        view.apply_filter("f4", "name", FilterCondition.CONTAINS, "j")
+        self.assertEqual([1, 2], [e["id"] for e in view])
+        view.discard("f4")
+        self.assertEqual([1, 2, 3], [e["id"] for e in view])
+        view.apply_filter("f5", "name", FilterCondition.CONTAINS, "j")
+        view.discard("f3")
+        self.assertEqual([1, 2], [e["id"] for e in view])
+        view.clear_filters()
+        self.assertEqual(8, len(view))
+        self.assertEqual(0, len(view.filters))
+
+    def test_should_drop_the_oldest_elements_of_the_filtered_view(self) -> None:
+        view = FilteredView(self.f, max_size=3)
+        self.assertIs(self.f, view.filters)
+        view.apply_filter("f1", "active", FilterCondition.IS, True)
+        view.extend(self.arr)
+        self.assertEqual(3, view.source_size)
+        self.assertEqual([6], [e["id"] for e in view])
+        view.discard("f1")
+        self.assertEqual([5, 6, 7], [e["id"] for e in view])
+        view.apply_filter("f2", "age", FilterCondition.LESS_THAN, 5)
+        self.assertEqual([5], [e["id"] for e in view])
+        view.clear()
+        self.assertEqual(0, len(view))
+        self.assertEqual(1, len(view.filters))
+
 
 if __name__ == "__main__":
     suite = unittest.TestLoader().loadTestsFromTestCase(TestCollectionFilter)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.core
+      @file: test_filter_expression.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.collection_filter import CollectionFilter, FilterCondition
+from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.core.filter_expression import (
+    AllOf,
+    AnyOf,
+    expression_of,
+    FilterPlanner,
+    Not,
+    SqlDialect,
+    Term,
+)
+from hspylib.core.record_batch import RecordBatch
+from typing import List
+
+import sqlite3
+import sys
+import unittest
+
+
+def get_dict() -> List[dict]:
+    return [
+        {"id": 0, "name": "hugo", "age": 43, "score": 9.8, "active": True},
+        {"id": 1, "name": "joao", "age": 22, "score": 2.5, "active": True},
+        {"id": 2, "name": "juca", "age": 15, "score": 4.0, "active": True},
+        {"id": 3, "name": "kako", "age": 67, "score": 3.9, "active": True},
+        {"id": 4, "name": "lucas", "age": 33, "score": 5.0, "active": True},
+        {"id": 5, "name": "gabits", "age": 1, "score": 7.8, "active": False},
+        {"id": 6, "name": "claudia", "age": 34, "score": 6.1, "active": True},
+        {"id": 7, "name": "be", "age": 10, "score": 10.0, "active": False},
+        {"id": 8, "name": "nobody"},
+    ]
+
+
+def ids(data) -> List[int]:
+    return [row["id"] for row in data]
+
+
+# Expressions and the ids of the rows of get_dict passing them.
+EXPRESSIONS = [
+    (Term("age", FilterCondition.LESS_THAN, 18) | Term("score", FilterCondition.GREATER_THAN, 9.0), [0, 2, 5, 7]),
+    (
+        Term("active", FilterCondition.IS, True) & (
+            Term("name", FilterCondition.CONTAINS, "u") | Term("age", FilterCondition.GREATER_THAN_OR_EQUALS_TO, 60)
+        ),
+        [0, 2, 3, 4, 6],
+    ),
+    (~Term("age", FilterCondition.GREATER_THAN, 18), [2, 5, 7, 8]),
+    (~(Term("age", FilterCondition.GREATER_THAN, 18) | Term("name", FilterCondition.CONTAINS, "o")), [2, 5, 7]),
+    (Term("age", FilterCondition.GREATER_THAN, "18") | Term("id", FilterCondition.EQUALS_TO, 1), [1]),
+    (
+        Not(Term("active", FilterCondition.IS, 1)) & ~Term("name", FilterCondition.DOES_NOT_CONTAIN, "a"),
+        [1, 2, 3, 4, 5, 6],
+    ),
+    (AllOf(), list(range(9))),
+    (AnyOf(), []),
+]
+
+
+class TestFilterExpression(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = get_dict()
+
+    def test_should_combine_terms_with_and_or_not(self) -> None:
+        for expression, expected in EXPRESSIONS:
+            with self.subTest(expression=str(expression)):
+                self.assertEqual(expected, ids(expression.filter(self.data)))
+                self.assertEqual(
+                    [row["id"] for row in self.data if row["id"] not in expected],
+                    ids(expression.filter_inverse(self.data)),
+                )
+
+    def test_should_group_as_the_operators_do(self) -> None:
+        young, active, named = (
+            Term("age", FilterCondition.LESS_THAN, 18),
+            Term("active", FilterCondition.IS, True),
+            Term("name", FilterCondition.CONTAINS, "o"),
+        )
+        self.assertEqual(AnyOf(young, AllOf(active, named)), young | active & named)
+        self.assertEqual([0, 1, 2, 3, 5, 7], ids((young | active & named).filter(self.data)))
+        self.assertEqual([0, 1, 3], ids(((young | active) & named).filter(self.data)))
+
+    def test_should_not_pass_elements_without_attributes(self) -> None:
+        expression = ~Term("age", FilterCondition.GREATER_THAN, 18)
+        self.assertFalse(expression.matches(10))
+        self.assertTrue(expression.should_filter(None))
+        self.assertTrue(expression.matches({}))
+
+    def test_should_pass_elements_on_truthy_comparisons(self) -> None:
+        class Truthy:
+            def __eq__(self, other) -> int:
+                return 1
+
+        rows = [{"id": 0, "value": Truthy()}]
+        term = Term("value", FilterCondition.EQUALS_TO, 1)
+        filters = CollectionFilter()
+        filters.apply_filter("f1", "value", FilterCondition.EQUALS_TO, 1)
+        self.assertEqual(rows, filters.filter(rows))
+        self.assertEqual(rows, term.filter(rows))
+        self.assertEqual([], term.filter_inverse(rows))
+        self.assertEqual(rows, AllOf(term).filter(rows))
+        self.assertEqual([], (~term).filter(rows))
+
+    def test_should_keep_the_collection_type(self) -> None:
+        expression = Term("age", FilterCondition.LESS_THAN, 18) | Term("name", FilterCondition.EQUALS_TO, "hugo")
+        zet = {tuple(row.items()) for row in self.data}
+        result = expression.filter(zet)
+        self.assertIsInstance(result, set)
+        self.assertEqual([0, 2, 5, 7], sorted(dict(row)["id"] for row in result))
+
+    def test_should_match_like_a_collection_filter(self) -> None:
+        filters = CollectionFilter()
+        filters.apply_filter("f1", "score", FilterCondition.GREATER_THAN, 3.0)
+        filters.apply_filter("f2", "active", FilterCondition.IS, True)
+        expression = expression_of(filters)
+        self.assertIsInstance(expression, AllOf)
+        self.assertEqual(filters.filter(self.data), expression.filter(self.data))
+
+    def test_should_evaluate_columns(self) -> None:
+        batch = RecordBatch.from_records(self.data)
+        for expression, expected in EXPRESSIONS:
+            with self.subTest(expression=str(expression)):
+                self.assertEqual(expected, expression.indexes(batch))
+                self.assertEqual([i for i in range(len(batch)) if i not in expected], expression.indexes(batch, True))
+                self.assertEqual(expected, batch.take(expression.indexes(batch)).column("id"))
+        expression = Term("missing", FilterCondition.EQUALS_TO, 1) | Term("id", FilterCondition.EQUALS_TO, 1)
+        self.assertEqual([1], expression.select(batch).column("id"))
+
+    def test_should_plan_cheap_and_selective_terms_first(self) -> None:
+        contains = Term("name", FilterCondition.CONTAINS, "a")
+        greater = Term("age", FilterCondition.GREATER_THAN, 18)
+        equals = Term("id", FilterCondition.EQUALS_TO, 4)
+        planner = FilterPlanner()
+        self.assertEqual(AllOf(equals, greater, contains), planner.plan(contains & greater & equals))
+        self.assertEqual(AnyOf(greater, equals, contains), planner.plan(contains | equals | greater))
+        self.assertLess(planner.estimate(equals & contains)[0], planner.estimate(contains & equals)[0])
+
+    def test_should_simplify_when_planning(self) -> None:
+        young, named = Term("age", FilterCondition.LESS_THAN, 18), Term("name", FilterCondition.CONTAINS, "o")
+        planner = FilterPlanner()
+        self.assertEqual(young, planner.plan(~~young))
+        self.assertEqual(young, planner.plan(young & AllOf(young)))
+        self.assertEqual(AllOf(young, named), planner.plan(AllOf(named, AllOf(young, ~~named))))
+        self.assertEqual(Not(AnyOf(young, named)), planner.plan(~(named | young)))
+
+    def test_should_measure_selectivity_on_a_sample(self) -> None:
+        everyone = Term("name", FilterCondition.CONTAINS, "")
+        nobody = Term("age", FilterCondition.EQUALS_TO, 99)
+        self.assertEqual(AllOf(nobody, everyone), FilterPlanner().plan(everyone & nobody))
+        planner = FilterPlanner(sample=self.data)
+        self.assertAlmostEqual(10 / 11, planner.estimate(everyone)[1])
+        self.assertAlmostEqual(1 / 11, planner.estimate(nobody)[1])
+        self.assertEqual(AnyOf(everyone, nobody), planner.plan(nobody | everyone))
+        self.assertIn("'age' equals to 99 (cost=1.00, selectivity=0.09)", planner.explain(nobody | everyone))
+
+    def test_should_keep_the_results_when_planning(self) -> None:
+        planner = FilterPlanner(sample=self.data)
+        for expression, expected in EXPRESSIONS:
+            with self.subTest(expression=str(expression)):
+                self.assertEqual(expected, ids(planner.plan(expression).filter(self.data)))
+
+    def test_should_translate_to_parameterized_sql(self) -> None:
+        expression = (
+            Term("active", FilterCondition.IS, True) & Term("name", FilterCondition.CONTAINS, "u")
+        ) | ~Term("age", FilterCondition.GREATER_THAN, 18)
+        self.assertEqual(
+            (
+                "((active = ? AND instr(name, ?) > 0) OR NOT (age IS NOT NULL AND age > ?))",
+                [True, "u", 18],
+            ),
+            expression.to_sql(),
+        )
+        self.assertEqual(
+            ("(active = %s AND LOCATE(%s, name) > 0)", [True, "u"]),
+            expression.operands[0].to_sql(SqlDialect.MYSQL),
+        )
+        self.assertEqual(("1 = 0", []), Term("age", FilterCondition.LESS_THAN, "18").to_sql())
+        self.assertEqual(("1 = 1", []), AllOf().to_sql())
+
+    def test_should_not_translate_invalid_column_names(self) -> None:
+        expression = Term("name; DROP TABLE users", FilterCondition.EQUALS_TO, "x")
+        self.assertRaises(InvalidArgumentError, expression.to_sql)
+        self.assertEqual(("users.name = ?", ["x"]), Term("users.name", FilterCondition.EQUALS_TO, "x").to_sql())
+
+    def test_should_select_the_same_rows_in_sqlite(self) -> None:
+        columns = ["id", "name", "age", "score", "active"]
+        with sqlite3.connect(":memory:") as conn:
+            conn.execute(f"CREATE TABLE people ({', '.join(columns)})")
+            conn.executemany(
+                "INSERT INTO people VALUES (?, ?, ?, ?, ?)", [[row.get(col) for col in columns] for row in self.data]
+            )
+            for expression, expected in EXPRESSIONS:
+                with self.subTest(expression=str(expression)):
+                    where, params = expression.to_sql(SqlDialect.SQLITE)
+                    rows = conn.execute(f"SELECT id FROM people WHERE {where} ORDER BY id", params).fetchall()
+                    self.assertEqual(expected, [row[0] for row in rows])
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestFilterExpression)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
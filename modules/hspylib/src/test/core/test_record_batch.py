@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.core
+      @file: test_record_batch.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.core.record_batch import MISSING, RecordBatch
+
+import pickle
+import sys
+import unittest
+
+
+class Record:
+    def __init__(self, **kwargs) -> None:
+        self.__dict__.update(kwargs)
+
+
+class TestRecordBatch(unittest.TestCase):
+    def test_should_build_columns_from_records(self) -> None:
+        records = [{"id": 1, "name": "hugo"}, Record(id=2, age=43), (("id", 3),), 42]
+        batch = RecordBatch.from_records(records)
+        self.assertEqual(4, len(batch))
+        self.assertEqual(["id", "name", "age"], batch.columns)
+        self.assertEqual([1, 2, 3, MISSING], batch.column("id"))
+        self.assertEqual(["hugo", MISSING, MISSING, MISSING], batch.column("name"))
+        self.assertEqual([{"id": 1, "name": "hugo"}, {"id": 2, "age": 43}, {"id": 3}, {}], list(batch.rows()))
+
+    def test_should_build_only_the_requested_columns(self) -> None:
+        batch = RecordBatch.from_records([{"id": 1, "name": "hugo"}, {"id": 2}], columns=["name"])
+        self.assertEqual(["name"], batch.columns)
+        self.assertNotIn("id", batch)
+
+    def test_should_take_records(self) -> None:
+        batch = RecordBatch({"id": [1, 2, 3, 4], "name": ["a", "b", "c", "d"]})
+        self.assertEqual([{"id": 4, "name": "d"}, {"id": 2, "name": "b"}], list(batch.take([3, 1]).rows()))
+        self.assertEqual([{"id": 3, "name": "c"}], list(batch.take([2]).rows()))
+        self.assertEqual(0, len(batch.take([])))
+        self.assertEqual([{"id": 1, "name": "a"}], list(batch.rows([0])))
+
+    def test_should_not_allow_columns_of_distinct_lengths(self) -> None:
+        self.assertRaises(InvalidArgumentError, RecordBatch, {"id": [1, 2], "name": ["a"]})
+        self.assertRaises(InvalidArgumentError, RecordBatch, {"id": [1, 2]}, 3)
+        self.assertEqual(3, len(RecordBatch({}, 3)))
+
+    def test_should_never_match_missing_values(self) -> None:
+        self.assertFalse(MISSING == MISSING)
+        self.assertFalse(MISSING != 1)
+        self.assertFalse(1 != MISSING)
+        self.assertRaises(TypeError, lambda: MISSING < 1)
+        self.assertIs(MISSING, pickle.loads(pickle.dumps(MISSING)))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestRecordBatch)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -22,16 +22,21 @@ from http.server import HTTPServer
 from mock.mock_server_handler import MockServerHandler
 from random import randint
 from requests.structures import CaseInsensitiveDict
-from threading import Thread
+from socketserver import ThreadingMixIn
+from threading import Lock, Thread
 from time import sleep
-from typing import Optional, Tuple
+from typing import Optional, Set, Tuple
 
+import socket
 
-class MockServer(HTTPServer):
+
+class MockServer(ThreadingMixIn, HTTPServer):
     """TODO"""
 
     RANDOM_PORT = randint(49152, 65535)
 
+    daemon_threads = True
+
     class ServerThread(Thread):
         def __init__(self, parent: "MockServer"):
             super().__init__()
@@ -109,8 +114,24 @@ class MockServer(HTTPServer):
         self.hostname = hostname
         self.port = port
         self.version = "0.9.0"
+        self.connections = 0
+        self._open_sockets: Set[socket.socket] = set()
+        self._conn_lock = Lock()
         super().__init__(self.address(), MockServerHandler)
 
+    def process_request(self, request: socket.socket, client_address: Tuple[str, int]) -> None:
+        """Count and track every accepted (keep-alive) client connection."""
+        with self._conn_lock:
+            self.connections += 1
+            self._open_sockets.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: socket.socket) -> None:
+        """Forget the client connection once the handler is done with it."""
+        with self._conn_lock:
+            self._open_sockets.discard(request)
+        super().shutdown_request(request)
+
     def mock(self, method: HttpMethod, url: str) -> Optional[MockResponse]:
         """TODO"""
         try:
@@ -134,6 +155,13 @@ class MockServer(HTTPServer):
     def stop(self) -> None:
         """TODO"""
         self.shutdown()
+        with self._conn_lock:
+            open_sockets, self._open_sockets = list(self._open_sockets), set()
+        for request in open_sockets:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # The client may have already closed the connection.
         self.server_close()
 
     def when_request(self, method: HttpMethod, url: str) -> Optional[MockResponse]:
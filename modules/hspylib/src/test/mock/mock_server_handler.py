@@ -26,6 +26,12 @@ import logging as log
 class MockServerHandler(BaseHTTPRequestHandler):
     """TODO"""
 
+    # Keep client connections alive, so connection reuse can be verified.
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body are written separately, do not let Nagle delay the keep-alive responses.
+    disable_nagle_algorithm = True
+
     def __init__(self, request: bytes, client_address: Tuple[str, int], parent):
         self.parent = parent
         super().__init__(request, client_address, parent)
@@ -75,6 +81,8 @@ class MockServerHandler(BaseHTTPRequestHandler):
     def process_request(self, method: HttpMethod) -> None:
         """TODO"""
 
+        length = int(self.headers["Content-Length"]) if "Content-Length" in self.headers else 0
+        received = self.rfile.read(length) if length > 0 else b""
         if self.parent.is_allowed(method):
             request = self.parent.mock(method, self.path)
             if request:
@@ -92,8 +100,7 @@ class MockServerHandler(BaseHTTPRequestHandler):
                 headers = request.headers if request.headers else []
                 self.send_response_only(code)
                 if request.received_body and "Content-Length" in self.headers:
-                    length = int(self.headers["Content-Length"])
-                    request.body = self.rfile.read(length).decode(str(request.encoding))
+                    request.body = received.decode(str(request.encoding))
                     self.process_headers(headers, request.content_type, length)
                 else:
                     self.process_headers(headers, request.content_type, len(request.body) if request.body else 0)
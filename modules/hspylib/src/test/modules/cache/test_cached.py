@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.cache
+      @file: test_cached.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from concurrent.futures import ThreadPoolExecutor
+from hspylib.modules.cache.cached import cached
+from time import sleep
+
+import asyncio
+import gc
+import sys
+import unittest
+import weakref
+
+
+class Repository:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+
+    @cached(ttl=60)
+    def find(self, entity_id: int) -> str:
+        self.calls += 1
+        return f"{self.name}-{entity_id}"
+
+
+class TestCached(unittest.TestCase):
+    def test_should_cache_function_results(self) -> None:
+        calls = []
+
+        @cached(ttl=60, maxsize=3)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        self.assertListEqual([4, 4, 9, 4], [square(2), square(2), square(3), square(x=2)])
+        self.assertListEqual([2, 3, 2], calls)
+        self.assertEqual("square", square.__name__)
+        self.assertTrue(square.invalidate(2))
+        self.assertEqual(4, square(2))
+        self.assertListEqual([2, 3, 2, 2], calls)
+        stats = square.stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(4, stats["misses"])
+        self.assertEqual(3, stats["size"])
+        square.clear()
+        self.assertEqual(0, square.stats()["size"])
+
+    def test_should_expire_results(self) -> None:
+        calls = []
+
+        @cached(ttl=0.1)
+        def now() -> int:
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(1, now())
+        self.assertEqual(1, now())
+        sleep(0.15)
+        self.assertEqual(2, now())
+
+    def test_should_cache_methods_per_instance_weakly(self) -> None:
+        first, second = Repository("first"), Repository("second")
+        self.assertEqual("first-1", first.find(1))
+        self.assertEqual("first-1", first.find(1))
+        self.assertEqual("second-1", second.find(1))
+        self.assertEqual(1, first.calls)
+        self.assertTrue(first.find.invalidate(1))
+        self.assertFalse(second.find.invalidate(2))
+        first.find(1)
+        self.assertEqual(2, first.calls)
+        ref = weakref.ref(first)
+        del first
+        gc.collect()
+        self.assertIsNone(ref(), "The cache SHOULD NOT keep the instance alive")
+
+    def test_should_use_custom_keys(self) -> None:
+        @cached(key=lambda path, **_: path.lower())
+        def read(path: str, encoding: str = "utf-8") -> str:
+            return f"{path}:{encoding}"
+
+        self.assertEqual("A:utf-8", read("A"))
+        self.assertEqual("A:utf-8", read("a", encoding="latin-1"))
+
+    def test_should_compute_concurrent_misses_once(self) -> None:
+        calls = []
+
+        @cached
+        def slow(x: int) -> int:
+            calls.append(x)
+            sleep(0.2)
+            return x
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertListEqual([7] * 8, list(executor.map(slow, [7] * 8)))
+        self.assertListEqual([7], calls)
+        self.assertEqual(7, slow.stats()["shared"] + slow.stats()["hits"])
+
+    def test_should_not_cache_errors(self) -> None:
+        calls = []
+
+        @cached
+        def failing() -> None:
+            calls.append(1)
+            raise ValueError("failed")
+
+        self.assertRaises(ValueError, failing)
+        self.assertRaises(ValueError, failing)
+        self.assertEqual(2, len(calls))
+
+    def test_should_cache_coroutines_with_single_flight(self) -> None:
+        calls = []
+
+        @cached(ttl=60)
+        async def fetch(x: int) -> int:
+            calls.append(x)
+            await asyncio.sleep(0.1)
+            return x * 10
+
+        async def _run():
+            first = await asyncio.gather(*(fetch(1) for _ in range(5)))
+            return first, await fetch(1)
+
+        self.assertEqual(([10] * 5, 10), asyncio.run(_run()))
+        self.assertListEqual([1], calls)
+        stats = fetch.stats()
+        self.assertEqual((1, 4, 1), (stats["misses"], stats["shared"], stats["hits"]))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCached)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.cache
+      @file: test_disk_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from hspylib.core.exception.exceptions import InvalidStateError
+from hspylib.modules.cache.disk_cache import DiskCache, msgpack, MsgpackSerializer
+from time import sleep
+
+import sys
+import tempfile
+import unittest
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = f"{self.tmp_dir.name}/cache.db"
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_should_persist_entries_across_instances(self) -> None:
+        entry = {"when": datetime(2026, 10, 17), "tags": {"a", "b"}, "raw": b"\x00\x01"}
+        with DiskCache(self.path) as cache:
+            cache.set("key", entry)
+            cache.set("none", None)
+        with DiskCache(self.path) as cache:
+            self.assertEqual(entry, cache.get("key"))
+            self.assertIn("none", cache)
+            self.assertEqual(2, len(cache))
+            self.assertTrue(cache.delete("key"))
+            self.assertFalse(cache.delete("key"))
+            self.assertEqual("default", cache.get("key", "default"))
+
+    def test_should_expire_entries(self) -> None:
+        with DiskCache(self.path, ttl_minutes=0, ttl_seconds=60, compact_interval=0) as cache:
+            cache.set("short", "lived", ttl=0.1)
+            cache.set("gone", "lived", ttl=0.1)
+            cache.set("long", "lived")
+            self.assertEqual("lived", cache.get("short"))
+            sleep(0.15)
+            self.assertIsNone(cache.get("short"))
+            self.assertEqual(1, len(cache))
+            self.assertEqual(1, cache.compact())
+            stats = cache.stats()
+            self.assertEqual(1, stats["size"])
+            self.assertEqual(2, stats["expirations"])
+
+    def test_should_compact_in_background(self) -> None:
+        with DiskCache(self.path, compact_interval=0.05) as cache:
+            cache.set("key", "value", ttl=0)
+            sleep(0.2)
+            self.assertEqual(0, cache.stats()["size"])
+
+    def test_should_support_concurrent_access(self) -> None:
+        with DiskCache(self.path, compact_interval=0) as cache:
+
+            def _work(n: int) -> int:
+                for i in range(50):
+                    cache.set(f"{n}-{i}", i)
+                return sum(cache.get(f"{n}-{i}") for i in range(50))
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                self.assertListEqual([sum(range(50))] * 4, list(executor.map(_work, range(4))))
+            self.assertEqual(200, len(cache))
+
+    @unittest.skipIf(msgpack is not None, "The msgpack package is installed")
+    def test_should_require_msgpack(self) -> None:
+        self.assertRaises(InvalidStateError, MsgpackSerializer)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDiskCache)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
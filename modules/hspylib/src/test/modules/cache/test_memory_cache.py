@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.cache
+      @file: test_memory_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from concurrent.futures import ThreadPoolExecutor
+from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.modules.cache.memory_cache import MemoryCache
+from time import sleep
+
+import sys
+import unittest
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_should_save_read_and_delete_entries(self) -> None:
+        cache = MemoryCache()
+        cache.set("one", 1)
+        cache.set("none", None)
+        self.assertEqual(1, cache.get("one"))
+        self.assertIn("none", cache)
+        self.assertIsNone(cache.get("none", "default"))
+        self.assertEqual("default", cache.get("two", "default"))
+        self.assertTrue(cache.delete("one"))
+        self.assertFalse(cache.delete("one"))
+        self.assertNotIn("one", cache)
+
+    def test_should_expire_entries(self) -> None:
+        expired = []
+        cache = MemoryCache(ttl_minutes=0, ttl_seconds=60, cb_expired=lambda k, v: expired.append((k, v)))
+        cache.set("short", "lived", ttl=0.1)
+        cache.set("long", "lived")
+        self.assertEqual("lived", cache.get("short"))
+        sleep(0.15)
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual("lived", cache.get("long"))
+        self.assertListEqual([("short", "lived")], expired)
+        cache.set("purged", 1, ttl=0)
+        self.assertEqual(1, cache.purge_expired())
+        self.assertEqual(2, cache.stats()["expirations"])
+
+    def test_should_evict_the_least_recently_used(self) -> None:
+        cache = MemoryCache(max_size=3, stripes=1)
+        for key in "abc":
+            cache.set(key, key.upper())
+        cache.get("a")
+        cache.set("d", "D")
+        self.assertEqual(3, len(cache))
+        self.assertNotIn("b", cache)
+        self.assertListEqual(["A", "C", "D"], [cache.get(k) for k in "acd"])
+        self.assertEqual(1, cache.stats()["evictions"])
+
+    def test_should_never_exceed_max_size(self) -> None:
+        cache = MemoryCache(max_size=100, stripes=8)
+        for i in range(1000):
+            cache.set(i, i)
+        self.assertEqual(100, len(cache))
+        self.assertEqual(900, cache.stats()["evictions"])
+
+    def test_should_hold_max_size_entries_of_the_same_stripe(self) -> None:
+        cache = MemoryCache(max_size=1024)
+        keys = [i * MemoryCache.DEFAULT_STRIPES for i in range(1024)]
+        for key in keys:
+            cache.set(key, key)
+        self.assertEqual(1024, len(cache))
+        self.assertTrue(all(key in cache for key in keys))
+        self.assertEqual(0, cache.stats()["evictions"])
+        small = MemoryCache(max_size=4)
+        small.set(0, "a")
+        small.set(4, "b")
+        self.assertEqual(["a", "b"], [small.get(0), small.get(4)])
+
+    def test_should_evict_the_least_recently_used_of_all_stripes(self) -> None:
+        cache = MemoryCache(max_size=4, stripes=4)
+        for key in (0, 4, 8, 1):
+            cache.set(key, key)
+        cache.get(0)
+        cache.set(5, 5)
+        self.assertEqual(4, len(cache))
+        self.assertNotIn(4, cache)
+        self.assertTrue(all(key in cache for key in (0, 8, 1, 5)))
+        self.assertEqual(1, cache.stats()["evictions"])
+        cache.delete(0)
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+    def test_should_support_concurrent_access(self) -> None:
+        cache = MemoryCache(max_size=10_000)
+
+        def _work(n: int) -> int:
+            for i in range(500):
+                cache.set((n, i), i)
+            return sum(cache.get((n, i)) for i in range(500))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertListEqual([sum(range(500))] * 8, list(executor.map(_work, range(8))))
+        self.assertEqual(4000, len(cache))
+
+    def test_should_reject_invalid_sizes(self) -> None:
+        self.assertRaises(InvalidArgumentError, lambda: MemoryCache(max_size=0))
+        self.assertRaises(InvalidArgumentError, lambda: MemoryCache(stripes=0))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMemoryCache)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
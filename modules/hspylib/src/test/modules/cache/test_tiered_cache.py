@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.cache
+      @file: test_tiered_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.exception.exceptions import InvalidStateError
+from hspylib.modules.cache.tiered_cache import TieredCache
+from threading import Event
+from time import sleep
+from unittest.mock import patch
+
+import sys
+import tempfile
+import unittest
+
+
+class TestTieredCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = f"{self.tmp_dir.name}/tiered.db"
+        self.cache = TieredCache(self.path, ttl_minutes=0, ttl_seconds=30, l1_size=2, compact_interval=0)
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_should_read_saved_entries_from_memory(self) -> None:
+        self.cache.set("key", {"name": "hspylib"})
+        self.assertEqual({"name": "hspylib"}, self.cache.get("key"))
+        stats = self.cache.stats()
+        self.assertEqual(1, stats["l1"]["hits"])
+        self.assertEqual(0, stats["l2"]["hits"] + stats["l2"]["misses"])
+
+    def test_should_write_entries_behind_to_disk(self) -> None:
+        for i in range(5):
+            self.cache.set(f"key-{i}", i)
+        self.assertTrue(self.cache.flush(timeout=5))
+        stats = self.cache.stats()
+        self.assertEqual(5, stats["l2"]["size"])
+        self.assertEqual(0, stats["write_behind"]["pending"])
+        self.assertEqual(5, stats["write_behind"]["written"])
+
+    def test_should_not_block_the_caller_on_disk_writes(self) -> None:
+        release = Event()
+        original = self.cache._l2.set_many
+
+        def _slow_set_many(entries):
+            release.wait(5)
+            return original(entries)
+
+        with patch.object(self.cache._l2, "set_many", _slow_set_many):
+            self.cache.set("first", 1)
+            sleep(0.1)
+            self.cache.set("second", 2)
+            self.cache.set("second", 3)
+            self.assertEqual(2, self.cache.stats()["write_behind"]["pending"])
+            self.assertEqual(3, self.cache.get("second"))
+            release.set()
+            self.assertTrue(self.cache.flush(timeout=5))
+        self.assertEqual(2, self.cache.stats()["write_behind"]["batches"])
+        self.assertEqual(3, self.cache._l2.get("second"))
+
+    def test_should_promote_disk_entries_on_read(self) -> None:
+        self.cache.close()
+        self.cache = TieredCache(self.path, ttl_minutes=0, ttl_seconds=30, l1_size=1, compact_interval=0)
+        for key in ("one", "two"):
+            self.cache.set(key, key.upper())
+        self.cache.flush()
+        self.assertEqual(1, self.cache.stats()["l1"]["evictions"])
+        self.assertEqual("ONE", self.cache.get("one"))
+        self.assertEqual(1, self.cache.stats()["l2"]["hits"])
+        self.assertEqual("ONE", self.cache.get("one"))
+        self.assertEqual(1, self.cache.stats()["l2"]["hits"])
+
+    def test_should_keep_the_remaining_ttl_when_promoting(self) -> None:
+        self.cache.set("key", "value", ttl=1)
+        self.cache.flush()
+        self.cache._l1.clear()
+        self.assertEqual("value", self.cache.get("key"))
+        sleep(1.1)
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_should_delete_entries_from_both_tiers(self) -> None:
+        self.cache.set("key", "value")
+        self.cache.flush()
+        self.assertTrue(self.cache.delete("key"))
+        self.assertIsNone(self.cache.get("key"))
+        self.cache.flush()
+        self.assertIsNone(self.cache._l2.get("key"))
+        self.assertFalse(self.cache.delete("key"))
+
+    def test_should_clear_both_tiers(self) -> None:
+        self.cache.set("key", "value")
+        self.cache.clear()
+        self.assertNotIn("key", self.cache)
+        self.cache.flush()
+        self.assertEqual(0, self.cache.stats()["l2"]["size"])
+
+    def test_should_store_pending_writes_on_close(self) -> None:
+        self.cache.set("key", "value")
+        self.cache.close()
+        with self.assertRaises(InvalidStateError):
+            self.cache.set("other", "value")
+        with TieredCache(self.path, compact_interval=0) as reopened:
+            self.assertEqual("value", reopened.get("key"))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTieredCache)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
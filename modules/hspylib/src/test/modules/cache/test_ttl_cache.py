@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.cache
+      @file: test_ttl_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.modules.cache.ttl_cache import TTLCache
+from time import sleep
+
+import sys
+import tempfile
+import unittest
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = TTLCache(ttl_minutes=0, ttl_seconds=1)
+
+    def tearDown(self) -> None:
+        Singleton.del_instance(TTLCache)
+
+    def test_should_save_read_and_delete_entries(self) -> None:
+        entry = {"name": "hspylib", "tags": ["cache"]}
+        self.assertEqual("key", self.cache.save("key", entry))
+        self.assertEqual(entry, self.cache.read("key"))
+        self.cache.delete("key")
+        self.assertIsNone(self.cache.read("key"))
+
+    def test_should_expire_entries(self) -> None:
+        self.cache.save("key", "value")
+        self.assertEqual("value", self.cache.read("key"))
+        sleep(1.1)
+        self.assertIsNone(self.cache.read("key"))
+        self.assertEqual(1, self.cache.stats()["expirations"])
+
+    def test_should_survive_restarts_when_backed_by_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            Singleton.del_instance(TTLCache)
+            TTLCache(path=f"{tmp_dir}/cache.db").save("key", ["value"])
+            Singleton.del_instance(TTLCache)
+            self.assertEqual(["value"], TTLCache(path=f"{tmp_dir}/cache.db").read("key"))
+
+    def test_should_keep_hot_entries_in_memory_when_tiered(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            Singleton.del_instance(TTLCache)
+            cache = TTLCache(max_size=8, path=f"{tmp_dir}/cache.db", tiered=True)
+            cache.save("key", ["value"])
+            self.assertEqual(["value"], cache.read("key"))
+            stats = cache.stats()
+            self.assertEqual(1, stats["l1"]["hits"])
+            self.assertEqual(0, stats["l2"]["hits"])
+            cache.clear()
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTTLCache)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.cache
+      @file: test_ttl_keyring_index.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.modules.cache.ttl_keyring_be import TTLKeyringBE
+from keyring.backends.chainer import ChainerBackend
+from keyring.errors import PasswordDeleteError
+from time import sleep
+from unittest.mock import patch
+
+import sys
+import unittest
+
+
+class TestTTLKeyringIndex(unittest.TestCase):
+    """Exercise the expiry index and the decoded cache against an in-memory keyring."""
+
+    def setUp(self) -> None:
+        self.store = {}
+        self.reads = 0
+        self.now = 1_000_000
+
+        def _set(_, service, username, password):
+            self.store[(service, username)] = password
+
+        def _get(_, service, username):
+            self.reads += 1
+            return self.store.get((service, username))
+
+        def _delete(_, service, username):
+            if self.store.pop((service, username), None) is None:
+                raise PasswordDeleteError("not found")
+
+        self.patches = [
+            patch.object(ChainerBackend, "set_password", _set),
+            patch.object(ChainerBackend, "get_password", _get),
+            patch.object(ChainerBackend, "delete_password", _delete),
+            patch("hspylib.modules.cache.ttl_keyring_be.now_ms", lambda: self.now),
+        ]
+        for p in self.patches:
+            p.start()
+        self.expired = []
+
+    def tearDown(self) -> None:
+        for p in self.patches:
+            p.stop()
+
+    def test_should_serve_repeated_reads_from_the_decoded_cache(self) -> None:
+        be = TTLKeyringBE(0, 30, cache_seconds=5)
+        be.set_password("srv", "user", "secret")
+        for _ in range(10):
+            self.assertEqual("secret", be.get_password("srv", "user"))
+        self.assertEqual(0, self.reads)
+
+    def test_should_read_the_keyring_when_the_cache_is_disabled(self) -> None:
+        be = TTLKeyringBE(0, 30, cache_seconds=0)
+        be.set_password("srv", "user", "secret")
+        self.assertEqual("secret", be.get_password("srv", "user"))
+        self.assertEqual("secret", be.get_password("srv", "user"))
+        self.assertEqual(2, self.reads)
+
+    def test_should_not_serve_expired_passwords_from_the_cache(self) -> None:
+        be = TTLKeyringBE(0, 1, cb_expired=self.expired.append, cache_seconds=60)
+        be.set_password("srv", "user", "secret")
+        self.now += 2
+        self.assertIsNone(be.get_password("srv", "user"))
+        self.assertEqual(["secret"], self.expired)
+        self.assertNotIn(("srv", "user"), self.store)
+
+    def test_should_forget_deleted_passwords(self) -> None:
+        be = TTLKeyringBE(0, 30)
+        be.set_password("srv", "user", "secret")
+        be.delete_password("srv", "user")
+        be.delete_password("srv", "user")
+        self.assertIsNone(be.get_password("srv", "user"))
+        self.assertEqual(0, be.sweep())
+
+    def test_should_sweep_only_the_expired_passwords(self) -> None:
+        be = TTLKeyringBE(0, 1, cb_expired=self.expired.append)
+        be.set_password("srv", "one", "pwd-1")
+        be.set_password("srv", "two", "pwd-2")
+        be._ttl = 0, 30
+        be.set_password("srv", "three", "pwd-3")
+        self.assertEqual(0, be.sweep())
+        self.now += 2
+        self.assertEqual(2, be.sweep())
+        self.assertEqual(["pwd-1", "pwd-2"], sorted(self.expired))
+        self.assertEqual([("srv", "three")], list(self.store))
+        self.assertEqual(0, be.sweep())
+
+    def test_should_not_sweep_passwords_that_were_set_again(self) -> None:
+        be = TTLKeyringBE(0, 1)
+        be.set_password("srv", "user", "old")
+        be._ttl = 0, 30
+        be.set_password("srv", "user", "new")
+        self.now += 2
+        self.assertEqual(0, be.sweep())
+        self.assertEqual("new", be.get_password("srv", "user"))
+
+    def test_should_not_sweep_passwords_set_again_by_other_processes(self) -> None:
+        be = TTLKeyringBE(0, 1, cb_expired=self.expired.append)
+        be.set_password("srv", "user", "old")
+        other = TTLKeyringBE(0, 30)
+        other.set_password("srv", "user", "new")
+        self.now += 2
+        self.assertEqual(0, be.sweep())
+        self.assertEqual([], self.expired)
+        self.assertEqual("new", be.get_password("srv", "user"))
+        self.now += 30
+        self.assertEqual(1, be.sweep())
+        self.assertEqual(["new"], self.expired)
+
+    def test_should_keep_sweeping_after_errors(self) -> None:
+        be = TTLKeyringBE(0, 1, cb_expired=self.expired.append, sweep_interval=0.1)
+        try:
+            be.set_password("srv", "broken", "secret")
+            self.store[("srv", "broken")] = "not base64 json"
+            self.now += 2
+            sleep(0.3)
+            be.set_password("srv", "user", "secret")
+            self.now += 2
+            sleep(0.3)
+            self.assertEqual(["secret"], self.expired)
+            self.assertTrue(be._sweeper.is_alive())  # pylint: disable=protected-access
+        finally:
+            be.close()
+
+    def test_should_index_passwords_read_from_the_keyring(self) -> None:
+        writer = TTLKeyringBE(0, 1)
+        writer.set_password("srv", "user", "secret")
+        reader = TTLKeyringBE(0, 1, cb_expired=self.expired.append, cache_seconds=0)
+        self.assertEqual("secret", reader.get_password("srv", "user"))
+        self.now += 2
+        self.assertEqual(1, reader.sweep())
+        self.assertEqual(["secret"], self.expired)
+
+    def test_should_sweep_in_the_background(self) -> None:
+        be = TTLKeyringBE(0, 1, cb_expired=self.expired.append, sweep_interval=0.1)
+        try:
+            be.set_password("srv", "user", "secret")
+            sleep(0.3)
+            self.assertFalse(self.expired)
+            self.now += 2
+            sleep(0.3)
+            self.assertEqual(["secret"], self.expired)
+            self.assertFalse(self.store)
+        finally:
+            be.close()
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTTLKeyringIndex)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
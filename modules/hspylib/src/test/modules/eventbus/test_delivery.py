@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.eventbus
+      @file: test_delivery.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.modules.eventbus.eventbus import EventBus
+from time import sleep
+
+import sys
+import unittest
+
+
+class TestDelivery(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bus = EventBus("delivery-bus")
+        self.received = []
+
+    def test_should_debounce_bursts_of_events(self) -> None:
+        self.bus.subscribe("progress", lambda ev: self.received.append(ev.args.pct), debounce=0.2)
+        for pct in range(100):
+            self.bus.emit("progress", pct=pct)
+        self.assertEqual([], self.received)
+        sleep(0.4)
+        self.assertEqual([99], self.received)
+
+    def test_should_postpone_debounced_delivery_while_events_arrive(self) -> None:
+        self.bus.subscribe("typing", lambda ev: self.received.append(ev.args.text), debounce=0.3)
+        for text in ("h", "he", "hel", "hell"):
+            self.bus.emit("typing", text=text)
+            sleep(0.1)
+        self.assertEqual([], self.received)
+        sleep(0.4)
+        self.assertEqual(["hell"], self.received)
+
+    def test_should_throttle_events(self) -> None:
+        self.bus.subscribe("progress", lambda ev: self.received.append(ev.args.pct), throttle=5)
+        for pct in range(100):
+            self.bus.emit("progress", pct=pct)
+        self.assertEqual([0], self.received)
+        sleep(0.3)
+        self.assertEqual([0, 99], self.received)
+
+    def test_should_coalesce_events_by_key(self) -> None:
+        self.bus.subscribe(
+            "state-changed",
+            lambda ev: self.received.append((ev.args.widget, ev.args.value)),
+            debounce=0.1,
+            coalesce="widget",
+        )
+        for value in range(10):
+            self.bus.emit("state-changed", widget="menu", value=value)
+            self.bus.emit("state-changed", widget="panel", value=value * 2)
+        sleep(0.3)
+        self.assertEqual([("menu", 9), ("panel", 18)], self.received)
+
+    def test_should_deliver_batches_by_size(self) -> None:
+        self.bus.subscribe("line", lambda evs: self.received.append([ev.args.n for ev in evs]), batch=3)
+        for n in range(7):
+            self.bus.emit("line", n=n)
+        self.assertEqual([[0, 1, 2], [3, 4, 5]], self.received)
+
+    def test_should_deliver_batches_by_window(self) -> None:
+        self.bus.subscribe("line", lambda evs: self.received.append([ev.args.n for ev in evs]), batch_window=0.2)
+        for n in range(5):
+            self.bus.emit("line", n=n)
+        self.assertEqual([], self.received)
+        sleep(0.4)
+        self.assertEqual([[0, 1, 2, 3, 4]], self.received)
+
+    def test_should_coalesce_batches_by_key(self) -> None:
+        self.bus.subscribe(
+            "progress",
+            lambda evs: self.received.append([(ev.args.task, ev.args.pct) for ev in evs]),
+            batch_window=0.2,
+            coalesce=lambda ev: ev.args.task,
+        )
+        for pct in range(50):
+            self.bus.emit("progress", task="download", pct=pct)
+            self.bus.emit("progress", task="unzip", pct=pct // 2)
+        sleep(0.4)
+        self.assertEqual([[("download", 49), ("unzip", 24)]], self.received)
+
+    def test_should_reject_invalid_options(self) -> None:
+        cb = self.received.append
+        self.assertRaises(InvalidArgumentError, self.bus.subscribe, "ev", cb, debounce=1, throttle=1)
+        self.assertRaises(InvalidArgumentError, self.bus.subscribe, "ev", cb, coalesce="key")
+        self.assertRaises(InvalidArgumentError, self.bus.subscribe, "ev", cb, batch=-1)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDelivery)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.eventbus
+      @file: test_dispatcher.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.exception.exceptions import HSBaseException
+from hspylib.modules.eventbus.dispatcher import BackpressurePolicy, ThreadPoolDispatcher
+from hspylib.modules.eventbus.eventbus import EventBus
+from threading import Event as Signal, get_ident, Thread
+
+import sys
+import time
+import unittest
+
+
+class TestDispatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dispatchers = []
+
+    def tearDown(self) -> None:
+        for dispatcher in self.dispatchers:
+            dispatcher.shutdown(wait=False)
+
+    def _bus(self, name: str, **kwargs) -> EventBus:
+        dispatcher = ThreadPoolDispatcher(**kwargs)
+        self.dispatchers.append(dispatcher)
+        return EventBus(name, dispatcher)
+
+    def test_should_raise_callback_errors_when_synchronous(self) -> None:
+        bus = EventBus("sync-bus")
+
+        def _fail(_) -> None:
+            raise ValueError("boom")
+
+        bus.subscribe("test-event", _fail)
+        self.assertRaisesRegex(HSBaseException, "boom", bus.emit, "test-event")
+
+    def test_should_deliver_on_worker_threads(self) -> None:
+        bus = self._bus("async-bus")
+        threads = []
+        bus.subscribe("test-event", lambda ev: threads.append(get_ident()))
+        bus.emit("test-event", value=1)
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual(1, len(threads))
+        self.assertNotEqual(get_ident(), threads[0])
+
+    def test_should_keep_the_order_per_subscriber(self) -> None:
+        bus = self._bus("ordered-bus", max_workers=4)
+        received = {"one": [], "two": []}
+        bus.subscribe("test-event", lambda ev: received["one"].append(ev.args.seq))
+        bus.subscribe("test-event", lambda ev: received["two"].append(ev.args.seq))
+        for seq in range(500):
+            bus.emit("test-event", seq=seq)
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual(list(range(500)), received["one"])
+        self.assertEqual(list(range(500)), received["two"])
+
+    def test_should_not_block_the_emitter_on_slow_subscribers(self) -> None:
+        bus = self._bus("slow-bus", queue_size=10)
+        release = Signal()
+        bus.subscribe("test-event", lambda ev: release.wait(5))
+        started = time.perf_counter()
+        for _ in range(5):
+            bus.emit("test-event")
+        self.assertLess(time.perf_counter() - started, 1)
+        release.set()
+        self.assertTrue(bus.flush(timeout=5))
+
+    def test_should_drop_the_newest_events_when_full(self) -> None:
+        bus = self._bus("drop-newest-bus", queue_size=2, policy=BackpressurePolicy.DROP_NEWEST)
+        release, received = Signal(), []
+        bus.subscribe("test-event", lambda ev: release.wait(5) and received.append(ev.args.seq))
+        bus.emit("test-event", seq=0)
+        time.sleep(0.1)  # The first event is being delivered, so the lane is empty.
+        for seq in range(1, 6):
+            bus.emit("test-event", seq=seq)
+        release.set()
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual([0, 1, 2], received)
+        self.assertEqual(3, bus.dispatcher.stats()["dropped"])
+
+    def test_should_drop_the_oldest_events_when_full(self) -> None:
+        bus = self._bus("drop-oldest-bus", queue_size=2, policy=BackpressurePolicy.DROP_OLDEST)
+        release, received = Signal(), []
+        bus.subscribe("test-event", lambda ev: release.wait(5) and received.append(ev.args.seq))
+        bus.emit("test-event", seq=0)
+        time.sleep(0.1)
+        for seq in range(1, 6):
+            bus.emit("test-event", seq=seq)
+        release.set()
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual([0, 4, 5], received)
+        self.assertEqual(3, bus.dispatcher.stats()["dropped"])
+
+    def test_should_block_the_emitter_when_full(self) -> None:
+        bus = self._bus("block-bus", queue_size=1, policy=BackpressurePolicy.BLOCK)
+        release, received = Signal(), []
+        bus.subscribe("test-event", lambda ev: release.wait(5) and received.append(ev.args.seq))
+        emitter = Thread(target=lambda: [bus.emit("test-event", seq=seq) for seq in range(3)])
+        emitter.start()
+        emitter.join(0.3)
+        self.assertTrue(emitter.is_alive(), "The emitter SHOULD be blocked")
+        release.set()
+        emitter.join(5)
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual([0, 1, 2], received)
+        self.assertEqual(0, bus.dispatcher.stats()["dropped"])
+
+    def test_should_not_block_callbacks_emitting_to_full_queues(self) -> None:
+        bus = self._bus("cross-bus", max_workers=2, queue_size=1, policy=BackpressurePolicy.BLOCK)
+        received = []
+
+        def _relay(to: str):
+            def _cb(ev) -> None:
+                received.append(ev.name)
+                for _ in range(3 if ev.args.hops else 0):
+                    bus.emit(to, hops=ev.args.hops - 1)
+
+            return _cb
+
+        on_ping, on_pong = _relay("pong"), _relay("ping")
+        bus.subscribe("ping", on_ping)
+        bus.subscribe("pong", on_pong)
+        for _ in range(3):
+            bus.emit("ping", hops=4)
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual(3 * sum(3**hops for hops in range(5)), len(received))
+        self.assertEqual(0, bus.dispatcher.stats()["dropped"])
+        self.assertGreater(bus.dispatcher.stats()["overflowed"], 0)
+
+    def test_should_not_queue_blocked_events_on_shutdown(self) -> None:
+        bus = self._bus("shutdown-bus", queue_size=1, policy=BackpressurePolicy.BLOCK)
+        release, received = Signal(), []
+        bus.subscribe("test-event", lambda ev: release.wait(5) and received.append(ev.args.seq))
+        emitter = Thread(target=lambda: [bus.emit("test-event", seq=seq) for seq in range(3)])
+        emitter.start()
+        emitter.join(0.3)
+        self.assertTrue(emitter.is_alive(), "The emitter SHOULD be blocked")
+        bus.dispatcher.shutdown(wait=False)
+        emitter.join(5)
+        self.assertFalse(emitter.is_alive())
+        release.set()
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual([0, 1], received)
+
+    def test_should_report_callback_errors(self) -> None:
+        errors = []
+        bus = self._bus("error-bus", cb_error=lambda ev, err: errors.append((ev.name, str(err))))
+        bus.subscribe("test-event", lambda ev: 1 / 0)
+        bus.emit("test-event")
+        self.assertTrue(bus.flush(timeout=5))
+        self.assertEqual([("test-event", "division by zero")], errors)
+        self.assertEqual(1, bus.dispatcher.stats()["errors"])
+
+    def test_should_not_share_events_between_concurrent_emitters(self) -> None:
+        bus = EventBus("concurrent-bus")
+        received = {"a": [], "b": []}
+        bus.subscribe("event-a", lambda ev: received["a"].append(ev.args.seq))
+        bus.subscribe("event-b", lambda ev: received["b"].append(ev.args.seq))
+        emitters = [
+            Thread(target=lambda name=name: [bus.emit(f"event-{name}", seq=seq) for seq in range(1000)])
+            for name in ("a", "b")
+        ]
+        list(map(Thread.start, emitters))
+        list(map(Thread.join, emitters))
+        self.assertEqual(list(range(1000)), received["a"])
+        self.assertEqual(list(range(1000)), received["b"])
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDispatcher)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.eventbus
+      @file: test_event.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.modules.eventbus.event import Event
+
+import pickle
+import sys
+import unittest
+
+
+class TestEvent(unittest.TestCase):
+    def test_should_read_the_arguments_as_attributes_and_items(self) -> None:
+        event = Event("door-open", knock=3, alert=False)
+        self.assertEqual("door-open", event.name)
+        self.assertEqual(3, event.args.knock)
+        self.assertEqual(3, event.args["knock"])
+        self.assertEqual({"knock": 3, "alert": False}, dict(event.args))
+        self.assertEqual("door-open", event["name"])
+        self.assertRaises(AttributeError, getattr, event.args, "missing")
+        self.assertEqual("Event(name=door-open  args=EventArgs(knock=3, alert=False))", str(event))
+
+    def test_should_read_arguments_named_as_dict_methods(self) -> None:
+        event = Event("cart", items=["a", "b"], keys=3, get="url", values=(1, 2))
+        self.assertEqual(["a", "b"], event.args.items)
+        self.assertEqual(3, event.args.keys)
+        self.assertEqual("url", event.args.get)
+        self.assertEqual((1, 2), event.args.values)
+        self.assertIn("items", event.args)
+        self.assertEqual({"items": ["a", "b"], "keys": 3, "get": "url", "values": (1, 2)}, event.args.as_dict())
+
+    def test_should_not_allow_changes(self) -> None:
+        event = Event("door-open", knock=3)
+        with self.assertRaises(AttributeError):
+            event.args.knock = 4
+        with self.assertRaises(AttributeError):
+            del event.args.knock
+        with self.assertRaises(TypeError):
+            event.args["knock"] = 4
+        with self.assertRaises(AttributeError):
+            event.extra = True
+        self.assertFalse(hasattr(event, "__dict__"))
+
+    def test_should_compare_names_and_arguments(self) -> None:
+        self.assertEqual(Event("door-open", knock=3), Event.of("door-open", {"knock": 3}))
+        self.assertNotEqual(Event("door-open", knock=3), Event("door-open", knock=1))
+        self.assertNotEqual(Event("door-open", knock=3), Event("door-close", knock=3))
+        self.assertEqual(hash(Event("door-open", knock=3)), hash(Event("door-open", knock=1)))
+
+    def test_should_be_picklable(self) -> None:
+        event = Event("door-open", knock=3, tags=["front"])
+        self.assertEqual(event, pickle.loads(pickle.dumps(event)))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEvent)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.eventbus
+      @file: test_metrics.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.exception.exceptions import HSBaseException
+from hspylib.modules.eventbus.dispatcher import ThreadPoolDispatcher
+from hspylib.modules.eventbus.eventbus import EventBus
+from hspylib.modules.eventbus.metrics import LatencyHistogram
+from threading import Event as Signal
+
+import sys
+import time
+import unittest
+
+
+class TestMetrics(unittest.TestCase):
+    def test_should_not_instrument_buses_by_default(self) -> None:
+        bus = EventBus("metrics-off")
+        received = []
+        bus.subscribe("ping", received.append)
+        bus.emit("ping")
+        self.assertIsNone(bus.metrics)
+        self.assertEqual({}, bus.snapshot())
+        self.assertEqual(1, len(received))
+
+    def test_should_count_emitted_and_delivered_events(self) -> None:
+        bus = EventBus("metrics-counts", metrics=True)
+        bus.subscribe("order.*", lambda ev: None)
+        bus.subscribe("order.created", lambda ev: None)
+        bus.emit("order.created")
+        bus.emit("order.created")
+        bus.emit("order.paid")
+        bus.emit("nobody.listens")
+        snapshot = bus.snapshot()
+        self.assertEqual({"order.created": 2, "order.paid": 1, "nobody.listens": 1}, snapshot["emitted"])
+        self.assertEqual({"order.created": 4, "order.paid": 1}, snapshot["delivered"])
+        self.assertEqual(4, snapshot["emitted_total"])
+        self.assertEqual(5, snapshot["delivered_total"])
+        self.assertEqual([3, 2], [sub["calls"] for sub in snapshot["subscribers"]])
+
+    def test_should_report_the_slowest_subscribers(self) -> None:
+        bus = EventBus("metrics-slowest")
+        bus.subscribe("work", lambda ev: None)
+        bus.subscribe("work", lambda ev: time.sleep(0.02))
+        bus.enable_metrics()
+        for _ in range(3):
+            bus.emit("work")
+        slowest = bus.snapshot(slowest=1)["slowest"]
+        self.assertEqual(1, len(slowest))
+        self.assertEqual(3, slowest[0]["calls"])
+        self.assertGreaterEqual(slowest[0]["mean_ms"], 20)
+        self.assertGreaterEqual(slowest[0]["p99_ms"], 20)
+
+    def test_should_count_callback_errors(self) -> None:
+        bus = EventBus("metrics-errors", metrics=True)
+        bus.subscribe("fail", lambda ev: 1 / 0)
+        self.assertRaises(HSBaseException, bus.emit, "fail")
+        subscriber = bus.snapshot()["subscribers"][0]
+        self.assertEqual(1, subscriber["calls"])
+        self.assertEqual(1, subscriber["errors"])
+        self.assertEqual({}, bus.snapshot()["delivered"])
+
+    def test_should_count_batched_deliveries_per_event(self) -> None:
+        bus = EventBus("metrics-batch", metrics=True)
+        bus.subscribe("tick", lambda evs: None, batch=3)
+        for _ in range(4):
+            bus.emit("tick")
+        snapshot = bus.snapshot()
+        self.assertEqual(3, snapshot["delivered"]["tick"])
+        self.assertEqual(1, snapshot["subscribers"][0]["calls"])
+        self.assertEqual(1, snapshot["subscribers"][0]["queued"])
+
+    def test_should_report_queue_depth(self) -> None:
+        dispatcher = ThreadPoolDispatcher(max_workers=1)
+        try:
+            bus = EventBus("metrics-queue", dispatcher, metrics=True)
+            release = Signal()
+            bus.subscribe("job", lambda ev: release.wait(3))
+            for _ in range(5):
+                bus.emit("job")
+            snapshot = bus.snapshot()
+            self.assertEqual(5, snapshot["queued"])
+            self.assertGreaterEqual(snapshot["subscribers"][0]["queued"], 4)
+            release.set()
+            bus.flush(3)
+            self.assertEqual(0, bus.snapshot()["queued"])
+            self.assertEqual(5, bus.snapshot()["delivered_total"])
+        finally:
+            dispatcher.shutdown(wait=False)
+
+    def test_should_stop_timing_when_disabled(self) -> None:
+        bus = EventBus("metrics-disable", metrics=True)
+        received = []
+        bus.subscribe("ping", received.append)
+        bus.disable_metrics()
+        bus.emit("ping")
+        self.assertEqual({}, bus.snapshot())
+        metrics = bus.enable_metrics()
+        self.assertIs(metrics, bus.enable_metrics())
+        bus.emit("ping")
+        self.assertEqual(1, bus.snapshot()["subscribers"][0]["calls"])
+        self.assertEqual(2, len(received))
+
+    def test_should_list_the_snapshots_of_instrumented_buses(self) -> None:
+        EventBus.get("metrics-registered").enable_metrics()
+        EventBus.get("metrics-registered").emit("ping")
+        snapshots = EventBus.snapshots()
+        self.assertIn("metrics-registered", snapshots)
+        self.assertEqual(1, snapshots["metrics-registered"]["emitted_total"])
+        EventBus.get("metrics-registered").disable_metrics()
+
+    def test_should_estimate_latency_percentiles(self) -> None:
+        histogram = LatencyHistogram()
+        for _ in range(98):
+            histogram.record(0.00002)
+        histogram.record(0.003)
+        histogram.record(2.0)
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(0.00005, histogram.percentile(0.5))
+        self.assertEqual(0.005, histogram.percentile(0.99))
+        self.assertEqual(2.0, histogram.percentile(1.0))
+        self.assertEqual({"<=0.05ms": 98, "<=5ms": 1, ">1000ms": 1}, histogram.snapshot()["histogram"])
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMetrics)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.eventbus
+      @file: test_topic_matcher.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.modules.eventbus.eventbus import EventBus
+from hspylib.modules.eventbus.topic_matcher import TopicMatcher
+
+import sys
+import unittest
+
+
+class TestTopicMatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.matcher = TopicMatcher()
+
+    def test_should_match_exact_topics(self) -> None:
+        self.matcher.add("door-open", 1)
+        self.matcher.add("kafka.consumer.started", 2)
+        self.assertEqual((1,), self.matcher.match("door-open"))
+        self.assertEqual((2,), self.matcher.match("kafka.consumer.started"))
+        self.assertEqual((), self.matcher.match("kafka.consumer"))
+        self.assertEqual((), self.matcher.match("kafka.consumer.started.now"))
+
+    def test_should_match_one_level_wildcards(self) -> None:
+        self.matcher.add("kafka.consumer.*", 1)
+        self.matcher.add("kafka.*.started", 2)
+        self.assertEqual((1, 2), self.matcher.match("kafka.consumer.started"))
+        self.assertEqual((1,), self.matcher.match("kafka.consumer.stopped"))
+        self.assertEqual((2,), self.matcher.match("kafka.producer.started"))
+        self.assertEqual((), self.matcher.match("kafka.consumer"))
+        self.assertEqual((), self.matcher.match("kafka.consumer.started.now"))
+
+    def test_should_match_any_levels_wildcards(self) -> None:
+        self.matcher.add("ui.#", 1)
+        self.matcher.add("#.closed", 2)
+        self.matcher.add("#", 3)
+        self.assertEqual((1, 3), self.matcher.match("ui"))
+        self.assertEqual((1, 3), self.matcher.match("ui.menu.opened"))
+        self.assertEqual((1, 2, 3), self.matcher.match("ui.menu.closed"))
+        self.assertEqual((2, 3), self.matcher.match("closed"))
+        self.assertEqual((3,), self.matcher.match("kafka"))
+
+    def test_should_match_each_value_once_in_subscription_order(self) -> None:
+        self.matcher.add("a.#.#", "first")
+        self.matcher.add("a.b", "second")
+        self.matcher.add("a.*", "third")
+        self.assertEqual(("first", "second", "third"), self.matcher.match("a.b"))
+
+    def test_should_invalidate_cached_matches(self) -> None:
+        self.matcher.add("kafka.#", 1)
+        self.assertEqual((1,), self.matcher.match("kafka.consumer.started"))
+        self.matcher.add("kafka.consumer.*", 2)
+        self.assertEqual((1, 2), self.matcher.match("kafka.consumer.started"))
+        self.assertTrue(self.matcher.discard("kafka.#", 1))
+        self.assertFalse(self.matcher.discard("kafka.#", 1))
+        self.assertEqual((2,), self.matcher.match("kafka.consumer.started"))
+        self.assertTrue(self.matcher.discard("kafka.consumer.*", 2))
+        self.assertEqual((), self.matcher.match("kafka.consumer.started"))
+        self.assertEqual(0, len(self.matcher))
+        self.assertFalse(self.matcher._root.children, "Empty levels SHOULD be pruned")
+
+    def test_should_reject_empty_patterns(self) -> None:
+        self.assertRaises(InvalidArgumentError, self.matcher.add, "", 1)
+
+    def test_should_scale_with_thousands_of_subscriptions(self) -> None:
+        for i in range(5000):
+            self.matcher.add(f"service-{i}.event.*", i)
+        self.matcher.add("service-42.#", "all")
+        self.assertEqual((42, "all"), self.matcher.match("service-42.event.fired"))
+        self.assertIs(self.matcher.match("service-42.event.fired"), self.matcher.match("service-42.event.fired"))
+
+    def test_should_deliver_wildcard_subscriptions_on_the_bus(self) -> None:
+        bus, received = EventBus("topic-bus"), []
+
+        def _on_consumer(ev) -> None:
+            received.append(("consumer", ev.name))
+
+        def _on_ui(ev) -> None:
+            received.append(("ui", ev.name))
+
+        bus.subscribe("kafka.consumer.*", _on_consumer)
+        bus.subscribe("ui.#", _on_ui)
+        bus.emit("kafka.consumer.started")
+        bus.emit("kafka.producer.started")
+        bus.emit("ui.menu.opened")
+        self.assertEqual([("consumer", "kafka.consumer.started"), ("ui", "ui.menu.opened")], received)
+        self.assertEqual(1, bus.unsubscribe("ui.#", _on_ui))
+        bus.emit("ui.menu.closed")
+        self.assertEqual(2, len(received))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTopicMatcher)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
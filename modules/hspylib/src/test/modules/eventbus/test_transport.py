@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.eventbus
+      @file: test_transport.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+from hspylib.core.exception.exceptions import InvalidStateError
+from hspylib.modules.eventbus.broker import EventBroker
+from hspylib.modules.eventbus.event import Event
+from hspylib.modules.eventbus.eventbus import EventBus
+from hspylib.modules.eventbus.transport import UnixSocketTransport
+from hspylib.modules.eventbus.wire import (
+    bus_names,
+    Codec,
+    decode_events,
+    encode_message,
+    events_frame,
+    frame,
+    FrameType,
+    MAX_FRAME_BYTES,
+    split_frames,
+    subscribe_frame,
+)
+from typing import Callable
+
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+import unittest
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp(prefix="hs-ev")
+        self.path = os.path.join(self.tmp_dir, "bus.sock")
+        self.transports = []
+
+    def tearDown(self) -> None:
+        for transport in reversed(self.transports):
+            transport.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _transport(self, **kwargs) -> UnixSocketTransport:
+        transport = UnixSocketTransport(self.path, reconnect_interval=0.05, **kwargs)
+        self.transports.append(transport)
+        self.assertTrue(transport.wait_connected(3))
+        return transport
+
+    def _linked_buses(self, name: str, **kwargs):
+        """Return two buses of the same name, as if they were in two processes, once events flow between them."""
+        local, remote = EventBus(name, transport=self._transport(**kwargs)), EventBus(name)
+        remote.transport = self._transport(**kwargs)
+        probes = []
+        remote.subscribe("probe", probes.append)
+        self.assertTrue(wait_until(lambda: local.emit("probe") or probes, 3))
+        remote.unsubscribe("probe", probes.append)
+        return local, remote
+
+    def test_should_encode_and_decode_event_frames(self) -> None:
+        messages = [
+            encode_message("bus-a", Event("ev.one", number=1, text="çã", items=[1, 2]), Codec.MARSHAL),
+            encode_message("bus-b", Event("ev.two"), Codec.MARSHAL),
+        ]
+        buffer = bytearray(events_frame(messages, Codec.MARSHAL))
+        buffer += b"\x00\x00"
+        frames = list(split_frames(buffer))
+        self.assertEqual(1, len(frames))
+        self.assertEqual(b"\x00\x00", bytes(buffer))
+        frame_type, payload = frames[0]
+        self.assertEqual(FrameType.EVENTS, frame_type)
+        self.assertEqual({"bus-a", "bus-b"}, bus_names(payload))
+        decoded = list(decode_events(payload))
+        self.assertEqual(["bus-a", "bus-b"], [bus for bus, _, _ in decoded])
+        self.assertEqual(Event("ev.one", number=1, text="çã", items=[1, 2]), decoded[0][1])
+        self.assertEqual(Event("ev.two"), decoded[1][1])
+
+    def test_should_start_a_broker_when_there_is_none(self) -> None:
+        transport = self._transport()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertRaises(InvalidStateError, EventBroker(self.path).start)
+        self._transport(start_broker=False)
+        transport.close()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_should_deliver_events_to_the_buses_of_other_processes(self) -> None:
+        local, remote = self._linked_buses("transport-bus")
+        local_events, remote_events = [], []
+        local.subscribe("order.*", local_events.append)
+        remote.subscribe("order.*", remote_events.append)
+        local.emit("order.created", id=1, items=["a", "b"])
+        local.emit("order.paid", id=1)
+        self.assertTrue(wait_until(lambda: len(remote_events) == 2))
+        self.assertEqual(["order.created", "order.paid"], [ev.name for ev in remote_events])
+        self.assertEqual(["a", "b"], remote_events[0].args["items"])
+        self.assertEqual(2, len(local_events))
+        self.assertIn("latency_ms", remote.transport.stats())
+
+    def test_should_pass_the_same_event_to_local_subscribers(self) -> None:
+        local, _ = self._linked_buses("transport-same")
+        received = []
+        local.subscribe("ping", received.append)
+        local.subscribe("ping", received.append)
+        local.emit("ping", value=1)
+        self.assertEqual(2, len(received))
+        self.assertIs(received[0], received[1])
+
+    def test_should_not_deliver_events_of_unbound_buses(self) -> None:
+        local, remote = self._linked_buses("transport-unbound")
+        other = EventBus("transport-other")
+        remote.transport.bind(other.name, other._deliver_remote)  # pylint: disable=protected-access
+        received = []
+        other.subscribe("ping", received.append)
+        local.emit("ping")
+        remote_received = []
+        remote.subscribe("ping", remote_received.append)
+        local.emit("ping")
+        self.assertTrue(wait_until(lambda: remote_received))
+        self.assertEqual([], received)
+
+    def test_should_batch_events_when_lingering(self) -> None:
+        local, remote = self._linked_buses("transport-batch", linger=0.05)
+        received = []
+        remote.subscribe("tick", received.append)
+        sent_before = local.transport.stats()["frames_sent"]
+        for number in range(500):
+            local.emit("tick", number=number)
+        self.assertTrue(local.transport.flush(3))
+        self.assertTrue(wait_until(lambda: len(received) == 500))
+        self.assertEqual(list(range(500)), [ev.args.number for ev in received])
+        self.assertLess(local.transport.stats()["frames_sent"] - sent_before, 50)
+
+    def test_should_drop_events_that_cannot_be_encoded(self) -> None:
+        local, remote = self._linked_buses("transport-unencodable")
+        local_events, remote_events = [], []
+        local.subscribe("custom", local_events.append)
+        remote.subscribe("custom", remote_events.append)
+        local.emit("custom", value=object())
+        local.emit("custom", value=1)
+        self.assertTrue(wait_until(lambda: remote_events))
+        self.assertEqual(2, len(local_events))
+        self.assertEqual([1], [ev.args.value for ev in remote_events])
+        self.assertEqual(1, local.transport.stats()["unencodable"])
+
+
+    def test_should_split_large_backlogs_into_frames_the_broker_relays(self) -> None:
+        local, remote = self._linked_buses("transport-backlog", linger=0.3)
+        received = []
+        remote.subscribe("blob", received.append)
+        sent_before = local.transport.stats()["frames_sent"]
+        for number in range(10_000):
+            local.emit("blob", number=number, data="x" * 1024)
+        self.assertTrue(local.transport.flush(10))
+        self.assertTrue(wait_until(lambda: len(received) == 10_000, 10))
+        self.assertEqual(list(range(10_000)), [ev.args.number for ev in received])
+        self.assertGreater(local.transport.stats()["frames_sent"] - sent_before, 8)
+        self.assertTrue(local.transport.connected and remote.transport.connected)
+        local.emit("blob", number=-1, data="x" * MAX_FRAME_BYTES)
+        self.assertEqual(1, local.transport.stats()["unencodable"])
+
+    def test_should_disconnect_only_the_peers_sending_malformed_frames(self) -> None:
+        local, remote = self._linked_buses("transport-malformed")
+        for data in (b"\x00\x00\x00\x00\x09", frame(FrameType.EVENTS, b"\x00\x05\x00"), b"\xff" * 16):
+            with self.subTest(data=data), socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as peer:
+                peer.connect(self.path)
+                peer.settimeout(3)
+                peer.sendall(subscribe_frame({"transport-malformed"}) + data)
+                self.assertEqual(b"", peer.recv(1024))
+        received = []
+        remote.subscribe("ping", received.append)
+        local.emit("ping")
+        self.assertTrue(wait_until(lambda: received))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTransport)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_afetch.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.modules.fetch.afetch import afetch, agather, aget, configure_limits, MAX_IN_FLIGHT, MAX_PER_HOST
+from hspylib.modules.fetch.http_response import HttpResponse
+from hspylib.modules.fetch.retry_policy import RetryPolicy
+from requests import exceptions as ex
+from threading import Lock
+from unittest.mock import patch
+
+import asyncio
+import sys
+import time
+import unittest
+
+
+class TestAsyncFetch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.in_flight, self.max_in_flight = 0, 0
+        self.lock = Lock()
+
+    def tearDown(self) -> None:
+        configure_limits(MAX_IN_FLIGHT, MAX_PER_HOST)
+
+    def _slow_request(self, url: str, method: HttpMethod, *_) -> HttpResponse:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return HttpResponse(method, url, HttpCode.OK, body=url)
+
+    def test_should_return_responses_in_order(self) -> None:
+        with patch("hspylib.modules.fetch.afetch._request", side_effect=self._slow_request):
+            urls = [f"localhost:8080/{i}" for i in range(20)]
+            responses = asyncio.run(agather(*[aget(url) for url in urls]))
+        self.assertListEqual(urls, [r.body for r in responses])
+
+    def test_should_cap_requests_in_flight_per_host(self) -> None:
+        configure_limits(max_in_flight=50, max_per_host=3)
+        with patch("hspylib.modules.fetch.afetch._request", side_effect=self._slow_request):
+            asyncio.run(agather(*[aget(f"localhost:8080/{i}") for i in range(30)]))
+        self.assertEqual(3, self.max_in_flight)
+
+    def test_should_cap_requests_in_flight_globally(self) -> None:
+        configure_limits(max_in_flight=4, max_per_host=10)
+        with patch("hspylib.modules.fetch.afetch._request", side_effect=self._slow_request):
+            asyncio.run(agather(*[aget(f"host-{i % 5}:8080/{i}") for i in range(30)]))
+        self.assertEqual(4, self.max_in_flight)
+
+    def test_should_retry_and_return_exceptions_per_request(self) -> None:
+        failure = ex.ConnectionError("Connection refused")
+        policy = RetryPolicy(tries=3, delay=0, jitter=0)
+        with patch("hspylib.modules.fetch.afetch._request", side_effect=failure) as request:
+            result = asyncio.run(agather(afetch("localhost:8080/fail", retry_policy=policy)))
+        self.assertIs(failure, result[0])
+        self.assertEqual(3, request.call_count)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAsyncFetch)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
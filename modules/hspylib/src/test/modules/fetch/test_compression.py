@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_compression.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.core.exception.exceptions import InvalidStateError
+from hspylib.modules.fetch.compression import (
+    accept_encoding,
+    compress_body,
+    COMPRESSION_THRESHOLD,
+    ContentEncoding,
+    reject_compression,
+    TransferStats,
+    zstandard,
+)
+
+import gzip
+import sys
+import unittest
+import urllib3.response
+import zlib
+
+URL = "http://localhost:8080/upload"
+
+
+class TestCompression(unittest.TestCase):
+    def test_should_advertise_the_available_encodings(self) -> None:
+        self.assertIn("gzip", accept_encoding())
+        self.assertIn("deflate", accept_encoding())
+        self.assertEqual(getattr(urllib3.response, "HAS_ZSTD", False), "zstd" in accept_encoding())
+
+    def test_should_compress_requests_with_gzip_unless_specified(self) -> None:
+        self.assertEqual(ContentEncoding.GZIP, ContentEncoding.of_request(True))
+        self.assertEqual(ContentEncoding.ZSTD, ContentEncoding.of_request(ContentEncoding.ZSTD))
+        self.assertIsNone(ContentEncoding.of_request(False))
+        self.assertIsNone(ContentEncoding.of_request(None))
+
+    @unittest.skipIf(zstandard is not None, "The zstandard package is installed")
+    def test_should_not_compress_with_zstd_without_zstandard(self) -> None:
+        self.assertRaises(InvalidStateError, ContentEncoding.ZSTD.compress, b"data")
+
+    def test_should_compress_large_bodies(self) -> None:
+        body = '{"data": "' + "a" * COMPRESSION_THRESHOLD + '"}'
+        data, encoding = compress_body(URL, body, ContentEncoding.GZIP)
+        self.assertEqual(ContentEncoding.GZIP, encoding)
+        self.assertEqual(body, gzip.decompress(data).decode())
+        data, encoding = compress_body(URL, body.encode(), ContentEncoding.DEFLATE)
+        self.assertEqual(ContentEncoding.DEFLATE, encoding)
+        self.assertEqual(body, zlib.decompress(data).decode())
+
+    def test_should_not_compress_small_or_non_text_bodies(self) -> None:
+        self.assertEqual(("{}", None), compress_body(URL, "{}", ContentEncoding.GZIP))
+        form = {"data": "a" * COMPRESSION_THRESHOLD}
+        self.assertEqual((form, None), compress_body(URL, form, ContentEncoding.GZIP))
+        self.assertEqual((None, None), compress_body(URL, None, ContentEncoding.GZIP))
+
+    def test_should_not_compress_for_rejecting_hosts(self) -> None:
+        body = "a" * COMPRESSION_THRESHOLD
+        reject_compression("http://localhost:9191/upload")
+        self.assertEqual((body, None), compress_body("http://localhost:9191/other", body, ContentEncoding.GZIP))
+        self.assertIsNotNone(compress_body(URL, body, ContentEncoding.GZIP)[1])
+
+    def test_should_report_saved_bytes(self) -> None:
+        stats = TransferStats(sent=1000, sent_wire=100, received=500, received_wire=50)
+        self.assertEqual(1350, stats.saved)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCompression)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -17,13 +17,21 @@ from hspylib.core.config.app_config import AppConfigs
 from hspylib.core.decorator.decorators import integration_test
 from hspylib.core.enums.http_code import HttpCode
 from hspylib.core.enums.http_method import HttpMethod
-from hspylib.modules.fetch.fetch import delete, get, head, is_reachable, patch, post, put
+from hspylib.modules.fetch.afetch import agather, aget
+from hspylib.modules.fetch.compression import compress_body, ContentEncoding
+from hspylib.modules.fetch.http_cache import HttpCache
+from hspylib.modules.fetch.fetch import delete, download, fetch, get, head, is_reachable, patch, post, put
+from hspylib.modules.fetch.rate_limiter import rate_limiter
+from hspylib.modules.fetch.session_pool import session_pool
 from mock.mock_server import MockServer
 from requests import ConnectTimeout
 from requests import exceptions as ex
 
+import asyncio
 import os
 import sys
+import tempfile
+import time
 import unittest
 
 TEST_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -40,6 +48,7 @@ class TestFetch(unittest.TestCase):
 
     def tearDown(self):
         self.mock_server.stop()
+        rate_limiter.clear()
 
     def test_should_get_from_server(self):
         expected_code = HttpCode.OK
@@ -105,6 +114,107 @@ class TestFetch(unittest.TestCase):
         self.assertIsNotNone(resp, "Response is none")
         self.assertTrue(resp.body == "", "Response is not empty")
 
+    def test_should_reuse_pooled_connections(self):
+        expected_code = HttpCode.OK
+        self.mock_server.when_request(HttpMethod.GET, "/pooled").then_return(code=expected_code, body="{}")
+        session_pool.close()
+        for _ in range(20):
+            resp = get(f"localhost:{self.mock_server.port}/pooled")
+            self.assertEqual(expected_code, resp.status_code)
+        self.assertEqual(1, self.mock_server.connections)
+
+    def test_should_aget_from_server(self):
+        expected_code = HttpCode.OK
+        expected_resp = '{"name":"Mock Server"}'
+        self.mock_server.when_request(HttpMethod.GET, "/aget").then_return(code=expected_code, body=expected_resp)
+        url = f"localhost:{self.mock_server.port}/aget"
+        responses = asyncio.run(agather(*[aget(url) for _ in range(10)], return_exceptions=False))
+        self.assertEqual(10, len(responses))
+        self.assertTrue(all(r.status_code == expected_code and r.body == expected_resp for r in responses))
+
+    def test_should_stream_from_server(self):
+        expected_code = HttpCode.OK
+        expected_lines = [f'{{"line": {i}}}' for i in range(1000)]
+        body = "\n".join(expected_lines)
+        self.mock_server.when_request(HttpMethod.GET, "/stream").then_return(code=expected_code, body=body)
+        with fetch(f"localhost:{self.mock_server.port}/stream", stream=True) as resp:
+            self.assertEqual(expected_code, resp.status_code)
+            self.assertIsNone(resp.body)
+            self.assertEqual(len(body), resp.content_length)
+            self.assertListEqual(expected_lines, list(resp.iter_lines(chunk_size=100)))
+
+    def test_should_download_to_file(self):
+        expected_code = HttpCode.OK
+        body = "0123456789" * 10000
+        self.mock_server.when_request(HttpMethod.GET, "/download").then_return(code=expected_code, body=body)
+        progress = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dest_path = f"{tmp_dir}/download.json"
+            downloaded = download(
+                f"localhost:{self.mock_server.port}/download",
+                dest_path,
+                chunk_size=4096,
+                cb_progress=lambda done, total: progress.append((done, total)),
+            )
+            self.assertEqual(len(body), downloaded)
+            with open(dest_path, encoding="utf-8") as f_dest:
+                self.assertEqual(body, f_dest.read())
+            self.assertFalse(os.path.exists(f"{dest_path}.part"))
+        self.assertEqual(25, len(progress))
+        self.assertEqual((len(body), len(body)), progress[-1])
+
+    def test_should_get_from_cache(self):
+        expected_code = HttpCode.OK
+        expected_resp = '{"name":"Mock Server"}'
+        headers = {"ETag": '"12345678"', "Cache-Control": "max-age=60"}
+        self.mock_server.when_request(HttpMethod.GET, "/cached").then_return(expected_code, expected_resp, headers)
+        cache = HttpCache()
+        for _ in range(3):
+            resp = get(f"localhost:{self.mock_server.port}/cached", cache=cache)
+            self.assertEqual(expected_code, resp.status_code)
+            self.assertEqual(expected_resp, resp.body)
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_should_shape_requests_to_the_rate_limit(self):
+        expected_code = HttpCode.OK
+        self.mock_server.when_request(HttpMethod.GET, "/limited").then_return(code=expected_code, body="{}")
+        rate_limiter.limit(f"localhost:{self.mock_server.port}/limited", rate=20, burst=2)
+        started = time.monotonic()
+        for _ in range(6):
+            self.assertEqual(expected_code, get(f"localhost:{self.mock_server.port}/limited").status_code)
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+
+    def test_should_honor_retry_after(self):
+        headers = {"Retry-After": "1"}
+        self.mock_server.when_request(HttpMethod.GET, "/throttled").then_return(HttpCode.TOO_MANY_REQUESTS, "", headers)
+        self.assertEqual(HttpCode.TOO_MANY_REQUESTS, get(f"localhost:{self.mock_server.port}/throttled").status_code)
+        started = time.monotonic()
+        get(f"localhost:{self.mock_server.port}/throttled")
+        self.assertGreaterEqual(time.monotonic() - started, 0.9)
+
+    def test_should_count_transferred_bytes(self):
+        expected_code = HttpCode.OK
+        body = "0123456789" * 1000
+        self.mock_server.when_request(HttpMethod.GET, "/counted").then_return(code=expected_code, body=body)
+        resp = get(f"localhost:{self.mock_server.port}/counted")
+        self.assertEqual(len(body), resp.transfer.received)
+        self.assertEqual(len(body), resp.transfer.received_wire)
+        with fetch(f"localhost:{self.mock_server.port}/counted", stream=True) as resp:
+            self.assertEqual(0, resp.transfer.received)
+            self.assertEqual(body, "".join(resp.iter_lines()))
+            self.assertEqual(len(body), resp.transfer.received)
+
+    def test_should_send_uncompressed_when_compression_is_rejected(self):
+        expected_code = HttpCode.UNSUPPORTED_MEDIA_TYPE
+        body = '{"name":"Mock Server"}' * 100
+        url = f"localhost:{self.mock_server.port}/compressed"
+        self.mock_server.when_request(HttpMethod.POST, "/compressed").then_return(code=expected_code)
+        resp = post(url, body, compress=ContentEncoding.GZIP)
+        self.assertEqual(expected_code, resp.status_code)
+        self.assertEqual(len(body), resp.transfer.sent_wire)
+        self.assertIsNone(compress_body(f"http://{url}", body, ContentEncoding.GZIP)[1])
+
     def test_should_except_when_read_timeout_expires(self):
         self.assertRaisesRegex(ex.ConnectTimeout, r".*\(connect timeout=1\).*", lambda: get("240.0.0.0", timeout=1))
 
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_fetch_many.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.modules.fetch.fetch import fetch_many, FetchSpec
+from hspylib.modules.fetch.http_response import HttpResponse
+from requests import exceptions as ex
+from threading import Lock
+from unittest.mock import patch
+
+import sys
+import time
+import unittest
+
+
+class TestFetchMany(unittest.TestCase):
+    def setUp(self) -> None:
+        self.in_flight, self.max_in_flight = 0, 0
+        self.lock = Lock()
+
+    def _fake_fetch(self, url: str, method: HttpMethod, headers, body, *_) -> HttpResponse:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later requests complete first
+        time.sleep(0.05 / (1 + int(url.rsplit("/", 1)[-1])))
+        with self.lock:
+            self.in_flight -= 1
+        if url.endswith("/3"):
+            raise ex.ConnectionError("Connection refused")
+        return HttpResponse(method, url, HttpCode.OK, body=body)
+
+    def test_should_yield_results_in_input_order(self) -> None:
+        specs = [("put", f"localhost:8080/{i}", None, f"body-{i}") for i in range(10)]
+        with patch("hspylib.modules.fetch.fetch.fetch", side_effect=self._fake_fetch):
+            results = list(fetch_many(specs, max_workers=4))
+        self.assertListEqual(list(range(10)), [r.index for r in results])
+        self.assertEqual(HttpMethod.PUT, results[0].spec.method)
+        self.assertEqual("body-0", results[0].get().body)
+        self.assertLessEqual(self.max_in_flight, 4)
+
+    def test_should_yield_results_as_they_complete(self) -> None:
+        specs = [FetchSpec(HttpMethod.GET, f"localhost:8080/{i}") for i in range(8)]
+        with patch("hspylib.modules.fetch.fetch.fetch", side_effect=self._fake_fetch):
+            results = list(fetch_many(specs, max_workers=8, ordered=False))
+        self.assertEqual(8, len(results))
+        self.assertNotEqual(list(range(8)), [r.index for r in results])
+
+    def test_should_report_failures_per_item(self) -> None:
+        specs = [(HttpMethod.GET, f"localhost:8080/{i}") for i in range(6)]
+        with patch("hspylib.modules.fetch.fetch.fetch", side_effect=self._fake_fetch):
+            results = list(fetch_many(specs))
+        self.assertEqual(6, len(results))
+        self.assertListEqual([True, True, True, False, True, True], [r.ok for r in results])
+        self.assertRaises(ex.ConnectionError, results[3].get)
+
+    def test_should_not_accept_invalid_max_workers(self) -> None:
+        self.assertRaises(InvalidArgumentError, lambda: list(fetch_many([], max_workers=0)))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestFetchMany)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
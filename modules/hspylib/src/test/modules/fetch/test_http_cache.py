@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_http_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.modules.fetch.http_cache import HttpCache
+from hspylib.modules.fetch.http_response import HttpResponse
+from requests.structures import CaseInsensitiveDict
+from typing import Dict, List
+
+import sys
+import tempfile
+import unittest
+
+URL = "http://localhost:8080/resource"
+
+
+class FakeServer:
+    """Answer 304 whenever the request validators match the current resource version."""
+
+    def __init__(self, headers: Dict[str, str]) -> None:
+        self.headers = headers
+        self.version = 1
+        self.received: List[Dict[str, str]] = []
+
+    def request(self, validators: Dict[str, str]) -> HttpResponse:
+        self.received.append(validators)
+        etag = f'"v{self.version}"'
+        if validators.get("If-None-Match") == etag:
+            return HttpResponse(HttpMethod.GET, URL, HttpCode.NOT_MODIFIED, CaseInsensitiveDict(self.headers))
+        headers = CaseInsensitiveDict({**self.headers, "ETag": etag})
+        return HttpResponse(HttpMethod.GET, URL, HttpCode.OK, headers, f"version-{self.version}")
+
+
+class TestHttpCache(unittest.TestCase):
+    def test_should_serve_fresh_entries_without_requesting(self) -> None:
+        cache, server = HttpCache(), FakeServer({"Cache-Control": "public, max-age=60"})
+        bodies = [cache.get(URL, server.request).body for _ in range(5)]
+        self.assertListEqual(["version-1"] * 5, bodies)
+        self.assertEqual(1, len(server.received))
+        self.assertEqual({"hits": 4, "misses": 1, "revalidated": 0, "evictions": 0}, cache.stats())
+
+    def test_should_revalidate_stale_entries(self) -> None:
+        cache, server = HttpCache(), FakeServer({"Cache-Control": "no-cache"})
+        self.assertEqual("version-1", cache.get(URL, server.request).body)
+        self.assertEqual("version-1", cache.get(URL, server.request).body)
+        self.assertEqual({"If-None-Match": '"v1"'}, server.received[-1])
+        server.version = 2
+        self.assertEqual("version-2", cache.get(URL, server.request).body)
+        self.assertEqual(1, cache.revalidated)
+        self.assertEqual(2, cache.misses)
+
+    def test_should_not_store_uncacheable_responses(self) -> None:
+        cache = HttpCache()
+        headers = CaseInsensitiveDict({"Cache-Control": "no-store", "ETag": '"v1"'})
+        self.assertFalse(cache.put(URL, HttpResponse(HttpMethod.GET, URL, HttpCode.OK, headers, "body")))
+        self.assertFalse(cache.put(URL, HttpResponse(HttpMethod.GET, URL, HttpCode.OK, CaseInsensitiveDict(), "body")))
+        self.assertNotIn(URL, cache)
+
+    def test_should_not_cache_credentials_nor_private_responses(self) -> None:
+        cache, server = HttpCache(), FakeServer({"Cache-Control": "max-age=60"})
+        cache.get(URL, server.request, {"Authorization": "Bearer alice"})
+        self.assertNotIn(URL, cache)
+        cache.get(URL, server.request)
+        self.assertEqual("version-1", cache.get(URL, server.request, {"Authorization": "Bearer bob"}).body)
+        self.assertEqual(3, len(server.received), "Requests carrying credentials must not be served from the cache")
+        headers = CaseInsensitiveDict({"Cache-Control": "private, max-age=60"})
+        self.assertFalse(cache.put(f"{URL}/private", HttpResponse(HttpMethod.GET, URL, HttpCode.OK, headers, "b")))
+
+    def test_should_select_entries_by_the_vary_headers(self) -> None:
+        cache, server = HttpCache(), FakeServer({"Cache-Control": "max-age=60", "Vary": "Accept-Language"})
+        cache.get(URL, server.request, {"Accept-Language": "en", "X-Trace": "1"})
+        cache.get(URL, server.request, {"accept-language": "en", "X-Trace": "2"})
+        self.assertEqual(1, len(server.received))
+        cache.get(URL, server.request, {"Accept-Language": "pt"})
+        cache.get(URL, server.request)
+        self.assertEqual(3, len(server.received))
+        headers = CaseInsensitiveDict({"Cache-Control": "max-age=60", "Vary": "*"})
+        self.assertFalse(cache.put(f"{URL}/any", HttpResponse(HttpMethod.GET, URL, HttpCode.OK, headers, "b")))
+
+    def test_should_evict_least_recently_used_entries(self) -> None:
+        cache, server = HttpCache(max_entries=2), FakeServer({"Cache-Control": "max-age=60"})
+        for url in [f"{URL}/1", f"{URL}/2", f"{URL}/1", f"{URL}/3"]:
+            cache.get(url, server.request)
+        self.assertIn(f"{URL}/1", cache)
+        self.assertNotIn(f"{URL}/2", cache)
+        self.assertEqual(1, cache.evictions)
+
+    def test_should_survive_restarts_when_stored_on_disk(self) -> None:
+        server = FakeServer({"Cache-Control": "max-age=60"})
+        with tempfile.TemporaryDirectory() as cache_dir:
+            HttpCache(cache_dir=cache_dir).get(URL, server.request)
+            cache = HttpCache(cache_dir=cache_dir)
+            self.assertEqual("version-1", cache.get(URL, server.request).body)
+            self.assertEqual(1, len(server.received))
+            server.headers["Vary"] = "Accept"
+            HttpCache(cache_dir=cache_dir).get(f"{URL}/vary", server.request, {"Accept": "text/plain"})
+            cache = HttpCache(cache_dir=cache_dir)
+            cache.get(f"{URL}/vary", server.request, {"Accept": "text/plain"})
+            cache.get(f"{URL}/vary", server.request, {"Accept": "application/json"})
+            self.assertEqual(3, len(server.received))
+            cache.clear()
+            self.assertNotIn(URL, cache)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestHttpCache)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_http_stream_response.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.core.exception.exceptions import InvalidStateError
+from hspylib.modules.fetch.http_stream_response import HttpStreamResponse
+from requests.models import CaseInsensitiveDict, Response
+
+import io
+import sys
+import unittest
+
+
+def stream_response(content: bytes) -> HttpStreamResponse:
+    response = Response()
+    response.raw = io.BytesIO(content)
+    headers = CaseInsensitiveDict({"Content-Length": str(len(content))})
+    return HttpStreamResponse(response, HttpMethod.GET, "http://localhost/stream", HttpCode.OK, headers)
+
+
+class TestHttpStreamResponse(unittest.TestCase):
+    def test_should_iterate_over_bounded_chunks(self) -> None:
+        content = bytes(range(256)) * 40
+        resp = stream_response(content)
+        chunks = list(resp.iter_bytes(1000))
+        self.assertEqual(len(content), resp.content_length)
+        self.assertTrue(all(len(c) <= 1000 for c in chunks))
+        self.assertEqual(content, b"".join(chunks))
+        self.assertIsNone(resp.body)
+
+    def test_should_iterate_over_lines_split_across_chunks(self) -> None:
+        resp = stream_response(b"first line\r\nsecond line\n\nlast line")
+        self.assertListEqual(["first line", "second line", "", "last line"], list(resp.iter_lines(3)))
+
+    def test_should_not_consume_the_body_twice(self) -> None:
+        with stream_response(b"body") as resp:
+            list(resp.iter_bytes())
+            self.assertTrue(resp.consumed)
+            self.assertRaises(InvalidStateError, lambda: list(resp.iter_bytes()))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestHttpStreamResponse)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_probe.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.modules.fetch.fetch import is_reachable, probe
+from requests import exceptions as ex
+from unittest.mock import MagicMock, patch
+
+import sys
+import time
+import unittest
+
+
+def _fake_options(method: str, url: str, **_) -> MagicMock:
+    time.sleep(0.2)
+    if "down" in url:
+        raise ex.ConnectionError(f"Unable to connect to {url}")
+    return MagicMock(status_code=204)
+
+
+@patch("hspylib.modules.fetch.fetch.session_pool.request", side_effect=_fake_options)
+class TestProbe(unittest.TestCase):
+    def test_should_probe_all_urls_in_parallel(self, request) -> None:
+        urls = [f"up-{i}:8080" for i in range(6)] + ["down:8080"]
+        started = time.monotonic()
+        results = probe(urls)
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(7, request.call_count)
+        self.assertListEqual([f"http://{u}" for u in urls], [r.url for r in results])
+        self.assertListEqual([True] * 6 + [False], [r.reachable for r in results])
+        self.assertEqual(204, results[0].status_code)
+        self.assertIsInstance(results[-1].error, ex.ConnectionError)
+        self.assertTrue(all(r.latency >= 0.2 for r in results))
+
+    def test_should_reuse_fresh_probes(self, request) -> None:
+        first = probe("cached:8080")
+        self.assertEqual(first, probe("cached:8080", max_age=60))
+        self.assertEqual(1, request.call_count)
+        self.assertNotEqual(first, probe("cached:8080"))
+        self.assertEqual(2, request.call_count)
+
+    def test_should_fail_fast_when_not_reachable(self, _) -> None:
+        probe("down-first:8080")
+        self.assertFalse(is_reachable(("down-first:8080", "up-again:8080"), max_age=60))
+        self.assertTrue(is_reachable(("up-1:8080", "up-2:8080")))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestProbe)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
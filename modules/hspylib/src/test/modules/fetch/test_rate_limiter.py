@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_rate_limiter.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from email.utils import formatdate
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.modules.fetch.http_response import HttpResponse
+from hspylib.modules.fetch.rate_limiter import rate_limiter, RateLimiter, TokenBucket
+from requests.structures import CaseInsensitiveDict
+
+import sys
+import time
+import unittest
+
+URL = "http://localhost:8080/api/resource"
+
+
+class TestRateLimiter(unittest.TestCase):
+    def tearDown(self) -> None:
+        rate_limiter.clear()
+
+    def test_should_allow_bursts_then_space_requests(self) -> None:
+        bucket = TokenBucket(rate=10, burst=3)
+        delays = [bucket.reserve() for _ in range(5)]
+        self.assertListEqual([0.0, 0.0, 0.0], delays[:3])
+        self.assertAlmostEqual(0.1, delays[3], delta=0.01)
+        self.assertAlmostEqual(0.2, delays[4], delta=0.01)
+
+    def test_should_resume_held_requests_at_the_bucket_rate(self) -> None:
+        bucket = TokenBucket(rate=10, burst=3)
+        bucket.block(1)
+        self.assertAlmostEqual(1.0, bucket.reserve(), delta=0.01)
+        self.assertAlmostEqual(1.1, bucket.reserve(), delta=0.01)
+        self.assertEqual(1, bucket.throttled)
+
+    def test_should_match_the_longest_prefix(self) -> None:
+        host = rate_limiter.limit("localhost:8080", rate=100)
+        api = rate_limiter.limit("https://localhost:8080/api", rate=10)
+        self.assertIs(api, rate_limiter.bucket(URL))
+        self.assertIs(host, rate_limiter.bucket("https://localhost:8080/other"))
+        self.assertIsNone(rate_limiter.bucket("http://localhost:9090/api"))
+        rate_limiter.unlimit("localhost:8080/api")
+        self.assertIs(host, rate_limiter.bucket(URL))
+
+    def test_should_match_prefixes_at_url_boundaries(self) -> None:
+        local = rate_limiter.limit("http://localhost:80", rate=100)
+        github = rate_limiter.limit("api.github.com", rate=10)
+        self.assertIs(local, rate_limiter.bucket("http://localhost:80"))
+        self.assertIs(local, rate_limiter.bucket("http://localhost:80/path?query#fragment"))
+        self.assertIsNone(rate_limiter.bucket("http://localhost:8080/path"))
+        self.assertIs(github, rate_limiter.bucket("https://api.github.com?page=2"))
+        self.assertIsNone(rate_limiter.bucket("https://api.github.com.evil.com/repos"))
+        repos = rate_limiter.limit("api.github.com/repos/", rate=1)
+        self.assertIs(repos, rate_limiter.bucket("https://api.github.com/repos/hspylib"))
+        self.assertIs(github, rate_limiter.bucket("https://api.github.com/repository"))
+
+    def test_should_hold_the_host_on_retry_after(self) -> None:
+        headers = CaseInsensitiveDict({"Retry-After": "2"})
+        rate_limiter.observe(URL, HttpResponse(HttpMethod.GET, URL, HttpCode.TOO_MANY_REQUESTS, headers))
+        self.assertAlmostEqual(2.0, rate_limiter.reserve("http://localhost:8080/other"), delta=0.05)
+        self.assertEqual(0.0, rate_limiter.reserve("http://localhost:9090/other"))
+
+    def test_should_ignore_retry_after_of_other_codes(self) -> None:
+        headers = CaseInsensitiveDict({"Retry-After": "2"})
+        rate_limiter.observe(URL, HttpResponse(HttpMethod.GET, URL, HttpCode.OK, headers))
+        self.assertEqual(0.0, rate_limiter.reserve(URL))
+
+    def test_should_parse_retry_after(self) -> None:
+        self.assertEqual(5.0, RateLimiter.retry_after("5"))
+        self.assertEqual(0.0, RateLimiter.retry_after("-5"))
+        self.assertEqual(RateLimiter.MAX_RETRY_AFTER, RateLimiter.retry_after("86400"))
+        self.assertAlmostEqual(30.0, RateLimiter.retry_after(formatdate(time.time() + 30, usegmt=True)), delta=1.5)
+        self.assertIsNone(RateLimiter.retry_after("soon"))
+        self.assertIsNone(RateLimiter.retry_after(None))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestRateLimiter)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
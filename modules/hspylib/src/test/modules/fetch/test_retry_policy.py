@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_retry_policy.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.core.enums.http_code import HttpCode
+from hspylib.core.enums.http_method import HttpMethod
+from hspylib.modules.fetch.http_response import HttpResponse
+from hspylib.modules.fetch.retry_policy import CircuitBreaker, CircuitOpenError, CircuitState, RetryBudget, RetryPolicy
+from requests import exceptions as ex
+from time import sleep
+from unittest.mock import MagicMock
+
+import asyncio
+import sys
+import unittest
+
+URL = "http://localhost:8080/resource"
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_open_and_half_open_the_circuit(self) -> None:
+        breaker = CircuitBreaker("localhost", failure_threshold=2, reset_timeout=0.1)
+        breaker.record_failure()
+        self.assertEqual(CircuitState.CLOSED, breaker.state)
+        breaker.record_failure()
+        self.assertEqual(CircuitState.OPEN, breaker.state)
+        self.assertFalse(breaker.allow_request())
+        sleep(0.15)
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.state)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request(), "Only one probe is allowed while half-open")
+        breaker.record_failure()
+        self.assertEqual(CircuitState.OPEN, breaker.state)
+        sleep(0.15)
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(CircuitState.CLOSED, breaker.state)
+
+    def test_should_limit_retries_by_budget(self) -> None:
+        budget = RetryBudget(capacity=2, refill_rate=0)
+        self.assertTrue(budget.try_acquire())
+        self.assertTrue(budget.try_acquire())
+        self.assertFalse(budget.try_acquire())
+
+    def test_should_retry_retryable_errors(self) -> None:
+        response = HttpResponse(HttpMethod.GET, URL, HttpCode.OK)
+        do_request = MagicMock(side_effect=[ex.ConnectTimeout("timeout"), ex.ConnectionError("refused"), response])
+        policy = RetryPolicy(tries=3, delay=0, jitter=0)
+        self.assertIs(response, policy.call(URL, do_request))
+        self.assertEqual(3, do_request.call_count)
+        self.assertEqual(CircuitState.CLOSED, policy.breaker(URL).state)
+
+    def test_should_not_retry_other_errors(self) -> None:
+        do_request = MagicMock(side_effect=ValueError("not retryable"))
+        policy = RetryPolicy(tries=3, delay=0, jitter=0)
+        self.assertRaises(ValueError, lambda: policy.call(URL, do_request))
+        self.assertEqual(1, do_request.call_count)
+
+    def test_should_fail_fast_while_the_circuit_is_open(self) -> None:
+        do_request = MagicMock(side_effect=ex.ConnectionError("refused"))
+        policy = RetryPolicy(tries=10, delay=0, jitter=0, failure_threshold=3, reset_timeout=60)
+        self.assertRaises(CircuitOpenError, lambda: policy.call(URL, do_request))
+        self.assertEqual(3, do_request.call_count)
+        self.assertRaises(CircuitOpenError, lambda: policy.call(f"{URL}/other", do_request))
+        self.assertEqual(3, do_request.call_count)
+        tripped = policy.tripped()
+        self.assertListEqual(["http://localhost:8080"], list(tripped.keys()))
+        self.assertEqual("open", tripped["http://localhost:8080"]["state"])
+        self.assertEqual(2, tripped["http://localhost:8080"]["rejected"])
+
+    def test_should_return_server_errors_without_tripping_by_default(self) -> None:
+        response = HttpResponse(HttpMethod.GET, URL, HttpCode.SERVICE_UNAVAILABLE)
+        policy = RetryPolicy(failure_threshold=2)
+        for _ in range(3):
+            self.assertIs(response, policy.call(URL, lambda: response))
+        self.assertEqual(CircuitState.CLOSED, policy.breaker(URL).state)
+
+    def test_should_trip_on_server_errors_without_retrying(self) -> None:
+        response = HttpResponse(HttpMethod.GET, URL, HttpCode.SERVICE_UNAVAILABLE)
+        policy = RetryPolicy(failure_threshold=2, trip_on_server_errors=True)
+        self.assertIs(response, policy.call(URL, lambda: response))
+        self.assertIs(response, policy.call(URL, lambda: response))
+        self.assertEqual(CircuitState.OPEN, policy.breaker(URL).state)
+
+    def test_should_stop_retrying_when_budget_is_exhausted(self) -> None:
+        do_request = MagicMock(side_effect=ex.ConnectionError("refused"))
+        policy = RetryPolicy(tries=5, delay=0, jitter=0, budget=RetryBudget(capacity=1, refill_rate=0))
+        self.assertRaises(ex.ConnectionError, lambda: policy.call(URL, do_request))
+        self.assertEqual(2, do_request.call_count)
+
+    def test_should_retry_coroutines(self) -> None:
+        response = HttpResponse(HttpMethod.GET, URL, HttpCode.OK)
+        attempts = [ex.ReadTimeout("timeout"), response]
+
+        async def do_request() -> HttpResponse:
+            if isinstance(outcome := attempts.pop(0), Exception):
+                raise outcome
+            return outcome
+
+        policy = RetryPolicy(tries=2, delay=0, jitter=0)
+        self.assertIs(response, asyncio.run(policy.acall(URL, do_request)))
+
+
+    def test_should_release_the_half_open_probe_when_cancelled(self) -> None:
+        response = HttpResponse(HttpMethod.GET, URL, HttpCode.OK)
+        policy = RetryPolicy(tries=1, failure_threshold=1, reset_timeout=0.1)
+        self.assertRaises(ex.ConnectionError, lambda: policy.call(URL, MagicMock(side_effect=ex.ConnectionError())))
+        sleep(0.15)
+
+        async def _probe_timing_out() -> None:
+            await asyncio.wait_for(policy.acall(URL, lambda: asyncio.sleep(10)), timeout=0.05)
+
+        self.assertRaises(asyncio.TimeoutError, asyncio.run, _probe_timing_out())
+        self.assertEqual(CircuitState.HALF_OPEN, policy.breaker(URL).state)
+        self.assertRaises(KeyboardInterrupt, lambda: policy.call(URL, MagicMock(side_effect=KeyboardInterrupt)))
+        self.assertIs(response, policy.call(URL, lambda: response))
+        self.assertEqual(CircuitState.CLOSED, policy.breaker(URL).state)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestRetryPolicy)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib
+   test.modules.fetch
+      @file: test_session_pool.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/hspylib
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright·(c)·2024,·HSPyLib
+"""
+
+from hspylib.core.exception.exceptions import InvalidArgumentError
+from hspylib.modules.fetch.session_pool import PoolKey, session_pool, SessionPool
+
+import sys
+import unittest
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self) -> None:
+        session_pool.configure(SessionPool.DEFAULT_POOL_SIZE, SessionPool.DEFAULT_IDLE_TIMEOUT)
+
+    def tearDown(self) -> None:
+        session_pool.configure(SessionPool.DEFAULT_POOL_SIZE, SessionPool.DEFAULT_IDLE_TIMEOUT)
+
+    def test_should_create_pool_keys_with_default_ports(self) -> None:
+        self.assertEqual(PoolKey("http", "example.com", 80), PoolKey.of("http://example.com/path"))
+        self.assertEqual(PoolKey("https", "example.com", 443), PoolKey.of("https://Example.com"))
+        self.assertEqual(PoolKey("http", "localhost", 8080), PoolKey.of("http://localhost:8080/a?b=c"))
+
+    def test_should_share_one_session_per_host(self) -> None:
+        with session_pool.lease("http://localhost:8080/one") as s1:
+            with session_pool.lease("http://localhost:8080/two") as s2:
+                self.assertIs(s1, s2)
+            with session_pool.lease("https://localhost:8080/one") as s3:
+                self.assertIsNot(s1, s3)
+        self.assertEqual(2, len(session_pool))
+
+    def test_should_evict_idle_sessions_only_when_not_leased(self) -> None:
+        session_pool.configure(idle_timeout=0)
+        with session_pool.lease("http://localhost:8080") as s1:
+            with session_pool.lease("http://localhost:9090"):
+                pass
+            with session_pool.lease("http://localhost:8080") as s2:
+                self.assertIs(s1, s2)
+        with session_pool.lease("http://localhost:7070"):
+            self.assertEqual(1, len(session_pool))
+
+    def test_should_not_accept_invalid_settings(self) -> None:
+        self.assertRaises(InvalidArgumentError, lambda: session_pool.configure(pool_size=0))
+        self.assertRaises(InvalidArgumentError, lambda: session_pool.configure(idle_timeout=-1))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSessionPool)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
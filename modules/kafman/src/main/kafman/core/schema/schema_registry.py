@@ -16,12 +16,12 @@ Copyright·(c)·2024,·HSPyLib
 from hspylib.core.enums.http_code import HttpCode
 from hspylib.core.enums.http_method import HttpMethod
 from hspylib.core.preconditions import check_not_none, check_state
-from hspylib.modules.fetch.fetch import fetch, is_reachable
+from hspylib.modules.fetch.fetch import fetch, fetch_many, FetchSpec, is_reachable
 from hspylib.modules.fetch.http_response import HttpResponse
 from kafman.core.exception.exceptions import SchemaRegistryError
 from kafman.core.schema.registry_subject import RegistrySubject
 from requests import exceptions as ex
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import json
 import logging as log
@@ -30,6 +30,9 @@ import logging as log
 class SchemaRegistry:
     """This class is used to manage and hold information about the schema registry server"""
 
+    # Seconds a registry url reachability check is reused, instead of probing the server again.
+    REACHABLE_TTL: float = 5
+
     def __init__(self, url: Optional[str] = None):
         self._url = url or "localhost:8081"
         self._valid = False
@@ -47,7 +50,7 @@ class SchemaRegistry:
     def set_url(self, url: str, validate_url: bool = True) -> bool:
         """Set the schema registry url"""
         self._url = url
-        if validate_url and is_reachable(url):
+        if validate_url and is_reachable(url, max_age=self.REACHABLE_TTL):
             self._valid = True
         else:
             self._valid = False
@@ -111,34 +114,34 @@ class SchemaRegistry:
         """Fetch information about the schema registry existing subjects"""
         subjects = []
         if self._subjects:
-            # Loop through recorded subjects
-            for subject_name in self._subjects:
-                # Fetch all subject versions
-                response = self._make_request(
-                    url=f"{self._url}/subjects/{subject_name}/versions"
-                )
+            # Fetch all versions of all recorded subjects
+            responses = self._make_requests(
+                [f"{self._url}/subjects/{subject_name}/versions" for subject_name in self._subjects]
+            )
+            version_urls = []
+            for subject_name, response in zip(self._subjects, responses):
                 all_versions = json.loads(response.body or "[]")
                 check_state(isinstance(all_versions, list))
-                for v in all_versions:
-                    # Fetch information about the subject version
-                    subject_response = self._make_request(
-                        url=f"{self._url}/subjects/{subject_name}/versions/{v}"
-                    )
-                    check_not_none(subject_response)
-                    subject = json.loads(subject_response.body or "{}")
-                    subjects.append(
-                        RegistrySubject(
-                            (
-                                subject["schemaType"]
-                                if "schemaType" in subject
-                                else "AVRO"
-                            ),
-                            subject["subject"],
-                            subject["id"],
-                            subject["version"],
-                            json.loads(subject["schema"]),
-                        )
+                version_urls.extend(
+                    f"{self._url}/subjects/{subject_name}/versions/{v}" for v in all_versions
+                )
+            # Fetch information about all subject versions
+            for subject_response in self._make_requests(version_urls):
+                check_not_none(subject_response)
+                subject = json.loads(subject_response.body or "{}")
+                subjects.append(
+                    RegistrySubject(
+                        (
+                            subject["schemaType"]
+                            if "schemaType" in subject
+                            else "AVRO"
+                        ),
+                        subject["subject"],
+                        subject["id"],
+                        subject["version"],
+                        json.loads(subject["schema"]),
                     )
+                )
 
         return subjects
 
@@ -153,30 +156,63 @@ class SchemaRegistry:
         """Make a request from the registry server"""
 
         if self._valid:
-            try:
-                if not expected_codes:
-                    expected_codes = [HttpCode.OK]
-                log.debug(
-                    "Making request to: %s and expecting codes: %s",
-                    url,
-                    str(expected_codes),
-                )
-                response = fetch(url=url, method=method, headers=headers, body=body)
-                check_not_none(response)
-                if response.status_code not in expected_codes:
-                    raise SchemaRegistryError(
-                        f"Request failed. Expecting {str(expected_codes)} but received: {response.status_code}"
-                        + f"\n\t=> {response.body}"
-                    )
-                return response
-            except (
-                ex.ConnectTimeout,
-                ex.ConnectionError,
-                ex.ReadTimeout,
-                ex.InvalidURL,
-            ) as err:
-                raise SchemaRegistryError(
-                    f"Unable to fetch from {self._url}\n => {str(err)}"
-                ) from err
+            expected_codes = expected_codes or [HttpCode.OK]
+            log.debug(
+                "Making request to: %s and expecting codes: %s",
+                url,
+                str(expected_codes),
+            )
+            return self._check_response(
+                lambda: fetch(url=url, method=method, headers=headers, body=body),
+                expected_codes,
+            )
 
         raise SchemaRegistryError(f"Schema registry server {url} is not valid")
+
+    def _make_requests(
+        self,
+        urls: List[str],
+        expected_codes: Optional[List[HttpCode]] = None,
+    ) -> List[HttpResponse]:
+        """Make concurrent GET requests from the registry server. Responses are returned in the urls order"""
+
+        if self._valid:
+            expected_codes = expected_codes or [HttpCode.OK]
+            log.debug(
+                "Making %d requests to: %s and expecting codes: %s",
+                len(urls),
+                self._url,
+                str(expected_codes),
+            )
+            return [
+                self._check_response(result.get, expected_codes)
+                for result in fetch_many([FetchSpec(HttpMethod.GET, url) for url in urls])
+            ]
+
+        raise SchemaRegistryError(f"Schema registry server {self._url} is not valid")
+
+    def _check_response(
+        self,
+        get_response: Callable[[], HttpResponse],
+        expected_codes: List[HttpCode],
+    ) -> HttpResponse:
+        """Get the response of a registry request, failing unless it has one of the expected codes"""
+
+        try:
+            response = get_response()
+        except (
+            ex.ConnectTimeout,
+            ex.ConnectionError,
+            ex.ReadTimeout,
+            ex.InvalidURL,
+        ) as err:
+            raise SchemaRegistryError(
+                f"Unable to fetch from {self._url}\n => {str(err)}"
+            ) from err
+        check_not_none(response)
+        if response.status_code not in expected_codes:
+            raise SchemaRegistryError(
+                f"Request failed. Expecting {str(expected_codes)} but received: {response.status_code}"
+                + f"\n\t=> {response.body}"
+            )
+        return response
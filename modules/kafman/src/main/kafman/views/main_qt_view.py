@@ -622,7 +622,7 @@ class MainQtView(QtView):
             if k in [ConsumerConfig.BOOTSTRAP_SERVERS, ConsumerConfig.GROUP_ID]
         }
         brokers = config[ConsumerConfig.BOOTSTRAP_SERVERS]
-        if not is_reachable(brokers):
+        if not is_reachable([b.strip() for b in brokers.split(",")]):
             self._display_error(
                 f"Unable to connect to kafka brokers: [{brokers}]", pop_warn_box=True
             )
@@ -9,7 +9,9 @@ import json
 import os
 import tempfile
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from threading import Thread
 from types import MethodType, SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -451,29 +453,51 @@ class RuntimeRegressionTest(unittest.TestCase):
         self.assertEqual('{"type":"object"}', body["schema"])
 
     def test_registry_multiple_versions_keep_subject_name_in_url(self) -> None:
-        registry = SchemaRegistry("http://registry:8081")
-        registry._valid = True
-        registry._subjects = ["orders"]
-        urls = []
-
-        def respond(self, url, **kwargs):
-            urls.append(url)
-            if url.endswith("/versions"):
-                return SimpleNamespace(body="[1, 2]")
-            version = int(url.rsplit("/", 1)[-1])
-            body = {
-                "schemaType": "AVRO",
-                "subject": "orders",
-                "id": 1,
-                "version": version,
-                "schema": '{"type":"string"}',
-            }
-            return SimpleNamespace(body=json.dumps(body))
-
-        registry._make_request = MethodType(respond, registry)
-        subjects = registry.fetch_subject_versions()
-        self.assertEqual(2, len(subjects))
-        self.assertTrue(all("/subjects/orders/versions/" in url for url in urls[1:]))
+        paths = []
+
+        class RegistryHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                paths.append(self.path)
+                if self.path.endswith("/versions"):
+                    body = [1, 2]
+                else:
+                    body = {
+                        "schemaType": "AVRO",
+                        "subject": "orders",
+                        "id": 1,
+                        "version": int(self.path.rsplit("/", 1)[-1]),
+                        "schema": '{"type":"string"}',
+                    }
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("localhost", 0), RegistryHandler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            registry = SchemaRegistry(f"http://localhost:{server.server_port}")
+            registry._valid = True
+            registry._subjects = ["orders"]
+            subjects = registry.fetch_subject_versions()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual([1, 2], [subject.version for subject in subjects])
+        self.assertEqual({"orders"}, {subject.subject for subject in subjects})
+        self.assertEqual(
+            [
+                "/subjects/orders/versions",
+                "/subjects/orders/versions/1",
+                "/subjects/orders/versions/2",
+            ],
+            sorted(paths),
+        )
 
     def test_consumer_commits_one_topic_partition(self) -> None:
         worker = ConsumerWorker()
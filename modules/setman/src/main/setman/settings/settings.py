@@ -16,7 +16,6 @@ import csv
 import logging as log
 import os
 import uuid
-from functools import lru_cache
 from typing import Any, List, Optional, Tuple
 
 from datasource.identity import Identity
@@ -24,6 +23,7 @@ from hspylib.core.preconditions import check_argument, check_not_none
 from hspylib.core.tools.commons import dirname, file_is_not_empty, touch_file
 from hspylib.core.tools.text_tools import ensure_endswith
 from hspylib.core.zoned_datetime import now
+from hspylib.modules.cache.cached import cached
 
 from setman.core.setman_enums import SettingsType
 from setman.settings.settings_config import SettingsConfig
@@ -36,6 +36,9 @@ class Settings:
 
     HEADERS = ["uuid", "name", "prefix", "value", "settings type", "modified"]
 
+    # Seconds a looked up setting is cached, so changes made by other processes are eventually seen.
+    CACHE_TTL = 30
+
     def __init__(self, configs: SettingsConfig, frozen: bool = False) -> None:
         self._configs = configs
         self._frozen = frozen
@@ -82,7 +85,7 @@ class Settings:
     def frozen(self, value: bool) -> None:
         self._frozen = value
 
-    @lru_cache(maxsize=500)
+    @cached(ttl=CACHE_TTL, maxsize=500)
     def get(self, name: str) -> Optional[SettingsEntry]:
         """Get setting matching the specified name.
         :param name the settings name to get.
@@ -134,7 +137,9 @@ class Settings:
                 return found
         return None
 
-    @lru_cache(maxsize=500)
+    @cached(
+        ttl=CACHE_TTL, maxsize=500, key=lambda self, name=None, stype=None: (name, stype, self.limit, self.offset)
+    )
     def search(self, name: str | None = None, stype: SettingsType | None = None) -> List[SettingsEntry]:
         """Search all settings matching criteria.
         :param name: The settings name to filter.
@@ -223,6 +228,6 @@ class Settings:
         return os.path.exists(self.configs.database)
 
     def _clear_caches(self) -> None:
-        """Remove all lru_caches."""
-        self.get.cache_clear()
-        self.search.cache_clear()
+        """Remove all cached lookups of this instance."""
+        self.get.clear()
+        self.search.clear()